@@ -1,12 +1,22 @@
+import time
+_started = time.perf_counter()
+
 import tkinter as tk
+from tkinter import messagebox
+from utils.startup_timer import StartupTimer
 from ui.app_window import AppWindow
-from utils.json_handler import initialize_config
+from utils.json_handler import initialize_config, config_problems
 
 if __name__ == "__main__":
-    # Инициализируем конфигурацию из шаблона при запуске
-    initialize_config()
+    timer = StartupTimer(_started)
+    timer.mark("импорт модулей", _started)
+    
+    # Единственная загрузка config.json за время работы (модули при импорте ничего не читают)
+    with timer.phase("загрузка конфигурации"):
+        initialize_config()
     
     # Создаем и запускаем приложение
+    window_started = time.perf_counter()
     root = tk.Tk()
     
     # Устанавливаем размер окна (ширина x высота)
@@ -25,4 +35,15 @@ if __name__ == "__main__":
     root.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
     
     app = AppWindow(root)
+    timer.mark("создание окна", window_started)
+    
+    # Отчет печатается, когда окно отрисовано и главный цикл свободен
+    root.after_idle(lambda: print(timer.report()))
+    
+    # Ошибки config.json показываются после появления окна
+    if config_problems:
+        root.after_idle(lambda: messagebox.showwarning(
+            "Конфигурация",
+            "При загрузке config.json обнаружены ошибки:\n\n" + "\n".join(config_problems)
+        ))
     root.mainloop()
@@ -1,11 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
-import json
 from ui.constants import *
-from ui.sections_ui.section_factory import SectionFactory
-from utils.config_manager import load_config, save_config
+from ui.section_cache import SectionViewCache
+from ui.catalog_loader import start_catalog_loader
+from ui.status_bar import create_status_bar, create_save_indicator, show_save_state, show_status, clear_status
+from ui.config_saver import ConfigSaver
+from ui.config_importer import ConfigImporter
+from ui.autosave import Autosaver
+from ui.widgets.json_tree import JsonTreeView
+from ui.field_binder import flush_all_fields
+from utils.config_manager import serialize_config, write_config_text
+from utils.config_serializer import config_texts
+from utils.atomic_file import write_atomic
 from utils.memory_storage import memory_config
+from utils.config_journal import ConfigJournal
 
 class AppWindow:
     """Класс основного окна приложения"""
@@ -18,8 +27,25 @@ class AppWindow:
             root: Корневой объект tkinter
         """
         self.root = root
+        # Каталог ArkData загружается в фоне, пока строится интерфейс
+        start_catalog_loader(self.root)
+        # Файлы конфигурации записываются в рабочем потоке
+        self.saver = ConfigSaver(self.root)
+        # Импортируемый файл разбирается и проверяется в рабочем потоке
+        self.importer = ConfigImporter(self.root)
         self.setup_ui()
         self.load_config()
+        
+        # Журнал отмены подключается после загрузки, чтобы загрузка не попала в историю
+        self.journal = ConfigJournal(memory_config)
+        self.root.bind_all("<Control-z>", self.undo)
+        self.root.bind_all("<Control-Z>", self.undo)
+        self.root.bind_all("<Control-y>", self.redo)
+        self.root.bind_all("<Control-Y>", self.redo)
+        
+        # Изменения сохраняются в config.json автоматически; при закрытии - сразу
+        self.autosaver = Autosaver(self.root, memory_config, self.saver, on_state=show_save_state)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def setup_ui(self):
         """Настраивает пользовательский интерфейс"""
@@ -94,17 +120,36 @@ class AppWindow:
                                padx=PADDING_MEDIUM, pady=PADDING_SMALL)
         export_button.pack(side=tk.RIGHT, padx=(0, PADDING_SMALL), pady=PADDING_SMALL)
         
+        # Индикатор автосохранения (время и длительность последней записи)
+        save_indicator = create_save_indicator(bottom_panel)
+        save_indicator.pack(side=tk.RIGHT, padx=PADDING_MEDIUM)
+        
+        # Строка состояния (ход заполнения больших таблиц и т.п.)
+        status_label = create_status_bar(bottom_panel)
+        status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=PADDING_MEDIUM)
+        
+        # Построенные разделы сохраняются и при переходе показываются снова
+        self.section_views = SectionViewCache(self.right_panel, memory_config)
+        
         # Сохраняем ссылки на текущий отображаемый раздел
         self.current_section = None
         self.current_section_frame = None
+        self.current_section_name = None
     
     def load_config(self):
-        """Загружает конфигурацию и создает кнопки для разделов"""
-        # Загрузка конфигурации
-        self.config = load_config()
+        """Создает кнопки для разделов загруженной конфигурации"""
+        # Конфигурация уже загружена при запуске (json_handler.initialize_config в main.py)
+        self.config = memory_config
         
         # Создание кнопок для разделов конфигурации
-        for section_name in self.config:
+        self.create_section_buttons(self.config)
+    
+    def create_section_buttons(self, sections):
+        """Пересоздает кнопки разделов конфигурации в левой панели"""
+        for widget in self.scrollable_frame.winfo_children():
+            widget.destroy()
+        
+        for section_name in sections:
             btn = tk.Button(self.scrollable_frame, 
                          text=section_name.replace("_", " "), 
                          bg=BUTTON_BG, fg=LIGHT_TEXT,
@@ -113,32 +158,99 @@ class AppWindow:
                          command=lambda s=section_name: self.show_section(s))
             btn.pack(fill=tk.X, padx=PADDING_SMALL, pady=PADDING_TINY)
     
+    def close_section(self):
+        """Скрывает отображаемый раздел (построенный раздел остается в кэше)"""
+        self.section_views.hide()
+        self.current_section_frame = None
+        self.current_section = None
+        self.current_section_name = None
+    
     def show_section(self, section_name):
         """Отображает содержимое выбранной секции конфигурации"""
-        # Если есть текущая секция, уничтожаем её
-        if self.current_section_frame:
-            self.current_section_frame.destroy()
-        
-        # Создаем новый фрейм для содержимого секции
-        self.current_section_frame = tk.Frame(self.right_panel, bg=DARK_SECONDARY)
-        self.current_section_frame.pack(fill=tk.BOTH, expand=True, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
-        
-        # Получаем данные для выбранной секции из памяти
-        section_data = memory_config.get(section_name, {})
-        
-        # Создаем интерфейс для секции с помощью фабрики
-        self.current_section = SectionFactory.create_section(
-            section_name, 
-            self.current_section_frame, 
-            section_data
-        )
+        self.close_section()
+        self.current_section_name = section_name
+        
+        # Раздел из кэша только показывается; новый или устаревший создается фабрикой
+        self.current_section_frame, self.current_section = self.section_views.show(section_name)
+    
+    def on_close(self):
+        """Сохраняет несохраненные изменения и закрывает окно"""
+        flush_all_fields()
+        # Рабочий поток записи не является демоном и завершит запись после закрытия окна
+        self.autosaver.save_now()
+        self.root.destroy()
+    
+    def undo(self, event=None):
+        """Отменяет последнее изменение конфигурации (Ctrl+Z)"""
+        # Сначала записываем отложенный ввод, чтобы он стал отдельной операцией
+        flush_all_fields()
+        self.refresh_after_history(self.journal.undo())
+        return "break"
+    
+    def redo(self, event=None):
+        """Повторяет отмененное изменение конфигурации (Ctrl+Y)"""
+        flush_all_fields()
+        self.refresh_after_history(self.journal.redo())
+        return "break"
+    
+    def refresh_after_history(self, paths):
+        """
+        Обновляет интерфейс после отмены или повтора
+        
+        Args:
+            paths: Пути измененных значений (None - ничего не изменилось)
+        """
+        if not paths:
+            return
+        
+        # Замена всей конфигурации (импорт) меняет и список разделов
+        if any(len(path) < 2 for path in paths):
+            self.create_section_buttons(memory_config)
+        
+        # Пересоздаем отображаемый раздел, если он затронут
+        section_name = self.current_section_name
+        if section_name is None:
+            return
+        if any(not path or path[0] == section_name for path in paths):
+            # Отображаемый раздел пересоздается (скрытые кэш удаляет сам)
+            self.section_views.invalidate(section_name)
+            if section_name in memory_config:
+                self.show_section(section_name)
+            else:
+                self.close_section()
+                self.section_views.discard(section_name)
     
     def save_config_to_file(self):
-        """Сохраняет конфигурацию в файл"""
-        if save_config():
+        """Сохраняет конфигурацию в файл (запись выполняется в рабочем потоке)"""
+        flush_all_fields()
+        try:
+            # Текст формируется в потоке tkinter, пока конфигурация не меняется
+            chunks, revisions = serialize_config()
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось сохранить конфигурацию: {str(e)}")
+            return
+        
+        show_status(SAVE_TEXT)
+        self.saver.submit(
+            lambda: write_config_text(chunks),
+            lambda error: self.on_config_saved(revisions, error)
+        )
+    
+    def on_config_saved(self, revisions, error):
+        """
+        Обрабатывает завершение записи config.json
+        
+        Args:
+            revisions: Версии разделов на момент формирования текста
+            error: Исключение записи или None
+        """
+        if not self.saver.busy:
+            clear_status()
+        if error is None:
+            memory_config.mark_saved(revisions)
             messagebox.showinfo("Успех", "Конфигурация успешно сохранена")
         else:
-            messagebox.showerror("Ошибка", "Не удалось сохранить конфигурацию")
+            messagebox.showerror("Ошибка", f"Не удалось сохранить конфигурацию: {str(error)}")
     
     def import_config(self):
         """Импортирует конфигурацию из выбранного файла JSON"""
@@ -150,37 +262,45 @@ class AppWindow:
         if not file_path:
             return  # Пользователь отменил выбор файла
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                imported_config = json.load(file)
-            
-            # Обновляем memory_config
-            memory_config.clear()
-            for section, data in imported_config.items():
-                memory_config[section] = data
-            
-            # Пересоздаем UI
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
-                
-            if self.current_section_frame:
-                self.current_section_frame.destroy()
-                self.current_section = None
-                
-            # Создание кнопок для разделов конфигурации
-            for section_name in memory_config:
-                btn = tk.Button(self.scrollable_frame, 
-                             text=section_name.replace("_", " "), 
-                             bg=BUTTON_BG, fg=LIGHT_TEXT,
-                             padx=PADDING_MEDIUM, pady=PADDING_SMALL,
-                             anchor="w", width=25,
-                             command=lambda s=section_name: self.show_section(s))
-                btn.pack(fill=tk.X, padx=PADDING_SMALL, pady=PADDING_TINY)
-            
-            messagebox.showinfo("Успех", f"Конфигурация успешно импортирована из {os.path.basename(file_path)}")
-            
-        except Exception as e:
-            messagebox.showerror("Ошибка", f"Не удалось импортировать конфигурацию: {str(e)}")
+        if self.importer.running:
+            messagebox.showinfo("Информация", "Импорт конфигурации уже выполняется")
+            return
+        
+        # Текущая конфигурация не меняется, пока весь файл не прочитан и не проверен
+        show_status(IMPORT_TEXT.format(percent=0, section=""))
+        self.importer.start(
+            file_path,
+            on_done=lambda config_data, error: self.on_config_imported(file_path, config_data, error),
+            on_progress=lambda section, fraction: show_status(
+                IMPORT_TEXT.format(percent=round(fraction * 100), section=section))
+        )
+    
+    def on_config_imported(self, file_path, imported_config, error):
+        """
+        Заменяет конфигурацию прочитанной из файла
+        
+        Args:
+            file_path: Путь к импортированному файлу
+            imported_config: Прочитанная конфигурация (None при ошибке)
+            error: Исключение чтения или проверки файла
+        """
+        clear_status()
+        if error is not None:
+            messagebox.showerror("Ошибка", f"Не удалось импортировать конфигурацию: {str(error)}")
+            return
+        
+        # Записываем отложенный ввод до замены, чтобы он не попал в новую конфигурацию
+        flush_all_fields()
+        
+        # Обновляем memory_config одной операцией (подписчики получают одно оповещение о замене)
+        memory_config.replace_all(imported_config)
+        
+        # Пересоздаем UI (построенные разделы относятся к прежней конфигурации)
+        self.close_section()
+        self.section_views.clear()
+        self.create_section_buttons(memory_config)
+        
+        messagebox.showinfo("Успех", f"Конфигурация успешно импортирована из {os.path.basename(file_path)}")
     
     def export_config(self):
         """Экспортирует конфигурацию в выбранный файл JSON"""
@@ -193,55 +313,117 @@ class AppWindow:
         if not file_path:
             return  # Пользователь отменил выбор файла
         
+        flush_all_fields()
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(memory_config, file, indent=4, ensure_ascii=False)
-            
-            messagebox.showinfo("Успех", f"Конфигурация успешно экспортирована в {os.path.basename(file_path)}")
-            
+            chunks, _ = serialize_config()
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось экспортировать конфигурацию: {str(e)}")
+            return
+        
+        show_status(SAVE_TEXT)
+        self.saver.submit(
+            lambda: write_atomic(file_path, chunks),
+            lambda error: self.on_config_exported(file_path, error)
+        )
+    
+    def on_config_exported(self, file_path, error):
+        """Сообщает о результате экспорта конфигурации"""
+        if not self.saver.busy:
+            clear_status()
+        if error is None:
+            messagebox.showinfo("Успех", f"Конфигурация успешно экспортирована в {os.path.basename(file_path)}")
+        else:
+            messagebox.showerror("Ошибка", f"Не удалось экспортировать конфигурацию: {str(error)}")
     
     def preview_json(self):
-        """Открывает окно предпросмотра конфигурации в формате JSON"""
+        """Открывает окно предпросмотра конфигурации (дерево или текст JSON)"""
+        flush_all_fields()
         # Создаем новое окно для предпросмотра
         preview_window = tk.Toplevel(self.root)
         preview_window.title("Предпросмотр JSON")
         preview_window.geometry("800x600")
         preview_window.configure(bg=DARK_SECONDARY)
         
-        # Создаем текстовый виджет с прокруткой
-        text_frame = tk.Frame(preview_window, bg=DARK_SECONDARY)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+        # Переключатель режима: дерево открывается быстро при любом размере конфигурации,
+        # текст нужен для просмотра и копирования документа целиком
+        mode_frame = tk.Frame(preview_window, bg=DARK_SECONDARY)
+        mode_frame.pack(fill=tk.X, padx=PADDING_MEDIUM, pady=(PADDING_MEDIUM, 0))
+        mode_var = tk.StringVar(value="tree")
+        
+        content_frame = tk.Frame(preview_window, bg=DARK_SECONDARY)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+        
+        # Дерево JSON: элементы разделов создаются только при раскрытии узлов
+        json_tree = JsonTreeView(content_frame, memory_config)
+        json_tree.pack(fill=tk.BOTH, expand=True)
+        views = {"tree": json_tree}
+        
+        def show_mode():
+            mode = mode_var.get()
+            if mode not in views:
+                views[mode] = self.create_json_text_view(content_frame)
+            for name, view in views.items():
+                if name == mode:
+                    view.pack(fill=tk.BOTH, expand=True)
+                else:
+                    view.pack_forget()
+        
+        for text, value in (("Дерево", "tree"), ("Текст", "text")):
+            tk.Radiobutton(mode_frame, text=text, variable=mode_var, value=value,
+                           command=show_mode,
+                           bg=DARK_SECONDARY, fg=LIGHT_TEXT,
+                           selectcolor=DARK_BG).pack(side=tk.LEFT, padx=(0, PADDING_MEDIUM))
+        
+        # Кнопка копирования в буфер обмена (полный текст JSON)
+        copy_button = tk.Button(preview_window, text="Копировать в буфер обмена", 
+                               bg=BUTTON_BG, fg=LIGHT_TEXT,
+                               command=lambda: self.copy_to_clipboard(config_texts.iter_document()))
+        copy_button.pack(pady=PADDING_MEDIUM)
+    
+    def create_json_text_view(self, parent):
+        """
+        Создает текстовое представление конфигурации для окна предпросмотра
+        
+        Args:
+            parent: Контейнер окна предпросмотра
+        
+        Returns:
+            Фрейм с текстом JSON
+        """
+        text_frame = tk.Frame(parent, bg=DARK_SECONDARY)
         
         text_scroll = ttk.Scrollbar(text_frame)
         text_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Горизонтальная прокрутка
+        h_scroll = ttk.Scrollbar(text_frame, orient='horizontal')
+        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        
         # Используем моноширинную гарнитуру для лучшего отображения JSON
         preview_text = tk.Text(text_frame, bg=DARK_BG, fg=LIGHT_TEXT, wrap=tk.NONE, 
-                            font=("Courier New", 10), yscrollcommand=text_scroll.set)
+                            font=("Courier New", 10), yscrollcommand=text_scroll.set,
+                            xscrollcommand=h_scroll.set)
         preview_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Добавляем также горизонтальную прокрутку
-        h_scroll = ttk.Scrollbar(preview_window, orient='horizontal', command=preview_text.xview)
-        h_scroll.pack(fill=tk.X)
-        preview_text.configure(xscrollcommand=h_scroll.set)
-        
         text_scroll.config(command=preview_text.yview)
+        h_scroll.config(command=preview_text.xview)
         
-        # Форматируем JSON для лучшей читаемости
-        formatted_json = json.dumps(memory_config, indent=4, ensure_ascii=False)
-        preview_text.insert(tk.END, formatted_json)
+        # Текст добавляется по разделам из кэша, без сборки общей строки
+        for chunk in config_texts.iter_document():
+            preview_text.insert(tk.END, chunk)
         preview_text.configure(state='disabled')  # Делаем поле только для чтения
-        
-        # Кнопка копирования в буфер обмена
-        copy_button = tk.Button(preview_window, text="Копировать в буфер обмена", 
-                               bg=BUTTON_BG, fg=LIGHT_TEXT,
-                               command=lambda: self.copy_to_clipboard(formatted_json))
-        copy_button.pack(pady=PADDING_MEDIUM)
+        return text_frame
     
-    def copy_to_clipboard(self, text):
-        """Копирует текст в буфер обмена"""
+    def copy_to_clipboard(self, chunks):
+        """
+        Копирует текст в буфер обмена
+        
+        Args:
+            chunks: Текст или итератор его фрагментов (добавляются в буфер по одному)
+        """
+        if isinstance(chunks, str):
+            chunks = (chunks,)
         self.root.clipboard_clear()
-        self.root.clipboard_append(text)
+        for chunk in chunks:
+            self.root.clipboard_append(chunk)
         messagebox.showinfo("Успех", "JSON-конфигурация скопирована в буфер обмена")
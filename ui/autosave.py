@@ -0,0 +1,139 @@
+"""Автоматическое сохранение config.json после изменений конфигурации"""
+import copy
+import time
+import tkinter as tk
+
+from ui.constants import *
+from utils.config_manager import CONFIG_BACKUPS, write_config_text
+from utils.config_serializer import iter_json
+
+
+class Autosaver:
+    """
+    Сохраняет измененную конфигурацию в config.json после паузы в правках
+
+    Каждое изменение хранилища перезапускает таймер AUTOSAVE_DELAY_MS, но
+    при непрерывных правках сохранение выполняется не реже, чем раз в
+    AUTOSAVE_MAX_DELAY_MS. В потоке tkinter копируются только разделы,
+    изменившиеся с прошлого сохранения; преобразование в JSON и запись
+    выполняются в рабочем потоке ConfigSaver.
+    """
+
+    def __init__(self, root, store, saver, on_state=None,
+                 delay=AUTOSAVE_DELAY_MS, max_delay=AUTOSAVE_MAX_DELAY_MS):
+        """
+        Инициализирует автосохранение и подписывается на изменения
+
+        Args:
+            root: Корневой объект tkinter (таймеры)
+            store: Хранилище конфигурации (ConfigStore)
+            saver: Очередь записи (ConfigSaver)
+            on_state: Функция (text), получающая текст состояния сохранения
+            delay: Пауза после последнего изменения (мс)
+            max_delay: Наибольшая задержка сохранения при непрерывных правках (мс)
+        """
+        self.root = root
+        self.store = store
+        self.saver = saver
+        self.on_state = on_state
+        self.delay = delay
+        self.max_delay = max_delay
+        self._after_id = None
+        self._first_change = None
+        self._backup_done = False
+        # Копии разделов последнего сохранения и их версии
+        self._snapshot = {}
+        self._snapshot_revisions = {}
+        self._duration = 0.0
+        store.subscribe(self._on_change)
+
+    def _on_change(self, section, key):
+        if self.store.is_dirty():
+            self._set_state(AUTOSAVE_PENDING_TEXT)
+            self.schedule()
+
+    def schedule(self):
+        """Откладывает сохранение до паузы в правках (не дольше max_delay с первой правки)"""
+        now = time.monotonic()
+        if self._first_change is None:
+            self._first_change = now
+        waited = (now - self._first_change) * 1000
+        delay = max(0, min(self.delay, self.max_delay - waited))
+
+        self._cancel_timer()
+        try:
+            self._after_id = self.root.after(int(delay), self.save_now)
+        except tk.TclError:
+            # Главное окно закрыто
+            self._after_id = None
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def save_now(self):
+        """Ставит сохранение измененной конфигурации в очередь записи"""
+        self._cancel_timer()
+        self._first_change = None
+        if not self.store.is_dirty():
+            return
+
+        snapshot, revisions = self._take_snapshot()
+        # Первое автосохранение за сеанс сохраняет прежний файл в резервную копию
+        backups = 0 if self._backup_done else CONFIG_BACKUPS
+        self._set_state(SAVE_TEXT)
+        self.saver.submit(
+            lambda: self._write(snapshot, backups),
+            lambda error: self._on_saved(revisions, error)
+        )
+
+    def _take_snapshot(self):
+        """
+        Возвращает неизменяемую копию конфигурации для рабочего потока
+
+        Разделы, не изменявшиеся с прошлого сохранения, берутся из
+        предыдущей копии, остальные копируются заново.
+        """
+        store = self.store
+        revisions = store.snapshot_revisions()
+        snapshot = {}
+        for section, data in store.items():
+            revision = revisions.get(section, 0)
+            if section in self._snapshot and self._snapshot_revisions.get(section, 0) == revision:
+                snapshot[section] = self._snapshot[section]
+            else:
+                snapshot[section] = copy.deepcopy(data)
+        self._snapshot = snapshot
+        self._snapshot_revisions = revisions
+        return snapshot, revisions
+
+    def _write(self, snapshot, backups):
+        """Преобразует копию в JSON и записывает config.json по мере кодирования (в рабочем потоке)"""
+        started = time.perf_counter()
+        write_config_text(iter_json(snapshot), backups=backups)
+        self._duration = time.perf_counter() - started
+
+    def _on_saved(self, revisions, error):
+        """Обрабатывает завершение записи в потоке tkinter"""
+        if error is not None:
+            self._set_state(AUTOSAVE_ERROR_TEXT)
+            # Повторяем попытку после следующей паузы
+            self.schedule()
+            return
+
+        self._backup_done = True
+        self.store.mark_saved(revisions)
+        if self.store.is_dirty():
+            # Во время записи появились новые правки
+            self._set_state(AUTOSAVE_PENDING_TEXT)
+            return
+        saved_at = time.strftime("%H:%M:%S")
+        self._set_state(AUTOSAVE_DONE_TEXT.format(time=saved_at, ms=round(self._duration * 1000)))
+
+    def _set_state(self, text):
+        if self.on_state is not None:
+            self.on_state(text)
@@ -0,0 +1,124 @@
+"""Фоновая загрузка каталога ArkData без блокировки главного цикла tkinter"""
+import queue
+import threading
+import tkinter as tk
+
+from utils.ark_catalog import get_catalog
+
+# Категории, которые нужны окнам выбора и декодируются заранее
+PRELOAD_CATEGORIES = ("items", "creatures")
+
+# Интервал опроса очереди загрузчика (мс)
+POLL_INTERVAL = 50
+
+
+class CatalogLoader:
+    """Загружает каталог в рабочем потоке и сообщает о готовности в потоке tkinter"""
+
+    def __init__(self, root, categories=PRELOAD_CATEGORIES):
+        """
+        Инициализирует загрузчик
+
+        Args:
+            root: Корневой объект tkinter, через который опрашивается очередь
+            categories: Категории, декодируемые в фоне
+        """
+        self.root = root
+        self.categories = categories
+        self.ready = False
+        self.error = None
+        self._queue = queue.Queue()
+        self._callbacks = []
+        self._thread = None
+
+    def start(self):
+        """Запускает загрузку в рабочем потоке и опрос очереди через root.after"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._worker, name="ArkCatalogLoader", daemon=True)
+        self._thread.start()
+        self.root.after(POLL_INTERVAL, self._poll)
+
+    def _worker(self):
+        """Загружает каталог (выполняется в рабочем потоке, без обращений к tkinter)"""
+        try:
+            get_catalog().preload(self.categories)
+            self._queue.put(None)
+        except Exception as e:
+            self._queue.put(e)
+
+    def _poll(self):
+        """Проверяет очередь; вызывает ожидающие обработчики, когда каталог готов"""
+        try:
+            error = self._queue.get_nowait()
+        except queue.Empty:
+            self.root.after(POLL_INTERVAL, self._poll)
+            return
+
+        if error is not None:
+            # Каталог останется пустым, но окна выбора перестанут ждать загрузки
+            print(f"Ошибка при фоновой загрузке каталога ARK: {error}")
+            self.error = error
+        self.ready = True
+
+        callbacks, self._callbacks = self._callbacks, []
+        for widget, callback in callbacks:
+            try:
+                if widget is None or widget.winfo_exists():
+                    callback()
+            except tk.TclError:
+                # Окно закрыли во время обработки
+                pass
+
+    def when_ready(self, widget, callback):
+        """
+        Регистрирует обработчик, вызываемый после загрузки каталога
+
+        Args:
+            widget: Виджет-владелец; если он уничтожен, обработчик не вызывается
+            callback: Функция без аргументов
+        """
+        if self.ready:
+            callback()
+        else:
+            self._callbacks.append((widget, callback))
+
+
+# Загрузчик, запущенный главным окном приложения
+_loader = None
+
+def start_catalog_loader(root):
+    """
+    Запускает фоновую загрузку каталога
+
+    Args:
+        root: Корневой объект tkinter
+
+    Returns:
+        Экземпляр CatalogLoader
+    """
+    global _loader
+    if _loader is None:
+        _loader = CatalogLoader(root)
+        _loader.start()
+    return _loader
+
+def catalog_ready():
+    """Возвращает True, если каталог загружен (или фоновая загрузка не запускалась)"""
+    return _loader is None or _loader.ready
+
+def on_catalog_ready(widget, callback):
+    """
+    Вызывает callback в потоке tkinter, когда каталог будет загружен
+
+    Если каталог уже загружен или фоновая загрузка не запускалась,
+    callback вызывается сразу.
+
+    Args:
+        widget: Виджет-владелец обработчика
+        callback: Функция без аргументов
+    """
+    if _loader is None:
+        callback()
+    else:
+        _loader.when_ready(widget, callback)
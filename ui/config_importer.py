@@ -0,0 +1,102 @@
+"""Импорт файла конфигурации в рабочем потоке с отображением хода разбора"""
+import queue
+import threading
+import tkinter as tk
+
+from utils.config_import import read_config_file
+
+# Интервал опроса очереди импорта (мс)
+POLL_INTERVAL = 50
+
+
+class ConfigImporter:
+    """
+    Читает и проверяет файл конфигурации в рабочем потоке
+
+    Рабочий поток не обращается ни к tkinter, ни к memory_config: ход разбора
+    и результат передаются через очередь и обрабатываются в потоке tkinter.
+    Конфигурацию в памяти заменяет обработчик on_done, только если весь файл
+    прочитан без ошибок.
+    """
+
+    def __init__(self, root):
+        """
+        Инициализирует импорт
+
+        Args:
+            root: Корневой объект tkinter, через который опрашивается очередь
+        """
+        self.root = root
+        self._queue = None
+        self._on_progress = None
+        self._on_done = None
+
+    @property
+    def running(self):
+        """True, пока идет импорт"""
+        return self._queue is not None
+
+    def start(self, file_path, on_done, on_progress=None):
+        """
+        Запускает импорт файла
+
+        Args:
+            file_path: Путь к файлу JSON
+            on_done: Функция (config_data, error) в потоке tkinter; при ошибке
+                config_data равен None
+            on_progress: Функция (имя раздела, доля от 0 до 1) в потоке tkinter
+
+        Returns:
+            False, если импорт уже выполняется
+        """
+        if self.running:
+            return False
+        self._queue = queue.Queue()
+        self._on_done = on_done
+        self._on_progress = on_progress
+        threading.Thread(
+            target=self._worker, args=(file_path, self._queue),
+            name="ConfigImporter", daemon=True
+        ).start()
+        self.root.after(POLL_INTERVAL, self._poll)
+        return True
+
+    def _worker(self, file_path, results):
+        """Разбирает файл (выполняется в рабочем потоке, без обращений к tkinter)"""
+        def report(name, done, total):
+            results.put(("progress", (name, done / total if total else 1.0)))
+
+        try:
+            results.put(("done", read_config_file(file_path, on_progress=report)))
+        except Exception as e:
+            results.put(("error", e))
+
+    def _poll(self):
+        """Передает ход разбора и результат обработчикам в потоке tkinter"""
+        progress = None
+        while True:
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                # Из накопившихся сообщений о ходе разбора достаточно последнего
+                progress = payload
+                continue
+            self._finish(payload if kind == "done" else None, payload if kind == "error" else None)
+            return
+
+        if progress is not None and self._on_progress is not None:
+            self._on_progress(*progress)
+        try:
+            self.root.after(POLL_INTERVAL, self._poll)
+        except tk.TclError:
+            # Главное окно закрыто
+            self._queue = None
+
+    def _finish(self, config_data, error):
+        on_done = self._on_done
+        self._queue = None
+        self._on_done = None
+        self._on_progress = None
+        on_done(config_data, error)
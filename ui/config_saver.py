@@ -0,0 +1,94 @@
+"""Запись файлов конфигурации в рабочем потоке без блокировки главного цикла tkinter"""
+import queue
+import threading
+import tkinter as tk
+
+# Интервал опроса очереди результатов (мс)
+POLL_INTERVAL = 50
+
+
+class ConfigSaver:
+    """
+    Выполняет операции записи по очереди в рабочем потоке
+
+    Операции выполняются строго в порядке постановки (последнее сохранение
+    всегда оказывается в файле последним). Рабочий поток не является
+    демоном и завершается, когда очередь пуста, поэтому начатая запись
+    успевает завершиться и при закрытии приложения.
+    """
+
+    def __init__(self, root):
+        """
+        Инициализирует очередь записи
+
+        Args:
+            root: Корневой объект tkinter, через который опрашиваются результаты
+        """
+        self.root = root
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending = 0
+
+    @property
+    def busy(self):
+        """True, пока есть незавершенные операции записи"""
+        return self._pending > 0
+
+    def submit(self, write, on_done=None):
+        """
+        Ставит операцию записи в очередь
+
+        Args:
+            write: Функция без аргументов, выполняемая в рабочем потоке
+                (не должна обращаться к tkinter и memory_config)
+            on_done: Функция (error), вызываемая в потоке tkinter после записи;
+                error - исключение или None
+        """
+        self._pending += 1
+        if self._pending == 1:
+            self.root.after(POLL_INTERVAL, self._poll)
+        with self._lock:
+            self._jobs.put((write, on_done))
+            if not self._running:
+                self._running = True
+                threading.Thread(target=self._worker, name="ConfigSaver").start()
+
+    def _worker(self):
+        """Выполняет операции из очереди (в рабочем потоке, без обращений к tkinter)"""
+        while True:
+            with self._lock:
+                if self._jobs.empty():
+                    self._running = False
+                    return
+                write, on_done = self._jobs.get()
+            try:
+                write()
+                error = None
+            except Exception as e:
+                error = e
+            self._results.put((on_done, error))
+
+    def _poll(self):
+        """Вызывает обработчики завершенных операций в потоке tkinter"""
+        while True:
+            try:
+                on_done, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if error is not None:
+                print(f"Ошибка при записи конфигурации: {error}")
+            if on_done is not None:
+                try:
+                    on_done(error)
+                except Exception as e:
+                    print(f"Ошибка в обработчике завершения записи: {e}")
+
+        if self._pending > 0:
+            try:
+                self.root.after(POLL_INTERVAL, self._poll)
+            except tk.TclError:
+                # Главное окно закрыто; запись в рабочем потоке все равно завершится
+                pass
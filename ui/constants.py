@@ -36,5 +36,38 @@ SECTIONS = [
     "Notifications"
 ]
 
+# Текст, отображаемый в списках поиска, пока каталог ArkData загружается
+CATALOG_LOADING_TEXT = "Загрузка каталога…"
+
+# Задержка поиска после последнего нажатия клавиши (мс)
+SEARCH_DEBOUNCE_MS = 150
+
+# Количество записей, добавляемых в большую таблицу за одну порцию
+POPULATE_CHUNK_ROWS = 500
+
+# Текст строки состояния при заполнении таблицы
+POPULATE_TEXT = "Заполнение таблицы"
+
+# Задержка записи поля ввода в конфигурацию после последнего изменения (мс)
+FIELD_FLUSH_MS = 300
+
+# Текст строки состояния во время записи конфигурации в рабочем потоке
+SAVE_TEXT = "Сохранение конфигурации..."
+
+# Автосохранение: пауза после последней правки и наибольшая задержка при непрерывных правках (мс)
+AUTOSAVE_DELAY_MS = 2000
+AUTOSAVE_MAX_DELAY_MS = 15000
+
+# Тексты индикатора автосохранения
+AUTOSAVE_PENDING_TEXT = "Есть несохраненные изменения"
+AUTOSAVE_DONE_TEXT = "Сохранено в {time} ({ms} мс)"
+AUTOSAVE_ERROR_TEXT = "Ошибка автосохранения"
+
+# Текст строки состояния при импорте конфигурации
+IMPORT_TEXT = "Импорт конфигурации: {percent}% {section}"
+
+# Количество построенных разделов, хранимых для быстрого повторного открытия
+SECTION_CACHE_SIZE = 5
+
 # Импорт функции обновления конфигурации в памяти
 from utils.config_manager import update_memory_config
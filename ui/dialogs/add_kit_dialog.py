@@ -1,11 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+import copy
 import json
 import os
 from ui.constants import *
 from ui.dialogs.add_kit_item_dialog import AddKitItemDialog
 from ui.dialogs.add_kit_dino_dialog import AddKitDinoDialog
 from ui.dialogs.add_kit_command_dialog import AddKitCommandDialog
+from ui.widgets.tree_reconciler import TreeReconciler, list_keys
 
 class AddKitDialog:
     """Класс диалогового окна для добавления набора"""
@@ -23,19 +25,21 @@ class AddKitDialog:
             kit_id: ID набора (если редактирование)
         """
         self.parent = parent
-        self.items_data = items_data or {}
-        self.dinos_data = dinos_data or {}
+        # Если данные не переданы, окна выбора возьмут их из общего каталога после загрузки
+        self.items_data = items_data
+        self.dinos_data = dinos_data
         self.on_save = on_save
         self.kit_data = kit_data or {}
         self.kit_id = kit_id
         self.result = None
         
-        # Данные набора
+        # Данные набора (копии: до сохранения диалог не меняет конфигурацию,
+        # а журнал отмены получает новые списки)
         if self.kit_data:
-            self.kit_items = self.kit_data.get("Items", [])
-            self.kit_dinos = self.kit_data.get("Dinos", [])
-            self.kit_commands = self.kit_data.get("ConsoleCommands", [])
-            self.permission_groups = self.kit_data.get("PermissionGroupRequired", [])
+            self.kit_items = copy.deepcopy(self.kit_data.get("Items", []))
+            self.kit_dinos = copy.deepcopy(self.kit_data.get("Dinos", []))
+            self.kit_commands = copy.deepcopy(self.kit_data.get("ConsoleCommands", []))
+            self.permission_groups = copy.deepcopy(self.kit_data.get("PermissionGroupRequired", []))
         else:
             self.kit_items = []
             self.kit_dinos = []
@@ -374,6 +378,7 @@ class AddKitDialog:
         # Размещаем таблицу и скроллбар
         self.items_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.items_reconciler = TreeReconciler(self.items_tree)
     
     def setup_dinos_tab(self, parent):
         """Настройка вкладки динозавров"""
@@ -439,6 +444,7 @@ class AddKitDialog:
         # Размещаем таблицу и скроллбар
         self.dinos_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.dinos_reconciler = TreeReconciler(self.dinos_tree)
     
     def setup_commands_tab(self, parent):
         """Настройка вкладки консольных команд"""
@@ -543,34 +549,28 @@ class AddKitDialog:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
     def update_items_list(self):
-        """Обновляет список предметов в таблице"""
-        # Очищаем текущий список
-        for item in self.items_tree.get_children():
-            self.items_tree.delete(item)
-        
-        # Заполняем таблицу предметами
+        """Обновляет список предметов в таблице (изменяются только затронутые строки)"""
+        rows = []
         for item in self.kit_items:
-            self.items_tree.insert("", "end", values=(
+            rows.append((
                 item.get("Blueprint", ""),
                 item.get("Amount", 1),
                 item.get("Quality", 0),
                 "Да" if item.get("ForceBlueprint", False) else "Нет"
             ))
+        self.items_reconciler.reconcile(rows, list_keys(self.kit_items))
     
     def update_dinos_list(self):
-        """Обновляет список динозавров в таблице"""
-        # Очищаем текущий список
-        for item in self.dinos_tree.get_children():
-            self.dinos_tree.delete(item)
-        
-        # Заполняем таблицу динозаврами
+        """Обновляет список динозавров в таблице (изменяются только затронутые строки)"""
+        rows = []
         for dino in self.kit_dinos:
-            self.dinos_tree.insert("", "end", values=(
+            rows.append((
                 dino.get("Blueprint", ""),
                 dino.get("Level", 150),
                 dino.get("Name", ""),
                 "Да" if dino.get("Neutered", False) else "Нет"
             ))
+        self.dinos_reconciler.reconcile(rows, list_keys(self.kit_dinos))
     
     def update_commands_list(self):
         """Обновляет список консольных команд"""
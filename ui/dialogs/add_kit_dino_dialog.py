@@ -3,6 +3,9 @@ from tkinter import ttk, messagebox
 import json
 import os
 from ui.constants import *
+from utils.ark_catalog import get_catalog, get_ranked_index
+from ui.catalog_loader import catalog_ready, on_catalog_ready
+from ui.search_controller import SearchController
 
 class AddKitDinoDialog:
     """Класс диалогового окна для добавления динозавра в набор"""
@@ -18,7 +21,9 @@ class AddKitDinoDialog:
             dino_data: данные о редактируемом динозавре (если редактирование)
         """
         self.parent = parent
-        self.dinos_data = dinos_data or {}
+        # Если данные не переданы, они берутся из общего каталога после его загрузки
+        self.dinos_data = dinos_data
+        self.dinos_index = None
         self.on_save = on_save
         self.dino_data = dino_data or {}
         self.result = None
@@ -75,8 +80,8 @@ class AddKitDinoDialog:
         search_label.pack(side=tk.LEFT)
         
         self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var, width=30)
-        search_entry.pack(side=tk.LEFT, padx=(PADDING_SMALL, 0), fill=tk.X, expand=True)
+        self.search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var, width=30)
+        self.search_entry.pack(side=tk.LEFT, padx=(PADDING_SMALL, 0), fill=tk.X, expand=True)
         
         # Создаем listbox для отображения результатов поиска
         list_frame = tk.Frame(main_frame, bg=DARK_SECONDARY)
@@ -93,7 +98,10 @@ class AddKitDinoDialog:
         self.populate_dinos_list()
         
         # Привязываем события
-        self.search_var.trace_add("write", self.filter_dinos)
+        # Поиск выполняется с задержкой после ввода и сужает результат предыдущего запроса
+        self.search_controller = SearchController(
+            self.search_entry, self.search_var, lambda: self.dinos_index, self.show_search_results
+        )
         self.dinos_listbox.bind("<Double-1>", self.select_dino)
         
         # Создаем фрейм для ручного ввода Blueprint
@@ -176,28 +184,37 @@ class AddKitDinoDialog:
         """Заполняет listbox списком динозавров"""
         self.dinos_listbox.delete(0, tk.END)
         
-        # Сортируем динозавров по имени для удобства поиска
-        sorted_dinos = sorted(self.dinos_data.keys())
+        # Пока каталог загружается в фоне, показываем заглушку и ждем готовности
+        if self.dinos_data is None and not catalog_ready():
+            self.dinos_listbox.insert(tk.END, CATALOG_LOADING_TEXT)
+            self.search_entry.configure(state="disabled")
+            on_catalog_ready(self.dialog, self.on_catalog_loaded)
+            return
+        if self.dinos_data is None:
+            self.dinos_data = get_catalog().get("creatures")
+        self.dinos_index = get_ranked_index("creatures", self.dinos_data)
         
-        for dino_name in sorted_dinos:
-            self.dinos_listbox.insert(tk.END, dino_name)
+        # Ключи в индексе уже отсортированы по имени
+        self.dinos_listbox.insert(tk.END, *self.dinos_index.keys)
+
+    def on_catalog_loaded(self):
+        """Обработчик завершения фоновой загрузки каталога"""
+        self.dinos_data = get_catalog().get("creatures")
+        self.dinos_index = get_ranked_index("creatures", self.dinos_data)
+        self.search_entry.configure(state="normal")
+        self.filter_dinos()
 
     def filter_dinos(self, *args):
-        """Фильтрует список динозавров по поисковому запросу"""
-        search_term = self.search_var.get().lower()
+        """Немедленно фильтрует список динозавров по поисковому запросу"""
+        self.search_controller.run_now()
+    
+    def show_search_results(self, result):
+        """Отображает результат поиска в listbox"""
         self.dinos_listbox.delete(0, tk.END)
         
-        # Если поисковый запрос пустой, показываем всех динозавров
-        if not search_term:
-            sorted_dinos = sorted(self.dinos_data.keys())
-            for dino_name in sorted_dinos:
-                self.dinos_listbox.insert(tk.END, dino_name)
-            return
-        
-        # Иначе фильтруем динозавров по поисковому запросу
-        for dino_name in sorted(self.dinos_data.keys()):
-            if search_term in dino_name.lower():
-                self.dinos_listbox.insert(tk.END, dino_name)
+        # Совпадения упорядочены по убыванию релевантности (для пустого запроса - всех динозавров)
+        if result.keys:
+            self.dinos_listbox.insert(tk.END, *result.keys)
     
     def select_dino(self, event=None):
         """Обработчик выбора динозавра из списка"""
@@ -206,7 +223,7 @@ class AddKitDinoDialog:
             return
         
         selected_dino = self.dinos_listbox.get(selected_indices[0])
-        if selected_dino in self.dinos_data:
+        if self.dinos_data is not None and selected_dino in self.dinos_data:
             blueprint = self.dinos_data[selected_dino].get("blueprint", "")
             self.blueprint_var.set(blueprint)
 
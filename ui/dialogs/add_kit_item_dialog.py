@@ -3,6 +3,9 @@ from tkinter import ttk, messagebox
 import json
 import os
 from ui.constants import *
+from utils.ark_catalog import get_catalog, get_ranked_index
+from ui.catalog_loader import catalog_ready, on_catalog_ready
+from ui.search_controller import SearchController
 
 class AddKitItemDialog:
     """Класс диалогового окна для добавления предмета в набор"""
@@ -18,7 +21,9 @@ class AddKitItemDialog:
             item_data: данные о редактируемом предмете (если редактирование)
         """
         self.parent = parent
-        self.items_data = items_data or {}
+        # Если данные не переданы, они берутся из общего каталога после его загрузки
+        self.items_data = items_data
+        self.items_index = None
         self.on_save = on_save
         self.item_data = item_data or {}
         self.result = None
@@ -75,8 +80,8 @@ class AddKitItemDialog:
         search_label.pack(side=tk.LEFT)
         
         self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var, width=30)
-        search_entry.pack(side=tk.LEFT, padx=(PADDING_SMALL, 0), fill=tk.X, expand=True)
+        self.search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var, width=30)
+        self.search_entry.pack(side=tk.LEFT, padx=(PADDING_SMALL, 0), fill=tk.X, expand=True)
         
         # Создаем listbox для отображения результатов поиска
         list_frame = tk.Frame(main_frame, bg=DARK_SECONDARY)
@@ -93,7 +98,10 @@ class AddKitItemDialog:
         self.populate_items_list()
         
         # Привязываем события
-        self.search_var.trace_add("write", self.filter_items)
+        # Поиск выполняется с задержкой после ввода и сужает результат предыдущего запроса
+        self.search_controller = SearchController(
+            self.search_entry, self.search_var, lambda: self.items_index, self.show_search_results
+        )
         self.items_listbox.bind("<Double-1>", self.select_item)
         
         # Создаем фрейм для ручного ввода Blueprint
@@ -185,28 +193,37 @@ class AddKitItemDialog:
         """Заполняет listbox списком предметов"""
         self.items_listbox.delete(0, tk.END)
         
-        # Сортируем предметы по имени для удобства поиска
-        sorted_items = sorted(self.items_data.keys())
+        # Пока каталог загружается в фоне, показываем заглушку и ждем готовности
+        if self.items_data is None and not catalog_ready():
+            self.items_listbox.insert(tk.END, CATALOG_LOADING_TEXT)
+            self.search_entry.configure(state="disabled")
+            on_catalog_ready(self.dialog, self.on_catalog_loaded)
+            return
+        if self.items_data is None:
+            self.items_data = get_catalog().get("items")
+        self.items_index = get_ranked_index("items", self.items_data)
         
-        for item_name in sorted_items:
-            self.items_listbox.insert(tk.END, item_name)
+        # Ключи в индексе уже отсортированы по имени
+        self.items_listbox.insert(tk.END, *self.items_index.keys)
             
+    def on_catalog_loaded(self):
+        """Обработчик завершения фоновой загрузки каталога"""
+        self.items_data = get_catalog().get("items")
+        self.items_index = get_ranked_index("items", self.items_data)
+        self.search_entry.configure(state="normal")
+        self.filter_items()
+
     def filter_items(self, *args):
-        """Фильтрует список предметов по поисковому запросу"""
-        search_term = self.search_var.get().lower()
+        """Немедленно фильтрует список предметов по поисковому запросу"""
+        self.search_controller.run_now()
+    
+    def show_search_results(self, result):
+        """Отображает результат поиска в listbox"""
         self.items_listbox.delete(0, tk.END)
         
-        # Если поисковый запрос пустой, показываем все предметы
-        if not search_term:
-            sorted_items = sorted(self.items_data.keys())
-            for item_name in sorted_items:
-                self.items_listbox.insert(tk.END, item_name)
-            return
-        
-        # Иначе фильтруем предметы по поисковому запросу
-        for item_name in sorted(self.items_data.keys()):
-            if search_term in item_name.lower():
-                self.items_listbox.insert(tk.END, item_name)
+        # Совпадения упорядочены по убыванию релевантности (для пустого запроса - все предметы)
+        if result.keys:
+            self.items_listbox.insert(tk.END, *result.keys)
     
     def select_item(self, event=None):
         """Обработчик выбора предмета из списка"""
@@ -215,7 +232,7 @@ class AddKitItemDialog:
             return
         
         selected_item = self.items_listbox.get(selected_indices[0])
-        if selected_item in self.items_data:
+        if self.items_data is not None and selected_item in self.items_data:
             blueprint = self.items_data[selected_item].get("blueprint", "")
             self.blueprint_var.set(blueprint)
 
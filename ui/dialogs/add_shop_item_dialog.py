@@ -3,6 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 import json
 import os
 from ui.constants import *
+from utils.ark_catalog import get_ark_data, get_ranked_index
+from ui.search_controller import SearchController
 
 class AddShopItemDialog:
     """Класс диалогового окна для добавления товара в магазин"""
@@ -19,7 +21,7 @@ class AddShopItemDialog:
             item_id: ID редактируемого предмета (если редактирование)
         """
         self.parent = parent
-        self.ark_data = ark_data or {}
+        self.ark_data = ark_data if ark_data is not None else get_ark_data()
         self.on_save = on_save
         self.item_data = item_data or {}
         self.item_id = item_id
@@ -109,8 +111,13 @@ class AddShopItemDialog:
         self.items_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Привязываем поиск к вводу текста
-        self.search_var.trace("w", self.filter_items)
+        # Привязываем поиск к вводу текста (с задержкой после ввода, см. SearchController)
+        self.search_controller = SearchController(
+            search_entry,
+            self.search_var,
+            lambda: get_ranked_index("items", self.ark_data.get("items", {})) if self.ark_data else None,
+            self.show_search_results
+        )
         
         # Привязываем двойной клик к выбору предмета
         self.items_listbox.bind("<Double-1>", self.select_item)
@@ -256,31 +263,22 @@ class AddShopItemDialog:
         if not self.ark_data or "items" not in self.ark_data:
             return
             
-        sorted_items = sorted(self.ark_data.get("items", {}).keys())
-        for item_name in sorted_items:
-            self.items_listbox.insert(tk.END, item_name)
+        # Ключи в индексе уже отсортированы по имени
+        sorted_items = get_ranked_index("items", self.ark_data.get("items", {})).keys
+        if sorted_items:
+            self.items_listbox.insert(tk.END, *sorted_items)
     
     def filter_items(self, *args):
-        """Фильтрация предметов по поисковому запросу"""
-        search_term = self.search_var.get().lower()
+        """Немедленная фильтрация предметов по поисковому запросу"""
+        self.search_controller.run_now()
+    
+    def show_search_results(self, result):
+        """Отображает результат поиска в списке"""
         self.items_listbox.delete(0, tk.END)
         
-        # Если поисковый запрос пуст, показываем все предметы
-        if not search_term:
-            self.populate_items_list()
-            return
-            
-        if not self.ark_data or "items" not in self.ark_data:
-            return
-            
-        items = self.ark_data.get("items", {})
-        
-        # Ищем совпадения
-        matching_items = [name for name in items.keys() if search_term in name.lower()]
-                
-        # Сортируем и добавляем в список
-        for item_name in sorted(matching_items):
-            self.items_listbox.insert(tk.END, item_name)
+        # Совпадения упорядочены по релевантности (для пустого запроса - все предметы)
+        if result.keys:
+            self.items_listbox.insert(tk.END, *result.keys)
             
     def select_item(self, event=None):
         """Выбор предмета из списка"""
@@ -411,7 +409,7 @@ class BlueprintSelectorDialog:
             blueprint_var: Переменная для сохранения выбранного Blueprint
         """
         self.parent = parent
-        self.ark_data = ark_data
+        self.ark_data = ark_data if ark_data is not None else get_ark_data()
         self.blueprint_var = blueprint_var
         
         # Создаем модальное окно
@@ -454,8 +452,13 @@ class BlueprintSelectorDialog:
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        # При изменении текста в поле поиска вызываем функцию фильтрации
-        self.search_var.trace_add("write", lambda *args: self.update_list())
+        # При изменении текста в поле поиска фильтруем список с задержкой после ввода
+        self.search_controller = SearchController(
+            search_entry,
+            self.search_var,
+            lambda: get_ranked_index(self.item_type_var.get(), self.ark_data.get(self.item_type_var.get(), {})),
+            self.show_search_results
+        )
         
         # Фрейм для списка Blueprint
         list_frame = tk.Frame(self.dialog, bg=DARK_SECONDARY)
@@ -519,28 +522,20 @@ class BlueprintSelectorDialog:
     
     def update_list(self):
         """Обновляет список Blueprint в соответствии с поиском"""
+        self.search_controller.run_now()
+    
+    def show_search_results(self, result):
+        """Отображает результат поиска в списке Blueprint"""
         # Очищаем текущий список
         for item in self.blueprint_tree.get_children():
             self.blueprint_tree.delete(item)
         
-        # Получаем тип данных (предметы или существа)
-        item_type = self.item_type_var.get()
-        
-        # Получаем поисковый запрос
-        search_text = self.search_var.get().lower()
-        
-        # Получаем данные из ArkData
-        data = self.ark_data.get(item_type, {})
-        
-        # Фильтруем данные по поисковому запросу
-        filtered_data = {}
-        for name, item_data in data.items():
-            if search_text in name.lower():
-                filtered_data[name] = item_data
+        # Получаем данные из ArkData для выбранного типа (предметы или существа)
+        data = self.ark_data.get(self.item_type_var.get(), {})
         
-        # Добавляем отфильтрованные данные в список
-        for name, item_data in filtered_data.items():
-            blueprint = item_data.get("blueprint", "")
+        # Добавляем найденные по индексу данные в список (по убыванию релевантности)
+        for name in result.keys:
+            blueprint = data[name].get("blueprint", "")
             self.blueprint_tree.insert("", "end", values=(name, blueprint))
     
     def select_blueprint(self, event):
@@ -1,8 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+import copy
 import json
 import os
 from ui.constants import *
+from utils.ark_catalog import get_ark_data, get_ranked_index
+from ui.catalog_loader import catalog_ready, on_catalog_ready
+from ui.search_controller import SearchController
+from ui.widgets.virtual_treeview import VirtualTreeview
+from ui.widgets.tree_reconciler import TreeReconciler, list_keys
 
 class ShopItemDialog:
     """Класс диалогового окна для добавления/редактирования товара в магазине"""
@@ -19,7 +25,7 @@ class ShopItemDialog:
             item_id: ID редактируемого предмета (если редактирование)
         """
         self.parent = parent
-        self.ark_data = ark_data or {}
+        self.ark_data = ark_data if ark_data is not None else get_ark_data()
         self.on_save = on_save
         self.item_data = item_data or {}
         self.item_id = item_id
@@ -190,6 +196,7 @@ class ShopItemDialog:
         self.items_table.configure(yscrollcommand=items_scroll.set)
         self.items_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         items_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.items_reconciler = TreeReconciler(self.items_table)
         
         # Кнопки управления предметами
         items_btn_frame = tk.Frame(items_frame, bg=DARK_SECONDARY)
@@ -360,19 +367,16 @@ class ShopItemDialog:
             self.refresh_items_table()
     
     def refresh_items_table(self):
-        """Обновляет таблицу предметов"""
-        # Очищаем таблицу
-        for item in self.items_table.get_children():
-            self.items_table.delete(item)
-        
-        # Добавляем предметы в таблицу
+        """Обновляет таблицу предметов (изменяются только затронутые строки)"""
+        rows = []
         for item in self.items_list:
             blueprint = item.get("Blueprint", "")
             amount = item.get("Amount", 1)
             quality = item.get("Quality", 0)
             force_bp = "Да" if item.get("ForceBlueprint", False) else "Нет"
-            
-            self.items_table.insert("", "end", values=(blueprint, amount, quality, force_bp))
+            rows.append((blueprint, amount, quality, force_bp))
+        
+        self.items_reconciler.reconcile(rows, list_keys(self.items_list))
     
     def fill_form_with_item_data(self):
         """Заполняет форму данными существующего товара"""
@@ -387,14 +391,15 @@ class ShopItemDialog:
         if categories:
             self.categories_var.set(", ".join(categories))
         
-        # Заполняем предметы
-        self.items_list = self.item_data.get("Items", [])
+        # Заполняем предметы (копии: до сохранения диалог не меняет конфигурацию,
+        # а журнал отмены получает новые списки)
+        self.items_list = copy.deepcopy(self.item_data.get("Items", []))
         
         # Заполняем динозавров
-        self.dinos_list = self.item_data.get("Dinos", [])
+        self.dinos_list = copy.deepcopy(self.item_data.get("Dinos", []))
         
         # Заполняем консольные команды
-        self.console_commands_list = self.item_data.get("ConsoleCommands", [])
+        self.console_commands_list = copy.deepcopy(self.item_data.get("ConsoleCommands", []))
         
         # Заполняем дополнительные настройки
         permissions = self.item_data.get("PermissionGroupRequired", [])
@@ -489,7 +494,7 @@ class ItemDialog:
             item_data: данные о редактируемом предмете (если редактирование)
         """
         self.parent = parent
-        self.ark_data = ark_data
+        self.ark_data = ark_data if ark_data is not None else get_ark_data()
         self.on_save = on_save
         self.item_data = item_data or {}
         
@@ -532,22 +537,21 @@ class ItemDialog:
         search_label.pack(side=tk.LEFT, padx=(0, PADDING_SMALL))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", self.search_items)
-        search_entry = ttk.Entry(search_input_frame, textvariable=self.search_var, width=30)
-        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.search_entry = ttk.Entry(search_input_frame, textvariable=self.search_var, width=30)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Таблица результатов поиска
         results_frame = tk.Frame(search_frame, bg=DARK_SECONDARY)
         results_frame.pack(fill=tk.BOTH, expand=True, pady=PADDING_SMALL)
         
-        # Колонки для таблицы результатов
+        # Колонки для таблицы результатов (строки создаются только для видимой области)
         results_columns = ("name", "blueprint")
-        self.results_table = ttk.Treeview(
+        self.results_table = VirtualTreeview(
             results_frame, 
             columns=results_columns,
-            show="headings",
             selectmode="browse",
-            height=15  # Увеличиваем высоту списка
+            height=15,  # Увеличиваем высоту списка
+            horizontal_scroll=False
         )
         
         # Заголовки колонок
@@ -558,15 +562,20 @@ class ItemDialog:
         self.results_table.column("name", width=250, anchor="w")
         self.results_table.column("blueprint", width=550, anchor="w")  # Увеличиваем ширину столбца
         
-        # Добавляем прокрутку для таблицы
-        results_scroll = ttk.Scrollbar(results_frame, orient="vertical", command=self.results_table.yview)
-        self.results_table.configure(yscrollcommand=results_scroll.set)
-        self.results_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        results_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        # Таблица содержит собственную полосу прокрутки
+        self.results_table.pack(fill=tk.BOTH, expand=True)
         
         # Привязываем двойной клик для выбора предмета
         self.results_table.bind("<Double-1>", self.select_item)
         
+        # Поиск выполняется с задержкой после ввода и сужает результат предыдущего запроса
+        self.search_controller = SearchController(
+            self.search_entry,
+            self.search_var,
+            lambda: self.items_index() if catalog_ready() else None,
+            self.show_search_results
+        )
+        
         # Вкладка ручного ввода
         manual_frame = tk.Frame(notebook, bg=DARK_SECONDARY)
         notebook.add(manual_frame, text="Ручной ввод")
@@ -647,44 +656,38 @@ class ItemDialog:
     
     def populate_items_table(self):
         """Заполняет таблицу результатов поиска"""
-        # Очищаем таблицу
-        for item in self.results_table.get_children():
-            self.results_table.delete(item)
+        # Пока каталог загружается в фоне, показываем заглушку и ждем готовности
+        if not catalog_ready():
+            self.results_table.set_rows([(CATALOG_LOADING_TEXT, "")])
+            self.search_entry.configure(state="disabled")
+            on_catalog_ready(self.dialog, self.on_catalog_loaded)
+            return
         
-        # Получаем предметы из ArkData
+        self.show_items(self.items_index().keys)
+    
+    def items_index(self):
+        """Возвращает индекс ранжированного поиска по предметам из ArkData"""
+        return get_ranked_index("items", self.ark_data.get("items", {}))
+    
+    def show_items(self, names):
+        """Отображает предметы с указанными именами в таблице результатов"""
         items = self.ark_data.get("items", {})
-        
-        # Добавляем предметы в таблицу (отсортированные по алфавиту)
-        for name, item_data in sorted(items.items()):
-            blueprint = item_data.get("blueprint", "")
-            self.results_table.insert("", "end", values=(name, blueprint))
+        rows = [(name, items[name].get("blueprint", "")) for name in names]
+        self.results_table.set_rows(rows, keys=names)
+    
+    def on_catalog_loaded(self):
+        """Обработчик завершения фоновой загрузки каталога"""
+        self.search_entry.configure(state="normal")
+        self.search_items()
     
     def search_items(self, *args):
-        """Поиск предметов по введенному тексту"""
-        search_text = self.search_var.get().lower()
-        
-        # Очищаем таблицу
-        for item in self.results_table.get_children():
-            self.results_table.delete(item)
-        
-        # Если поисковая строка пустая, показываем все предметы
-        if not search_text:
-            self.populate_items_table()
-            return
-        
-        # Получаем предметы из ArkData
-        items = self.ark_data.get("items", {})
-        
-        # Фильтруем предметы по поисковому запросу
-        filtered_items = {}
-        for name, item_data in items.items():
-            if search_text in name.lower():
-                filtered_items[name] = item_data
-        
-        # Добавляем отфильтрованные предметы в таблицу
-        for name, item_data in sorted(filtered_items.items()):
-            blueprint = item_data.get("blueprint", "")
-            self.results_table.insert("", "end", values=(name, blueprint))
+        """Немедленный поиск предметов по введенному тексту"""
+        self.search_controller.run_now()
+    
+    def show_search_results(self, result):
+        """Отображает результат поиска в таблице"""
+        # Совпадения упорядочены по релевантности
+        self.show_items(result.keys)
     
     def select_item(self, event=None):
         """Обработчик выбора предмета из таблицы"""
@@ -697,7 +700,7 @@ class ItemDialog:
         selected_item = self.results_table.item(selected_items[0])
         values = selected_item["values"]
         
-        if len(values) >= 2:
+        if len(values) >= 2 and values[1]:
             # Устанавливаем Blueprint в соответствующее поле
             self.blueprint_var.set(values[1])
         
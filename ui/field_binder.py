@@ -0,0 +1,137 @@
+"""Отложенная запись полей ввода разделов в конфигурацию"""
+import tkinter as tk
+import weakref
+
+from ui.constants import FIELD_FLUSH_MS
+
+# Все созданные связыватели полей (для сброса отложенных записей перед сохранением)
+_binders = weakref.WeakSet()
+
+
+def convert_like(original, value):
+    """
+    Приводит значение поля ввода к типу исходного значения конфигурации
+
+    Args:
+        original: Исходное значение из конфигурации
+        value: Значение переменной tkinter
+
+    Returns:
+        Значение того же типа (при ошибке преобразования - 0 / 0.0)
+    """
+    if isinstance(original, bool):
+        return bool(value)
+    if isinstance(original, int):
+        try:
+            return int(value)
+        except ValueError:
+            return 0
+    if isinstance(original, float):
+        try:
+            return float(value)
+        except ValueError:
+            return 0.0
+    if isinstance(original, list):
+        # Разделяем строку по запятым
+        items = [item.strip() for item in value.split(",")]
+        if all(item.isdigit() for item in items if item):
+            return [int(item) for item in items if item]
+        return items
+    return value
+
+
+def typed_converter(original):
+    """Возвращает функцию преобразования значений к типу original"""
+    return lambda value: convert_like(original, value)
+
+
+def flush_all_fields():
+    """Записывает отложенные изменения всех полей (перед сохранением, экспортом, отменой)"""
+    for binder in list(_binders):
+        binder.flush()
+
+
+class FieldBinder:
+    """
+    Объединяет изменения полей ввода и записывает их в конфигурацию после паузы
+
+    Каждое нажатие клавиши только отмечает поле измененным и откладывает запись;
+    по истечении задержки каждое поле записывается один раз (с однократным
+    преобразованием типа). Отложенные записи выполняются и при уничтожении
+    виджета раздела, и при вызове flush_all_fields().
+    """
+
+    def __init__(self, widget, delay=FIELD_FLUSH_MS):
+        """
+        Инициализирует связыватель
+
+        Args:
+            widget: Виджет раздела, через который планируется запись
+            delay: Задержка записи после последнего изменения (мс)
+        """
+        self.widget = widget
+        self.delay = delay
+        self._pending = {}
+        self._after_id = None
+        _binders.add(self)
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def schedule(self, field, callback):
+        """
+        Откладывает запись поля; повторный вызов для того же поля заменяет предыдущий
+
+        Args:
+            field: Идентификатор поля (например, ключ конфигурации)
+            callback: Функция без аргументов, выполняющая запись
+        """
+        self._pending[field] = callback
+        self._cancel_timer()
+        try:
+            self._after_id = self.widget.after(self.delay, self.flush)
+        except tk.TclError:
+            # Виджет уже уничтожен - записываем сразу
+            self.flush()
+
+    def bind(self, var, field, callback):
+        """Откладывает вызов callback при каждом изменении переменной tkinter"""
+        var.trace_add("write", lambda *args: self.schedule(field, callback))
+
+    def bind_value(self, var, key, write, convert=None):
+        """
+        Связывает переменную tkinter с ключом конфигурации
+
+        Args:
+            var: Переменная tkinter
+            key: Ключ конфигурации
+            write: Функция (key, value), выполняющая запись (обычно on_field_change)
+            convert: Функция преобразования значения (None - без преобразования)
+        """
+        def write_value():
+            value = var.get()
+            write(key, convert(value) if convert is not None else value)
+
+        self.bind(var, key, write_value)
+
+    def flush(self):
+        """Записывает все отложенные изменения"""
+        self._cancel_timer()
+        pending, self._pending = self._pending, {}
+        for callback in pending.values():
+            try:
+                callback()
+            except Exception as e:
+                print(f"Ошибка при записи поля в конфигурацию: {e}")
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _on_destroy(self, event):
+        """Записывает отложенные изменения при закрытии раздела"""
+        if event.widget is self.widget:
+            self.flush()
+            _binders.discard(self)
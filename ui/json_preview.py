@@ -1,8 +1,8 @@
 import tkinter as tk
-import json
 
 from ui.constants import *
-from utils.json_handler import load_config, get_full_config
+from utils.json_handler import load_config
+from utils.config_serializer import config_texts
 
 class JsonPreviewFrame(tk.Frame):
     def __init__(self, parent, section_name):
@@ -81,21 +81,20 @@ class JsonPreviewFrame(tk.Frame):
         
         # Определяем, какие данные показывать
         if view_mode == "full":
-            # Загружаем полную конфигурацию из памяти
-            config_data = get_full_config()
             self.header.config(text="JSON Preview: Полный конфиг")
+            # Фрагменты текста по разделам из кэша (пересчитываются только измененные)
+            chunks = config_texts.iter_document()
         else:
             # Загружаем только текущий раздел из памяти
-            config_data = load_config(self.section_name)
+            load_config(self.section_name)
             self.header.config(text=f"JSON Preview: {self.section_name}")
-        
-        # Форматируем JSON с отступами для читаемости
-        formatted_json = json.dumps(config_data, indent=4, ensure_ascii=False)
+            chunks = (config_texts.section_text(self.section_name),)
         
         # Разрешаем редактирование для обновления содержимого
         self.text_area.config(state=tk.NORMAL)
         self.text_area.delete(1.0, tk.END)
-        self.text_area.insert(tk.END, formatted_json)
+        for chunk in chunks:
+            self.text_area.insert(tk.END, chunk)
         self.text_area.config(state=tk.DISABLED)  # Снова запрещаем редактирование
         
         # Прокручиваем в начало
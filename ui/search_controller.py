@@ -0,0 +1,88 @@
+"""Общий контроллер поиска для полей ввода окон выбора"""
+import tkinter as tk
+
+from ui.constants import SEARCH_DEBOUNCE_MS
+
+
+class SearchController:
+    """
+    Запускает поиск по строке ввода с задержкой после последнего нажатия клавиши
+
+    Новое нажатие отменяет еще не выполненный поиск, а результат предыдущего
+    запроса передается индексу, чтобы сузить поиск при дописывании запроса.
+    """
+
+    def __init__(self, widget, variable, get_index, render, delay=SEARCH_DEBOUNCE_MS):
+        """
+        Инициализирует контроллер
+
+        Args:
+            widget: Виджет, через который планируется поиск (обычно поле ввода)
+            variable: Переменная tkinter со строкой поиска
+            get_index: Функция без аргументов, возвращающая RankedIndex
+                (или None, пока данные не загружены)
+            render: Функция, получающая SearchResult для отображения
+            delay: Задержка перед поиском (мс)
+        """
+        self.widget = widget
+        self.variable = variable
+        self.get_index = get_index
+        self.render = render
+        self.delay = delay
+        self.previous = None
+        self._after_id = None
+        self._generation = 0
+
+        self._trace_id = variable.trace_add("write", self.schedule)
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def schedule(self, *args):
+        """Планирует поиск, отменяя ранее запланированный"""
+        self._generation += 1
+        self.cancel()
+        self._after_id = self.widget.after(self.delay, self._run, self._generation)
+
+    def cancel(self):
+        """Отменяет запланированный поиск"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def run_now(self):
+        """Выполняет поиск немедленно (например, после загрузки данных)"""
+        self._generation += 1
+        self.cancel()
+        self._run(self._generation)
+
+    def reset(self):
+        """Сбрасывает результат предыдущего запроса (при смене данных поиска)"""
+        self.previous = None
+
+    def _run(self, generation):
+        """Выполняет поиск, если за время ожидания не появился более новый запрос"""
+        self._after_id = None
+        if generation != self._generation:
+            return
+
+        index = self.get_index()
+        if index is None:
+            return
+
+        result = index.query(self.variable.get(), self.previous)
+        if generation != self._generation:
+            return
+        self.previous = result
+        self.render(result)
+
+    def _on_destroy(self, event):
+        """Отменяет поиск и снимает отслеживание переменной при закрытии окна"""
+        if event.widget is not self.widget:
+            return
+        self.cancel()
+        try:
+            self.variable.trace_remove("write", self._trace_id)
+        except tk.TclError:
+            pass
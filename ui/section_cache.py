@@ -0,0 +1,121 @@
+"""Кэш построенных представлений разделов конфигурации"""
+import tkinter as tk
+from collections import OrderedDict
+
+from ui.constants import *
+from ui.sections_ui.section_factory import SectionFactory
+
+
+class SectionViewCache:
+    """
+    Хранит фреймы недавно открытых разделов, чтобы не строить их заново
+
+    Переход к разделу, который уже есть в кэше, только показывает его фрейм
+    (pack/pack_forget). Представление пересоздается, если его раздел
+    изменился не через само представление: скрытое представление удаляется
+    сразу, а отображаемое - при следующем показе (см. invalidate). Давно не
+    открывавшиеся представления удаляются, когда их больше capacity.
+    """
+
+    def __init__(self, parent, store, capacity=SECTION_CACHE_SIZE):
+        """
+        Инициализирует кэш и подписывается на изменения конфигурации
+
+        Args:
+            parent: Контейнер, в котором размещаются фреймы разделов
+            store: Хранилище конфигурации (ConfigStore)
+            capacity: Наибольшее количество хранимых представлений
+        """
+        self.parent = parent
+        self.store = store
+        self.capacity = max(1, capacity)
+        # Имя раздела -> (фрейм, объект раздела), от давно открытых к недавним
+        self._views = OrderedDict()
+        self._stale = set()
+        self.current = None
+        store.subscribe(self._on_change)
+
+    def show(self, section_name):
+        """
+        Показывает представление раздела, при необходимости создавая его
+
+        Returns:
+            Кортеж (фрейм, объект раздела)
+        """
+        self.hide()
+        if section_name in self._stale:
+            self.discard(section_name)
+
+        view = self._views.get(section_name)
+        if view is None:
+            frame = tk.Frame(self.parent, bg=DARK_SECONDARY)
+            frame.pack(fill=tk.BOTH, expand=True, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+            section = SectionFactory.create_section(
+                section_name,
+                frame,
+                self.store.get(section_name, {})
+            )
+            view = (frame, section)
+            self._views[section_name] = view
+        else:
+            view[0].pack(fill=tk.BOTH, expand=True, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
+            self._views.move_to_end(section_name)
+            view[1].on_show()
+
+        self.current = section_name
+        self._evict()
+        return view
+
+    def hide(self):
+        """Скрывает отображаемое представление (оно остается в кэше)"""
+        if self.current is None:
+            return
+        frame, section = self._views[self.current]
+        # Отложенный ввод записывается до скрытия: дальнейшие изменения раздела
+        # считаются внешними и требуют пересоздания представления
+        section.binder.flush()
+        # Скрытый раздел не продолжает фоновую работу (например, заполнение таблицы)
+        section.on_hide()
+        frame.pack_forget()
+        self.current = None
+
+    def invalidate(self, section_name):
+        """Отмечает представление устаревшим; оно будет пересоздано при следующем показе"""
+        if section_name in self._views:
+            self._stale.add(section_name)
+
+    def discard(self, section_name):
+        """Удаляет представление раздела из кэша"""
+        view = self._views.pop(section_name, None)
+        self._stale.discard(section_name)
+        if section_name == self.current:
+            self.current = None
+        if view is not None:
+            view[0].destroy()
+
+    def clear(self):
+        """Удаляет все представления"""
+        for section_name in list(self._views):
+            self.discard(section_name)
+
+    def _evict(self):
+        """Удаляет давно не открывавшиеся представления сверх capacity"""
+        for section_name in list(self._views):
+            if len(self._views) <= self.capacity:
+                break
+            if section_name != self.current:
+                self.discard(section_name)
+
+    def _on_change(self, section, key):
+        """Удаляет или отмечает устаревшими представления, раздел которых изменился"""
+        names = list(self._views) if section is None else [section]
+        for section_name in names:
+            if section_name not in self._views:
+                continue
+            if section_name == self.current and section is not None:
+                # Изменение через отображаемое представление - оно уже актуально
+                continue
+            if section_name == self.current:
+                self._stale.add(section_name)
+            else:
+                self.discard(section_name)
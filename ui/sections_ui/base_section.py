@@ -3,6 +3,7 @@ from tkinter import ttk
 from ui.constants import *
 from utils.config_manager import update_memory_config
 from utils.memory_storage import memory_config
+from ui.field_binder import FieldBinder, convert_like
 
 class BaseSection:
     """Базовый класс для всех разделов конфигурации"""
@@ -20,6 +21,8 @@ class BaseSection:
         self.section_name = section_name
         self.config_data = config_data if config_data is not None else {}
         self.fields = {}  # Инициализация словаря для хранения полей ввода
+        # Отложенная запись полей ввода (одна запись на поле после паузы в наборе)
+        self.binder = FieldBinder(parent)
         
     def setup_ui(self):
         """Метод для настройки пользовательского интерфейса раздела"""
@@ -32,6 +35,14 @@ class BaseSection:
         )
         message.pack(expand=True)
         
+    def on_show(self):
+        """Вызывается при повторном показе представления раздела из кэша"""
+        pass
+    
+    def on_hide(self):
+        """Вызывается при скрытии представления раздела (переход в другой раздел)"""
+        pass
+        
     def on_field_change(self, key, value, delete=False):
         """
         Обрабатывает изменение поля в конфигурации
@@ -41,18 +52,22 @@ class BaseSection:
             value: Новое значение поля (None для удаления)
             delete: Если True, поле будет удалено из конфигурации
         """
-        # Убедимся, что раздел существует в памяти
-        if self.section_name not in memory_config:
-            memory_config[self.section_name] = {}
+        # Повторная запись равного значения не считается изменением. Разделы
+        # передают новые объекты: значение, измененное на месте, журнал отмены
+        # не смог бы восстановить
+        section = memory_config.get(self.section_name)
+        if (not delete and isinstance(section, dict) and key in section
+                and section[key] == value):
+            return
         
+        # Изменения проходят через хранилище, чтобы оно отметило ключ измененным
         if delete:
-            if key in memory_config[self.section_name]:
-                del memory_config[self.section_name][key]
+            memory_config.delete_value(self.section_name, key)
         else:
-            memory_config[self.section_name][key] = value
+            memory_config.set_value(self.section_name, key, value)
         
         # Обновляем локальные данные для отображения в UI
-        self.config_data = memory_config[self.section_name]
+        self.config_data = memory_config.get(self.section_name, {})
     
     def collect_field_data(self):
         """Собирает данные из полей ввода и преобразует их в соответствующие типы"""
@@ -60,31 +75,8 @@ class BaseSection:
         
         for key, var in self.fields.items():
             if isinstance(var, tk.Variable):
-                value = var.get()
-                
                 # Преобразуем значения обратно в соответствующие типы
-                original_value = self.config_data[key]
-                if isinstance(original_value, bool):
-                    updated_data[key] = bool(value)
-                elif isinstance(original_value, int):
-                    try:
-                        updated_data[key] = int(value)
-                    except ValueError:
-                        updated_data[key] = 0
-                elif isinstance(original_value, float):
-                    try:
-                        updated_data[key] = float(value)
-                    except ValueError:
-                        updated_data[key] = 0.0
-                elif isinstance(original_value, list):
-                    # Разделяем строку по запятым
-                    items = [item.strip() for item in value.split(",")]
-                    if all(item.isdigit() for item in items if item):
-                        updated_data[key] = [int(item) for item in items if item]
-                    else:
-                        updated_data[key] = items
-                else:
-                    updated_data[key] = value
+                updated_data[key] = convert_like(self.config_data[key], var.get())
             else:
                 # Для сложных типов, которые не являются переменными tk
                 updated_data[key] = var
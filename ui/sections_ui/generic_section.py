@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from ui.constants import *
 from ui.sections_ui.base_section import BaseSection
+from ui.field_binder import typed_converter
 
 class GenericSection(BaseSection):
     """Универсальный класс для отображения разделов без специальной обработки"""
@@ -20,17 +21,17 @@ class GenericSection(BaseSection):
             if isinstance(value, bool):
                 var = tk.BooleanVar(value=value)
                 field = ttk.Checkbutton(self.parent, variable=var)
-                field.configure(command=lambda k=key, v=var: self.on_field_change(k, v))
+                field.configure(command=lambda k=key, v=var: self.on_field_change(k, v.get()))
                 self.fields[key] = var
             elif isinstance(value, int):
                 var = tk.StringVar(value=str(value))
                 field = ttk.Entry(self.parent, textvariable=var, width=20)
-                var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                 self.fields[key] = var
             elif isinstance(value, float):
                 var = tk.StringVar(value=str(value))
                 field = ttk.Entry(self.parent, textvariable=var, width=20)
-                var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                 self.fields[key] = var
             elif isinstance(value, dict):
                 # Для словарей создаем кнопку редактирования вложенного словаря
@@ -41,12 +42,12 @@ class GenericSection(BaseSection):
             elif isinstance(value, list):
                 var = tk.StringVar(value=", ".join(map(str, value)))
                 field = ttk.Entry(self.parent, textvariable=var, width=40)
-                var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                 self.fields[key] = var
             else:  # строка и другие типы
                 var = tk.StringVar(value=str(value))
                 field = ttk.Entry(self.parent, textvariable=var, width=40)
-                var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                 self.fields[key] = var
             
             field.grid(row=row, column=1, sticky="w", padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
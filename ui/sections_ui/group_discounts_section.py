@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from ui.constants import *
 from ui.sections_ui.base_section import BaseSection
-from utils.config_manager import update_memory_config
 
 class GroupDiscountsSection(BaseSection):
     
@@ -153,16 +152,13 @@ class GroupDiscountsSection(BaseSection):
             return
         
         # Сохраняем группу
-        self.config_data[group_name] = discount
+        self.on_field_change(group_name, discount)
         
         # Обновляем таблицу
         self.display_groups()
         
         # Закрываем диалог
         dialog.destroy()
-        
-        # Обновляем данные в памяти
-        self.on_field_change(group_name, discount)
     
     def edit_group_discount(self, event):
         """Редактирует скидку группы по двойному клику"""
@@ -229,16 +225,13 @@ class GroupDiscountsSection(BaseSection):
     def save_group_discount(self, group_name, discount, dialog):
         """Сохраняет изменение скидки группы"""
         # Обновляем скидку
-        self.config_data[group_name] = discount
+        self.on_field_change(group_name, discount)
         
         # Обновляем таблицу
         self.display_groups()
         
         # Закрываем диалог
         dialog.destroy()
-        
-        # Обновляем данные в памяти
-        self.on_field_change(group_name, discount)
     
     def delete_selected_group(self):
         """Удаляет выбранную группу"""
@@ -258,7 +251,6 @@ class GroupDiscountsSection(BaseSection):
         """Удаляет группу скидки"""
         if messagebox.askyesno("Подтверждение", f"Удалить скидку для группы '{group_name}'?"):
             if group_name in self.config_data:
-                del self.config_data[group_name]
                 self.on_field_change(group_name, None, delete=True)
                 self.display_groups()
     
@@ -266,19 +258,7 @@ class GroupDiscountsSection(BaseSection):
         """Обновляет процент скидки для группы"""
         try:
             discount = int(var.get())
-            self.config_data[group_name] = discount
             self.on_field_change(group_name, discount)
         except ValueError:
             # Игнорируем некорректные значения
             pass
-    
-    def on_field_change(self, key, value, delete=False):
-        """Обновляет данные в конфигурации"""
-        if delete:
-            if key in self.config_data:
-                del self.config_data[key]
-        else:
-            self.config_data[key] = value
-        
-        # Обновляем данные в памяти
-        update_memory_config(self.section_name, self.config_data)
\ No newline at end of file
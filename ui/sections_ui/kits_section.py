@@ -3,6 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 from ui.constants import *
 from ui.sections_ui.base_section import BaseSection
 from ui.dialogs.add_kit_dialog import AddKitDialog
+from ui.widgets.virtual_treeview import VirtualTreeview
+from ui.table_populator import TablePopulator
 from utils.memory_storage import memory_config
 
 class KitsSection(BaseSection):
@@ -79,7 +81,11 @@ class KitsSection(BaseSection):
         
         # Определяем колонки таблицы
         columns = ("id", "title", "price", "items", "commands")
-        self.kits_tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=15)
+        # Строки таблицы создаются только для видимой области
+        self.kits_tree = VirtualTreeview(table_frame, columns=columns, height=15)
+        self.kits_populator = TablePopulator(self.kits_tree.tree)
+        # Заполнение, прерванное скрытием раздела (см. on_hide)
+        self._fill_pending = False
         
         # Настраиваем заголовки и ширину колонок
         self.kits_tree.heading("id", text="ID набора")
@@ -94,17 +100,8 @@ class KitsSection(BaseSection):
         self.kits_tree.column("items", width=120)
         self.kits_tree.column("commands", width=150)
         
-        # Добавляем скроллбары
-        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.kits_tree.yview)
-        self.kits_tree.configure(yscrollcommand=y_scrollbar.set)
-        
-        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.kits_tree.xview)
-        self.kits_tree.configure(xscrollcommand=x_scrollbar.set)
-        
-        # Размещаем элементы на фрейме
-        self.kits_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        # Размещаем таблицу на фрейме (скроллбары входят в VirtualTreeview)
+        self.kits_tree.pack(fill=tk.BOTH, expand=True)
         
         # Обновляем таблицу
         self.update_kits_list()
@@ -114,31 +111,42 @@ class KitsSection(BaseSection):
 
     def update_kits_list(self):
         """Обновляет список наборов в таблице"""
-        # Очищаем таблицу
-        for item in self.kits_tree.get_children():
-            self.kits_tree.delete(item)
-        
         # Получаем данные о наборах из памяти
         kits_data = memory_config.get("Kits", {})
         
-        # Заполняем таблицу
-        for kit_id, kit_data in kits_data.items():
-            title = kit_data.get("Title", "")
-            price = kit_data.get("Price", 0)
-            items_count = len(kit_data.get("Items", []))
-            commands_count = len(kit_data.get("ConsoleCommands", []))
-            
-            self.kits_tree.insert("", "end", values=(kit_id, title, price, items_count, commands_count))
+        # Большие списки строятся порциями (см. ShopItemsSection.populate_items_tree)
+        self.kits_populator.start(
+            list(kits_data.items()),
+            self.build_kit_row,
+            on_done=lambda rows, keys: self.kits_tree.set_rows(rows, keys),
+            on_chunk=self.kits_tree.append_rows if not len(self.kits_tree) else None
+        )
+    
+    def on_hide(self):
+        """Останавливает заполнение таблицы при переходе в другой раздел"""
+        self._fill_pending = self.kits_populator.running
+        self.kits_populator.cancel()
+    
+    def on_show(self):
+        """Заново запускает заполнение таблицы, прерванное при скрытии раздела"""
+        if self._fill_pending:
+            self._fill_pending = False
+            self.update_kits_list()
+    
+    def build_kit_row(self, entry):
+        """Возвращает ключ и значения строки таблицы для пары (ID, данные набора)"""
+        kit_id, kit_data = entry
+        title = kit_data.get("Title", "")
+        price = kit_data.get("Price", 0)
+        items_count = len(kit_data.get("Items", []))
+        commands_count = len(kit_data.get("ConsoleCommands", []))
+        return kit_id, (kit_id, title, price, items_count, commands_count)
 
     def add_kit(self):
         """Открывает диалог для добавления нового набора"""
-        # Загрузка данных о предметах и динозаврах для автозаполнения
-        ark_data = self.load_ark_data()
-        
+        # Данные о предметах и динозаврах диалог берет из общего каталога
         dialog = AddKitDialog(
             self.parent,
-            items_data=ark_data.get("items", {}),
-            dinos_data=ark_data.get("creatures", {}),
             on_save=self.save_new_kit
         )
 
@@ -157,14 +165,9 @@ class KitsSection(BaseSection):
         kits_data = memory_config.get("Kits", {})
         kit_data = kits_data.get(kit_id, {})
         
-        # Загрузка данных о предметах и динозаврах для автозаполнения
-        ark_data = self.load_ark_data()
-        
-        # Открываем диалог редактирования
+        # Открываем диалог редактирования (данные для автозаполнения - из общего каталога)
         dialog = AddKitDialog(
             self.parent,
-            items_data=ark_data.get("items", {}),
-            dinos_data=ark_data.get("creatures", {}),
             on_save=lambda id, data: self.save_edited_kit(kit_id, data),
             kit_data=kit_data,
             kit_id=kit_id
@@ -188,48 +191,26 @@ class KitsSection(BaseSection):
         # Удаляем набор из памяти
         kits_data = memory_config.get("Kits", {})
         if kit_id in kits_data:
-            del kits_data[kit_id]
-            memory_config["Kits"] = kits_data
+            memory_config.delete_value("Kits", kit_id)
             self.update_kits_list()
     
     def save_new_kit(self, kit_id, kit_data):
         """Сохраняет новый набор"""
-        # Проверяем, существует ли раздел Kits
-        if "Kits" not in memory_config:
-            memory_config["Kits"] = {}
-            
         # Проверяем, существует ли уже такой набор
-        if kit_id in memory_config["Kits"]:
+        if kit_id in memory_config.get("Kits", {}):
             if not messagebox.askyesno("Подтверждение", f"Набор с ID '{kit_id}' уже существует. Перезаписать?"):
                 return
         
-        # Сохраняем набор
-        memory_config["Kits"][kit_id] = kit_data
+        # Сохраняем набор (раздел Kits создается при необходимости)
+        memory_config.set_value("Kits", kit_id, kit_data)
         
         # Обновляем список наборов
         self.update_kits_list()
     
     def save_edited_kit(self, kit_id, kit_data):
         """Сохраняет отредактированный набор"""
-        # Проверяем, существует ли раздел Kits
-        if "Kits" not in memory_config:
-            memory_config["Kits"] = {}
-        
-        # Сохраняем набор
-        memory_config["Kits"][kit_id] = kit_data
+        # Сохраняем набор (раздел Kits создается при необходимости)
+        memory_config.set_value("Kits", kit_id, kit_data)
         
         # Обновляем список наборов
         self.update_kits_list()
-    
-    def load_ark_data(self):
-        """Загружает данные о предметах и динозаврах из файла ArkData.json"""
-        import json
-        import os
-        
-        try:
-            ark_data_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "ArkData.json")
-            with open(ark_data_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except Exception as e:
-            print(f"Ошибка при загрузке данных ARK: {e}")
-            return {"items": {}, "creatures": {}}
@@ -87,8 +87,7 @@ class LoggingOptionsSection(BaseSection):
         
         # Сохраняем переменную и привязываем функцию обновления
         self.fields["Discord_Log_Webhook"] = webhook_var
-        webhook_var.trace_add("write", lambda name, index, mode: 
-                            self.on_field_change("Discord_Log_Webhook", webhook_var.get()))
+        self.binder.bind_value(webhook_var, "Discord_Log_Webhook", self.on_field_change)
     
     def setup_logging_formats(self, parent_frame):
         """Настраивает форматы сообщений журналирования"""
@@ -130,7 +129,6 @@ class LoggingOptionsSection(BaseSection):
             entry = ttk.Entry(formats_frame, textvariable=var, width=50)
             entry.grid(row=i*2+1, column=0, sticky="ew", padx=PADDING_SMALL, pady=(0, PADDING_SMALL))
             
-            # Сохраняем переменную и привязываем функцию обновления
+            # Сохраняем переменную; формат записывается после паузы в наборе
             self.fields[key] = var
-            var.trace_add("write", lambda name, index, mode, key=key, var=var: 
-                        self.on_field_change(key, var.get()))
+            self.binder.bind_value(var, key, self.on_field_change)
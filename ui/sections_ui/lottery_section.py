@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, colorchooser
 from ui.constants import *
 from ui.sections_ui.base_section import BaseSection
+from ui.field_binder import typed_converter
 
 class LotterySection(BaseSection):
     def setup_ui(self):
@@ -48,22 +49,22 @@ class LotterySection(BaseSection):
                 if isinstance(value, bool):
                     var = tk.BooleanVar(value=value)
                     field = ttk.Checkbutton(settings_frame, variable=var)
-                    field.configure(command=lambda k=key, v=var: self.on_field_change(k, v))
+                    field.configure(command=lambda k=key, v=var: self.on_field_change(k, v.get()))
                     self.lottery_fields[key] = var
                 elif isinstance(value, int):
                     var = tk.StringVar(value=str(value))
                     field = ttk.Entry(settings_frame, textvariable=var, width=20)
-                    var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                    self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                     self.lottery_fields[key] = var
                 elif isinstance(value, float):
                     var = tk.StringVar(value=str(value))
                     field = ttk.Entry(settings_frame, textvariable=var, width=20)
-                    var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                    self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                     self.lottery_fields[key] = var
                 elif isinstance(value, str):
                     var = tk.StringVar(value=value)
                     field = ttk.Entry(settings_frame, textvariable=var, width=40)
-                    var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+                    self.binder.bind_value(var, key, self.on_field_change, typed_converter(value))
                     self.lottery_fields[key] = var
                 
                 field.grid(row=row, column=1, sticky="w", padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
@@ -218,9 +219,8 @@ class LotterySection(BaseSection):
                 "preview": color_preview
             }
             
-            # Добавляем обновление при изменении текста
-            text_var.trace_add("write", lambda *args, k=message_key: 
-                              self.update_lottery_message(k))
+            # Текст записывается в конфигурацию после паузы в наборе
+            self.binder.bind(text_var, message_key, lambda k=message_key: self.update_lottery_message(k))
             
             # Добавляем обновление при изменении цвета
             r_var.trace_add("write", lambda *args, k=message_key, p=color_preview, 
@@ -272,9 +272,9 @@ class LotterySection(BaseSection):
             color_hex = f'#{r:02x}{g:02x}{b:02x}'
             preview_widget.config(bg=color_hex)
             
-            # Если указан ключ сообщения, обновляем конфигурацию
+            # Если указан ключ сообщения, обновляем конфигурацию после паузы в наборе
             if message_key:
-                self.update_lottery_message(message_key)
+                self.binder.schedule(message_key, lambda: self.update_lottery_message(message_key))
         except ValueError:
             pass  # Игнорируем некорректные значения
     
@@ -299,22 +299,19 @@ class LotterySection(BaseSection):
             # По умолчанию белый, если некорректные значения
             red, green, blue = 255, 255, 255
         
-        # Обновляем конфигурацию в памяти
-        if "Messages" not in self.config_data:
-            self.config_data["Messages"] = {}
-            
-        if message_key not in self.config_data["Messages"]:
-            self.config_data["Messages"][message_key] = {}
-            
-        self.config_data["Messages"][message_key]["Text"] = text
-        self.config_data["Messages"][message_key]["Color"] = {
+        # Собираем новый словарь сообщений (прежний остается в журнале отмены)
+        messages = dict(self.config_data.get("Messages", {}))
+        message = dict(messages.get(message_key, {}))
+        message["Text"] = text
+        message["Color"] = {
             "Red": red,
             "Green": green,
             "Blue": blue
         }
+        messages[message_key] = message
         
         # Обновляем данные в памяти
-        self.on_field_change("Messages", self.config_data["Messages"])
+        self.on_field_change("Messages", messages)
     
     def collect_field_data(self):
         """Собирает данные из полей ввода с учетом специальной обработки для лотереи"""
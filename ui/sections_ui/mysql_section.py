@@ -57,7 +57,7 @@ class MySQLSection(BaseSection):
             
             # Сохраняем переменную и привязываем функцию обновления
             self.fields[key] = var
-            var.trace_add("write", lambda name, index, mode, key=key, var=var: self.update_field(key, var))
+            self.binder.bind(var, key, lambda key=key, var=var: self.update_field(key, var))
             
             row += 1
     
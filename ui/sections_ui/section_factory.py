@@ -1,23 +1,65 @@
-from ui.sections_ui.mysql_section import MySQLSection
-from ui.sections_ui.timed_points_section import TimedPointsSection
-from ui.sections_ui.points_stealing_section import PointsStealingSection
-from ui.sections_ui.lottery_section import LotterySection
-from ui.sections_ui.logging_options_section import LoggingOptionsSection
-from ui.sections_ui.shop_ui_section import ShopUISection
-from ui.sections_ui.shop_settings_section import ShopSettingsSection
-from ui.sections_ui.group_discounts_section import GroupDiscountsSection
-from ui.sections_ui.messages_section import MessagesSection
-from ui.sections_ui.notifications_section import NotificationsSection
-from ui.sections_ui.shop_items_section import ShopItemsSection
-from ui.sections_ui.kits_section import KitsSection
-from ui.sections_ui.generic_section import GenericSection
+import importlib
 from utils.memory_storage import memory_config
 
+# Разделы со специальным интерфейсом: имя раздела -> (модуль, класс).
+# Модуль раздела (и его диалоги) импортируется только при первом отображении
+SECTION_MODULES = {
+    "MySQL": ("ui.sections_ui.mysql_section", "MySQLSection"),
+    "Timed_Points": ("ui.sections_ui.timed_points_section", "TimedPointsSection"),
+    "Points_Stealing_On_Player_Kills": ("ui.sections_ui.points_stealing_section", "PointsStealingSection"),
+    "Lottery": ("ui.sections_ui.lottery_section", "LotterySection"),
+    "Logging_Options": ("ui.sections_ui.logging_options_section", "LoggingOptionsSection"),
+    "Shop_UI": ("ui.sections_ui.shop_ui_section", "ShopUISection"),
+    "ShopSettings": ("ui.sections_ui.shop_settings_section", "ShopSettingsSection"),
+    "Group_Discounts": ("ui.sections_ui.group_discounts_section", "GroupDiscountsSection"),
+    "Messages": ("ui.sections_ui.messages_section", "MessagesSection"),
+    "Notifications": ("ui.sections_ui.notifications_section", "NotificationsSection"),
+    "ShopItems": ("ui.sections_ui.shop_items_section", "ShopItemsSection"),
+    "Kits": ("ui.sections_ui.kits_section", "KitsSection"),
+}
+
+# Класс для разделов без специальной обработки
+GENERIC_SECTION = ("ui.sections_ui.generic_section", "GenericSection")
+
 class SectionFactory:
     """Фабрика для создания объектов разделов на основе имени раздела"""
     
+    # Загруженные классы разделов: (модуль, класс) -> класс
+    _classes = {}
+    
     @staticmethod
-    def create_section(section_name, parent_frame, config_data):
+    def register_section(section_name, module_name, class_name):
+        """
+        Регистрирует класс интерфейса раздела
+        
+        Args:
+            section_name: Имя раздела
+            module_name: Полное имя модуля с классом раздела
+            class_name: Имя класса, наследующего от BaseSection
+        """
+        SECTION_MODULES[section_name] = (module_name, class_name)
+    
+    @classmethod
+    def get_section_class(cls, section_name):
+        """
+        Возвращает класс раздела, импортируя его модуль при первом обращении
+        
+        Args:
+            section_name: Имя раздела
+        
+        Returns:
+            Класс, наследующий от BaseSection
+        """
+        location = SECTION_MODULES.get(section_name, GENERIC_SECTION)
+        section_class = cls._classes.get(location)
+        if section_class is None:
+            module_name, class_name = location
+            section_class = getattr(importlib.import_module(module_name), class_name)
+            cls._classes[location] = section_class
+        return section_class
+    
+    @classmethod
+    def create_section(cls, section_name, parent_frame, config_data):
         """
         Создает и возвращает соответствующий объект раздела на основе имени раздела
         
@@ -38,33 +80,7 @@ class SectionFactory:
             
             # Обновляем memory_config
             memory_config[section_name] = config_data
-            
-        if section_name == "MySQL":
-            section = MySQLSection(parent_frame, section_name, config_data)
-        elif section_name == "Timed_Points":
-            section = TimedPointsSection(parent_frame, section_name, config_data)
-        elif section_name == "Points_Stealing_On_Player_Kills":
-            section = PointsStealingSection(parent_frame, section_name, config_data)
-        elif section_name == "Lottery":
-            section = LotterySection(parent_frame, section_name, config_data)
-        elif section_name == "Logging_Options":
-            section = LoggingOptionsSection(parent_frame, section_name, config_data)
-        elif section_name == "Shop_UI":
-            section = ShopUISection(parent_frame, section_name, config_data)
-        elif section_name == "ShopSettings":
-            section = ShopSettingsSection(parent_frame, section_name, config_data)
-        elif section_name == "Group_Discounts":
-            section = GroupDiscountsSection(parent_frame, section_name, config_data)
-        elif section_name == "Messages":
-            section = MessagesSection(parent_frame, section_name, config_data)
-        elif section_name == "Notifications":
-            section = NotificationsSection(parent_frame, section_name, config_data)
-        elif section_name == "ShopItems":
-            section = ShopItemsSection(parent_frame, section_name, config_data)
-        elif section_name == "Kits":
-            section = KitsSection(parent_frame, section_name, config_data)
-        else:
-            section = GenericSection(parent_frame, section_name, config_data)
-            
+        
+        section = cls.get_section_class(section_name)(parent_frame, section_name, config_data)
         section.setup_ui()
         return section
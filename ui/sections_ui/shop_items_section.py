@@ -1,10 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import json
-import os
 from ui.constants import *
 from ui.sections_ui.base_section import BaseSection
 from ui.dialogs.shop_item_dialog import ShopItemDialog
+from ui.widgets.virtual_treeview import VirtualTreeview
+from ui.table_populator import TablePopulator
+from utils.ark_catalog import get_ark_data
 from utils.memory_storage import memory_config
 
 class ShopItemsSection(BaseSection):
@@ -12,10 +13,6 @@ class ShopItemsSection(BaseSection):
     
     def setup_ui(self):
         """Настройка интерфейса для ShopItemsSection"""
-        # Загружаем данные о предметах из файла ArkData.json
-        self.ark_data = {}
-        self.load_ark_data()
-        
         # Создаем основной контейнер
         main_frame = tk.Frame(self.parent, bg=DARK_SECONDARY)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=PADDING_MEDIUM, pady=PADDING_MEDIUM)
@@ -42,9 +39,12 @@ class ShopItemsSection(BaseSection):
         list_frame = tk.Frame(main_frame, bg=DARK_SECONDARY)
         list_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Создаем таблицу предметов
+        # Создаем таблицу предметов (строки создаются только для видимой области)
         columns = ("id", "name", "price", "category", "description")
-        self.items_tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=10)
+        self.items_tree = VirtualTreeview(list_frame, columns=columns, height=10)
+        self.items_populator = TablePopulator(self.items_tree.tree)
+        # Заполнение, прерванное скрытием раздела (см. on_hide)
+        self._fill_pending = False
         
         # Настраиваем заголовки колонок
         self.items_tree.heading("id", text="ID")
@@ -60,18 +60,8 @@ class ShopItemsSection(BaseSection):
         self.items_tree.column("category", width=150)
         self.items_tree.column("description", width=300)
         
-        # Добавление вертикальной прокрутки
-        vsb = ttk.Scrollbar(list_frame, orient="vertical", command=self.items_tree.yview)
-        self.items_tree.configure(yscrollcommand=vsb.set)
-        
-        # Добавление горизонтальной прокрутки
-        hsb = ttk.Scrollbar(list_frame, orient="horizontal", command=self.items_tree.xview)
-        self.items_tree.configure(xscrollcommand=hsb.set)
-        
-        # Размещаем таблицу и полосы прокрутки
-        self.items_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        vsb.pack(side=tk.RIGHT, fill=tk.Y)
-        hsb.pack(side=tk.BOTTOM, fill=tk.X)
+        # Размещаем таблицу (полосы прокрутки входят в VirtualTreeview)
+        self.items_tree.pack(fill=tk.BOTH, expand=True)
         
         # Привязываем двойной клик для редактирования
         self.items_tree.bind("<Double-1>", lambda e: self.edit_shop_item())
@@ -110,41 +100,47 @@ class ShopItemsSection(BaseSection):
         # Заполняем таблицу предметами из конфигурации
         self.populate_items_tree()
     
-    def load_ark_data(self):
-        """Загружает данные о предметах из ArkData.json"""
-        try:
-            data_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "ArkData.json")
-            if os.path.exists(data_path):
-                with open(data_path, 'r', encoding='utf-8') as file:
-                    self.ark_data = json.load(file)
-        except Exception as e:
-            print(f"Ошибка при загрузке данных из ArkData.json: {e}")
-            self.ark_data = {"items": {}, "creatures": {}}
-    
     def populate_items_tree(self):
         """Заполняет таблицу предметами из конфигурации"""
-        # Очищаем таблицу
-        for item in self.items_tree.get_children():
-            self.items_tree.delete(item)
-        
         # Получаем предметы из конфигурации
         shop_items = memory_config.get("ShopItems", {})
         
-        # Заполняем таблицу данными
-        for item_id, item_data in shop_items.items():
-            categories = ", ".join(item_data.get("Categories", []))
-            self.items_tree.insert("", "end", values=(
-                item_id,
-                item_data.get("Title", ""),
-                item_data.get("Price", 0),
-                categories,
-                item_data.get("Description", "")
-            ))
+        # Большие списки строятся порциями; пустая таблица показывает строки по мере готовности,
+        # а заполненная заменяет данные целиком по окончании (сохраняя прокрутку и выделение)
+        self.items_populator.start(
+            list(shop_items.items()),
+            self.build_item_row,
+            on_done=lambda rows, keys: self.items_tree.set_rows(rows, keys),
+            on_chunk=self.items_tree.append_rows if not len(self.items_tree) else None
+        )
+    
+    def on_hide(self):
+        """Останавливает заполнение таблицы при переходе в другой раздел"""
+        self._fill_pending = self.items_populator.running
+        self.items_populator.cancel()
+    
+    def on_show(self):
+        """Заново запускает заполнение таблицы, прерванное при скрытии раздела"""
+        if self._fill_pending:
+            self._fill_pending = False
+            self.populate_items_tree()
+    
+    def build_item_row(self, entry):
+        """Возвращает ключ и значения строки таблицы для пары (ID, данные предмета)"""
+        item_id, item_data = entry
+        categories = ", ".join(item_data.get("Categories", []))
+        return item_id, (
+            item_id,
+            item_data.get("Title", ""),
+            item_data.get("Price", 0),
+            categories,
+            item_data.get("Description", "")
+        )
     
     def add_shop_item(self):
         """Добавляет новый предмет в магазин"""
         # Открываем диалоговое окно для добавления товара
-        dialog = ShopItemDialog(self.parent, self.ark_data, self.save_new_item)
+        dialog = ShopItemDialog(self.parent, get_ark_data(), self.save_new_item)
     
     def edit_shop_item(self):
         """Редактирует выбранный предмет магазина"""
@@ -166,7 +162,7 @@ class ShopItemsSection(BaseSection):
         # Открываем диалоговое окно для редактирования товара
         dialog = ShopItemDialog(
             self.parent,
-            self.ark_data,
+            get_ark_data(),
             lambda new_id, item_data: self.save_edited_item(item_id, new_id, item_data),
             shop_items[item_id],
             item_id
@@ -182,8 +178,7 @@ class ShopItemsSection(BaseSection):
                 return
         
         # Сохраняем товар в конфигурацию
-        shop_items[item_id] = item_data
-        memory_config["ShopItems"] = shop_items
+        memory_config.set_value("ShopItems", item_id, item_data)
         
         # Обновляем таблицу
         self.populate_items_tree()
@@ -199,13 +194,14 @@ class ShopItemsSection(BaseSection):
             if not messagebox.askyesno("Предупреждение", f"Товар с ID '{new_id}' уже существует. Перезаписать?"):
                 return
         
-        # Удаляем старый товар
-        if old_id in shop_items:
-            del shop_items[old_id]
-        
-        # Сохраняем товар с новым ID
-        shop_items[new_id] = item_data
-        memory_config["ShopItems"] = shop_items
+        # Переименование отменяется одной операцией
+        with memory_config.transaction():
+            # Удаляем старый товар
+            if old_id != new_id:
+                memory_config.delete_value("ShopItems", old_id)
+            
+            # Сохраняем товар с новым ID
+            memory_config.set_value("ShopItems", new_id, item_data)
         
         # Обновляем таблицу
         self.populate_items_tree()
@@ -242,11 +238,9 @@ class ShopItemsSection(BaseSection):
             messagebox.showerror("Ошибка", f"Предмет с ID '{new_id}' уже существует")
             return
         
-        # Копируем предмет
-        self.config_data[new_id] = self.config_data[item_id].copy()
-        
-        # Обновляем данные в памяти
-        memory_config[self.section_name] = self.config_data
+        # Копируем предмет в памяти
+        memory_config.set_value(self.section_name, new_id, self.config_data[item_id].copy())
+        self.config_data = memory_config[self.section_name]
         
         # Обновляем таблицу
         self.populate_items_tree()
@@ -268,10 +262,9 @@ class ShopItemsSection(BaseSection):
         
         # Удаляем предмет
         if item_id in self.config_data:
-            del self.config_data[item_id]
-            
             # Обновляем данные в памяти
-            memory_config[self.section_name] = self.config_data
+            memory_config.delete_value(self.section_name, item_id)
+            self.config_data = memory_config.get(self.section_name, {})
             
             # Обновляем таблицу
             self.populate_items_tree()
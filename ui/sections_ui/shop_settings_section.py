@@ -79,9 +79,9 @@ class ShopSettingsSection(BaseSection):
             entry = ttk.Entry(parent_frame, textvariable=var, width=20)
             entry.grid(row=row, column=1, sticky="w", padx=PADDING_MEDIUM, pady=PADDING_SMALL)
             
-            # Сохраняем переменную и добавляем отслеживание изменений
+            # Сохраняем переменную; команда записывается после паузы в наборе
             self.fields[key] = var
-            var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+            self.binder.bind_value(var, key, self.on_field_change)
             
             # Добавляем описание
             desc_label = tk.Label(parent_frame, text=description, 
@@ -125,7 +125,7 @@ class ShopSettingsSection(BaseSection):
             
             # Сохраняем переменную и добавляем отслеживание изменений
             self.fields[key] = var
-            var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v))
+            var.trace_add("write", lambda *args, k=key, v=var: self.on_field_change(k, v.get()))
             
             # Добавляем описание
             desc_label = tk.Label(parent_frame, text=tooltip, 
@@ -145,7 +145,7 @@ class ShopSettingsSection(BaseSection):
         
         # Сохраняем переменную и добавляем отслеживание изменений
         self.fields["Shop_Name"] = shop_name_var
-        shop_name_var.trace_add("write", lambda *args: self.on_field_change("Shop_Name", shop_name_var))
+        self.binder.bind_value(shop_name_var, "Shop_Name", self.on_field_change)
         row += 1
         
         # Путь к крио-поду
@@ -159,8 +159,7 @@ class ShopSettingsSection(BaseSection):
         
         # Сохраняем переменную и добавляем отслеживание изменений
         self.fields["Custom_Cryopod_Blueprint_Path"] = cryopod_var
-        cryopod_var.trace_add("write", lambda *args: 
-                            self.on_field_change("Custom_Cryopod_Blueprint_Path", cryopod_var))
+        self.binder.bind_value(cryopod_var, "Custom_Cryopod_Blueprint_Path", self.on_field_change)
         row += 1
         
         # Описание для пути крио-пода
@@ -242,7 +241,7 @@ class ShopSettingsSection(BaseSection):
         
         # Сохраняем переменную
         self.trading_command_var = trade_cmd_var
-        trade_cmd_var.trace_add("write", lambda *args: self.update_trading_settings())
+        self.binder.bind(trade_cmd_var, "Points_Trading", self.update_trading_settings)
         row += 1
         
         # Описание команды
@@ -257,16 +256,15 @@ class ShopSettingsSection(BaseSection):
     
     def update_trading_settings(self):
         """Обновляет настройки торговли в конфигурации"""
-        if "Points_Trading" not in self.config_data:
-            self.config_data["Points_Trading"] = {}
+        trading = dict(self.config_data.get("Points_Trading", {}))
         
         # Обновляем настройки из переменных
-        self.config_data["Points_Trading"]["Enable_Points_Trading"] = self.trading_enable_var.get()
-        self.config_data["Points_Trading"]["Allow_Only_Same_Team"] = self.trading_same_team_var.get()
-        self.config_data["Points_Trading"]["Trade_Command"] = self.trading_command_var.get()
+        trading["Enable_Points_Trading"] = self.trading_enable_var.get()
+        trading["Allow_Only_Same_Team"] = self.trading_same_team_var.get()
+        trading["Trade_Command"] = self.trading_command_var.get()
         
         # Уведомляем об изменении
-        self.on_field_change("Points_Trading", self.config_data["Points_Trading"])
+        self.on_field_change("Points_Trading", trading)
     
     def setup_ui_links(self, parent_frame):
         """Настройка UI ссылок"""
@@ -314,7 +312,7 @@ class ShopSettingsSection(BaseSection):
             
             # Сохраняем переменную
             self.ui_links_vars[key] = var
-            var.trace_add("write", lambda *args: self.update_ui_links())
+            self.binder.bind(var, "UI_Links", self.update_ui_links)
             row += 1
             
             # Добавляем описание
@@ -329,15 +327,14 @@ class ShopSettingsSection(BaseSection):
     
     def update_ui_links(self):
         """Обновляет ссылки UI в конфигурации"""
-        if "UI_Links" not in self.config_data:
-            self.config_data["UI_Links"] = {}
+        links = dict(self.config_data.get("UI_Links", {}))
         
         # Обновляем ссылки из переменных
         for key, var in self.ui_links_vars.items():
-            self.config_data["UI_Links"][key] = var.get()
+            links[key] = var.get()
         
         # Уведомляем об изменении
-        self.on_field_change("UI_Links", self.config_data["UI_Links"])
+        self.on_field_change("UI_Links", links)
     
     def setup_maga_integration(self, parent_frame):
         """Настройка интеграции с MAGA плагином"""
@@ -393,15 +390,14 @@ class ShopSettingsSection(BaseSection):
     
     def update_maga_settings(self):
         """Обновляет настройки MAGA интеграции в конфигурации"""
-        if "MAGA_Integration" not in self.config_data:
-            self.config_data["MAGA_Integration"] = {}
+        maga = dict(self.config_data.get("MAGA_Integration", {}))
         
         # Обновляем настройки из переменных
         for key, var in self.maga_vars.items():
-            self.config_data["MAGA_Integration"][key] = var.get()
+            maga[key] = var.get()
         
         # Уведомляем об изменении
-        self.on_field_change("MAGA_Integration", self.config_data["MAGA_Integration"])
+        self.on_field_change("MAGA_Integration", maga)
     
     def setup_shop_listing_text(self, parent_frame):
         """Настройка отображения текста в магазине"""
@@ -441,7 +437,7 @@ class ShopSettingsSection(BaseSection):
             
             # Сохраняем переменную
             self.listing_numeric_vars[key] = var
-            var.trace_add("write", lambda *args: self.update_listing_settings())
+            self.binder.bind(var, "Shop_Listing_Text", self.update_listing_settings)
             row += 1
             
             # Добавляем описание
@@ -487,7 +483,7 @@ class ShopSettingsSection(BaseSection):
             
             # Сохраняем переменную
             self.listing_text_vars[key] = var
-            var.trace_add("write", lambda *args: self.update_listing_settings())
+            self.binder.bind(var, "Shop_Listing_Text", self.update_listing_settings)
             row += 1
             
             # Добавляем описание
@@ -502,27 +498,26 @@ class ShopSettingsSection(BaseSection):
     
     def update_listing_settings(self):
         """Обновляет настройки отображения текста в конфигурации"""
-        if "Shop_Listing_Text" not in self.config_data:
-            self.config_data["Shop_Listing_Text"] = {}
+        listing = dict(self.config_data.get("Shop_Listing_Text", {}))
         
         # Обновляем числовые настройки
         for key, var in self.listing_numeric_vars.items():
             try:
                 # Преобразуем строку в нужный тип данных
                 if key == "Text_Size":
-                    self.config_data["Shop_Listing_Text"][key] = float(var.get())
+                    listing[key] = float(var.get())
                 else:
-                    self.config_data["Shop_Listing_Text"][key] = int(var.get())
+                    listing[key] = int(var.get())
             except ValueError:
                 # В случае ошибки преобразования сохраняем значение как строку
-                self.config_data["Shop_Listing_Text"][key] = var.get()
+                listing[key] = var.get()
         
         # Обновляем форматы текста
         for key, var in self.listing_text_vars.items():
-            self.config_data["Shop_Listing_Text"][key] = var.get()
+            listing[key] = var.get()
         
         # Уведомляем об изменении
-        self.on_field_change("Shop_Listing_Text", self.config_data["Shop_Listing_Text"])
+        self.on_field_change("Shop_Listing_Text", listing)
     
     def collect_field_data(self):
         """Собирает данные из полей ввода"""
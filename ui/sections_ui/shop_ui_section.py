@@ -165,20 +165,22 @@ class ShopUISection(BaseSection):
         # Очищаем список
         self.categories_listbox.delete(0, tk.END)
         
-        # Если в конфигурации нет категорий, создаем пустой словарь
-        if "Categories" not in self.config_data or not self.config_data["Categories"]:
-            self.config_data["Categories"] = {}
+        categories = self.config_data.get("Categories") or {}
+        
+        # Категории, заданные целым числом вместо словаря, преобразуем в словари.
+        # Запись идет через хранилище новым словарем: изменение на месте не
+        # увидели бы журнал отмены, кэш текста JSON и автосохранение
+        if not all(isinstance(category_data, dict) for category_data in categories.values()):
+            categories = {
+                category_name: category_data if isinstance(category_data, dict) else {"ID": category_data}
+                for category_name, category_data in categories.items()
+            }
+            self.on_field_change("Categories", categories)
             
         # Заполняем список категорий
-        for category_name, category_data in self.config_data["Categories"].items():
-            # Убедимся, что category_data - словарь
-            if isinstance(category_data, dict):
-                category_id = category_data.get("ID", 0)
-                self.categories_listbox.insert(tk.END, f"{category_name} (ID: {category_id})")
-            else:
-                # Если мы получили целое число вместо словаря, преобразуем его в словарь
-                self.config_data["Categories"][category_name] = {"ID": category_data}
-                self.categories_listbox.insert(tk.END, f"{category_name} (ID: {category_data})")
+        for category_name, category_data in categories.items():
+            category_id = category_data.get("ID", 0)
+            self.categories_listbox.insert(tk.END, f"{category_name} (ID: {category_id})")
         
     def add_category(self):
         """Добавляет новую категорию"""
@@ -188,14 +190,17 @@ class ShopUISection(BaseSection):
         if not category_name:  # Если пользователь нажал Отмена или не ввел имя
             return
             
+        # Копируем категории (новым словарем, чтобы журнал отмены сохранил прежний)
+        categories = dict(self.config_data.get("Categories", {}))
+        
         # Проверяем, существует ли уже такая категория
-        if category_name in self.config_data["Categories"]:
+        if category_name in categories:
             messagebox.showerror("Ошибка", f"Категория '{category_name}' уже существует.")
             return
             
         # Определяем ID для новой категории
         max_id = 0
-        for _, category_data in self.config_data["Categories"].items():
+        for _, category_data in categories.items():
             if isinstance(category_data, dict) and "ID" in category_data:
                 max_id = max(max_id, category_data["ID"])
             elif isinstance(category_data, int):
@@ -204,10 +209,10 @@ class ShopUISection(BaseSection):
         new_id = max_id + 1
         
         # Создаем новую категорию
-        self.config_data["Categories"][category_name] = {"ID": new_id}
+        categories[category_name] = {"ID": new_id}
         
         # Обновляем конфигурацию
-        self.on_field_change("Categories", self.config_data["Categories"])
+        self.on_field_change("Categories", categories)
         
         # Обновляем список категорий
         self.update_categories_list()
@@ -230,24 +235,27 @@ class ShopUISection(BaseSection):
         if not new_name:  # Если пользователь нажал Отмена или не ввел имя
             return
             
+        # Копируем категории (новым словарем, чтобы журнал отмены сохранил прежний)
+        categories = dict(self.config_data.get("Categories", {}))
+        
         # Проверяем, существует ли уже такая категория
-        if new_name != category_name and new_name in self.config_data["Categories"]:
+        if new_name != category_name and new_name in categories:
             messagebox.showerror("Ошибка", f"Категория '{new_name}' уже существует.")
             return
             
         # Получаем ID категории
-        category_data = self.config_data["Categories"][category_name]
+        category_data = categories[category_name]
         if isinstance(category_data, dict):
             category_id = category_data.get("ID", 0)
         else:
             category_id = category_data
             
         # Удаляем старую категорию и создаем новую
-        del self.config_data["Categories"][category_name]
-        self.config_data["Categories"][new_name] = {"ID": category_id}
+        del categories[category_name]
+        categories[new_name] = {"ID": category_id}
         
         # Обновляем конфигурацию
-        self.on_field_change("Categories", self.config_data["Categories"])
+        self.on_field_change("Categories", categories)
         
         # Обновляем список категорий
         self.update_categories_list()
@@ -268,11 +276,12 @@ class ShopUISection(BaseSection):
         if not messagebox.askyesno("Подтверждение", f"Вы уверены, что хотите удалить категорию '{category_name}'?"):
             return
             
-        # Удаляем категорию
-        del self.config_data["Categories"][category_name]
+        # Удаляем категорию (из нового словаря, чтобы журнал отмены сохранил прежний)
+        categories = dict(self.config_data.get("Categories", {}))
+        categories.pop(category_name, None)
         
         # Обновляем конфигурацию
-        self.on_field_change("Categories", self.config_data["Categories"])
+        self.on_field_change("Categories", categories)
         
         # Обновляем список категорий
         self.update_categories_list()
@@ -332,19 +341,14 @@ class ShopUISection(BaseSection):
             
     def update_translation_option(self, key, value):
         """Обновляет опцию перевода"""
-        if "Translatable_UI_Text" not in self.config_data:
-            self.config_data["Translatable_UI_Text"] = {}
-            
-        self.config_data["Translatable_UI_Text"][key] = value
-        self.on_field_change("Translatable_UI_Text", self.config_data["Translatable_UI_Text"])
+        # Новым словарем, чтобы журнал отмены сохранил прежний
+        translations = dict(self.config_data.get("Translatable_UI_Text", {}))
+        translations[key] = value
+        self.on_field_change("Translatable_UI_Text", translations)
         
     def update_translation(self, key, var):
         """Обновляет перевод элемента интерфейса"""
-        if "Translatable_UI_Text" not in self.config_data:
-            self.config_data["Translatable_UI_Text"] = {}
-            
-        self.config_data["Translatable_UI_Text"][key] = var.get()
-        self.on_field_change("Translatable_UI_Text", self.config_data["Translatable_UI_Text"])
+        self.update_translation_option(key, var.get())
     
     def collect_field_data(self):
         """Собирает данные из полей ввода"""
@@ -1,10 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
-import os
 from ui.constants import *
 from ui.sections_ui.base_section import BaseSection
 from ui.dialogs.shop_item_dialog import ShopItemDialog
+from ui.widgets.tree_reconciler import TreeReconciler
+from utils.ark_catalog import get_ark_data
 from utils.memory_storage import memory_config
 
 class ShopItemsSection(BaseSection):
@@ -97,6 +97,7 @@ class ShopItemsSection(BaseSection):
         self.item_table.configure(yscrollcommand=table_scroll.set)
         self.item_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         table_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.item_reconciler = TreeReconciler(self.item_table)
         
         # Добавляем обработчик двойного клика для редактирования
         self.item_table.bind("<Double-1>", self.edit_shop_item)
@@ -106,8 +107,8 @@ class ShopItemsSection(BaseSection):
     
     def add_shop_item(self):
         """Открывает диалог для добавления нового товара"""
-        # Загружаем данные из ARK Data для автозаполнения
-        ark_data = self.load_ark_data()
+        # Получаем данные из общего каталога ARK для автозаполнения
+        ark_data = get_ark_data()
         
         # Создаем диалоговое окно
         dialog = ShopItemDialog(
@@ -131,8 +132,8 @@ class ShopItemsSection(BaseSection):
             messagebox.showerror("Ошибка", f"Товар с ID {selected_id} не найден")
             return
         
-        # Загружаем данные из ARK Data для автозаполнения
-        ark_data = self.load_ark_data()
+        # Получаем данные из общего каталога ARK для автозаполнения
+        ark_data = get_ark_data()
         
         # Создаем диалоговое окно
         dialog = ShopItemDialog(
@@ -161,8 +162,7 @@ class ShopItemsSection(BaseSection):
         # Подтверждение удаления
         if messagebox.askyesno("Подтверждение", f"Вы действительно хотите удалить товар '{selected_id}'?"):
             # Удаляем товар
-            del shop_items[selected_id]
-            memory_config["ShopItems"] = shop_items
+            memory_config.delete_value("ShopItems", selected_id)
             
             # Обновляем таблицу
             self.load_shop_items()
@@ -181,8 +181,7 @@ class ShopItemsSection(BaseSection):
                 return
         
         # Сохраняем товар
-        shop_items[item_id] = item_data
-        memory_config["ShopItems"] = shop_items
+        memory_config.set_value("ShopItems", item_id, item_data)
         
         # Обновляем таблицу
         self.load_shop_items()
@@ -203,13 +202,14 @@ class ShopItemsSection(BaseSection):
             if not response:
                 return
         
-        # Удаляем старый товар
-        if old_id in shop_items:
-            del shop_items[old_id]
-        
-        # Сохраняем товар с новым ID
-        shop_items[new_id] = item_data
-        memory_config["ShopItems"] = shop_items
+        # Переименование отменяется одной операцией
+        with memory_config.transaction():
+            # Удаляем старый товар
+            if old_id != new_id:
+                memory_config.delete_value("ShopItems", old_id)
+            
+            # Сохраняем товар с новым ID
+            memory_config.set_value("ShopItems", new_id, item_data)
         
         # Обновляем таблицу
         self.load_shop_items()
@@ -219,33 +219,27 @@ class ShopItemsSection(BaseSection):
     
     def load_shop_items(self):
         """Загружает и отображает список товаров"""
-        # Очищаем таблицу
-        for item in self.item_table.get_children():
-            self.item_table.delete(item)
-        
-        # Получаем данные товаров
-        shop_items = memory_config.get("ShopItems", {})
-        
-        # Добавляем товары в таблицу
-        for item_id, item_data in shop_items.items():
-            title = item_data.get("Title", "Без названия")
-            price = item_data.get("Price", 0)
-            categories = ", ".join(item_data.get("Categories", []))
-            
-            self.item_table.insert("", "end", values=(item_id, title, price, categories))
+        self.show_items()
     
     def filter_items(self, *args):
         """Фильтрует товары по поисковому запросу"""
-        search_text = self.search_var.get().lower()
+        self.show_items(self.search_var.get().lower())
+    
+    def show_items(self, search_text=""):
+        """
+        Приводит таблицу к списку товаров, подходящих под запрос
         
-        # Очищаем таблицу
-        for item in self.item_table.get_children():
-            self.item_table.delete(item)
+        Строки сопоставляются с товарами по ID, поэтому изменяются только строки
+        добавленных, удаленных и измененных товаров, а выделение сохраняется.
         
+        Args:
+            search_text: Строка поиска в нижнем регистре (пустая - все товары)
+        """
         # Получаем данные товаров
         shop_items = memory_config.get("ShopItems", {})
         
-        # Фильтруем и добавляем товары в таблицу
+        rows = []
+        keys = []
         for item_id, item_data in shop_items.items():
             title = item_data.get("Title", "Без названия")
             price = item_data.get("Price", 0)
@@ -255,21 +249,10 @@ class ShopItemsSection(BaseSection):
             if (search_text in item_id.lower() or 
                 search_text in title.lower() or 
                 search_text in categories.lower()):
-                self.item_table.insert("", "end", values=(item_id, title, price, categories))
-    
-    def load_ark_data(self):
-        """Загружает данные из файла ArkData.json"""
-        try:
-            file_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "ArkData.json"
-            )
-            
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except Exception as e:
-            print(f"Ошибка при загрузке ArkData: {e}")
-            return {"items": {}, "creatures": {}}
+                rows.append((item_id, title, price, categories))
+                keys.append(item_id)
+        
+        self.item_reconciler.reconcile(rows, keys)
     
     def refresh(self):
         """Обновляет содержимое секции"""
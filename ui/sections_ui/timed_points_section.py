@@ -203,8 +203,8 @@ class TimedPointsSection(BaseSection):
             messagebox.showerror("Ошибка", "Очки должны быть целым числом")
             return
         
-        # Получаем текущие группы или создаем пустой словарь
-        groups = self.config_data.get("Groups", {})
+        # Копируем текущие группы (новым словарем, чтобы журнал отмены сохранил прежний)
+        groups = dict(self.config_data.get("Groups", {}))
         
         # Добавляем или обновляем группу
         groups[group_name] = points
@@ -289,8 +289,8 @@ class TimedPointsSection(BaseSection):
             messagebox.showerror("Ошибка", "Очки должны быть целым числом")
             return
         
-        # Получаем текущие группы
-        groups = self.config_data.get("Groups", {})
+        # Копируем текущие группы (новым словарем, чтобы журнал отмены сохранил прежний)
+        groups = dict(self.config_data.get("Groups", {}))
         
         # Обновляем группу
         groups[group_name] = points
@@ -318,8 +318,8 @@ class TimedPointsSection(BaseSection):
         
         # Запрашиваем подтверждение
         if messagebox.askyesno("Подтверждение", f"Вы уверены, что хотите удалить группу '{group_name}'?"):
-            # Получаем текущие группы
-            groups = self.config_data.get("Groups", {})
+            # Копируем текущие группы (новым словарем, чтобы журнал отмены сохранил прежний)
+            groups = dict(self.config_data.get("Groups", {}))
             
             # Удаляем группу
             if group_name in groups:
@@ -0,0 +1,65 @@
+"""Строка состояния в нижней панели главного окна"""
+import tkinter as tk
+
+from ui.constants import *
+
+# Метка строки состояния (создается главным окном)
+_status_label = None
+
+# Метка индикатора сохранения конфигурации
+_save_label = None
+
+
+def create_status_bar(parent):
+    """
+    Создает метку строки состояния в нижней панели
+
+    Args:
+        parent: Нижняя панель главного окна
+
+    Returns:
+        Экземпляр tk.Label
+    """
+    global _status_label
+    _status_label = tk.Label(parent, text="", font=FONT_SMALL, fg=GRAY_TEXT, bg=DARK_SECONDARY, anchor="w")
+    return _status_label
+
+
+def show_status(text):
+    """Показывает текст в строке состояния (без главного окна ничего не делает)"""
+    if _status_label is None:
+        return
+    try:
+        _status_label.configure(text=text)
+    except tk.TclError:
+        pass
+
+
+def clear_status():
+    """Очищает строку состояния"""
+    show_status("")
+
+
+def create_save_indicator(parent):
+    """
+    Создает метку индикатора сохранения в нижней панели
+
+    Args:
+        parent: Нижняя панель главного окна
+
+    Returns:
+        Экземпляр tk.Label
+    """
+    global _save_label
+    _save_label = tk.Label(parent, text="", font=FONT_SMALL, fg=GRAY_TEXT, bg=DARK_SECONDARY, anchor="e")
+    return _save_label
+
+
+def show_save_state(text):
+    """Показывает состояние сохранения конфигурации"""
+    if _save_label is None:
+        return
+    try:
+        _save_label.configure(text=text)
+    except tk.TclError:
+        pass
@@ -0,0 +1,132 @@
+"""Заполнение больших таблиц порциями в паузах главного цикла tkinter"""
+import tkinter as tk
+
+from ui.constants import POPULATE_CHUNK_ROWS, POPULATE_TEXT
+from ui.status_bar import show_status, clear_status
+
+
+class TablePopulator:
+    """
+    Строит строки таблицы порциями, не блокируя окно
+
+    Каждая порция выполняется в простое главного цикла (after(0) + after_idle),
+    поэтому между порциями обрабатываются ввод и перерисовка. Ход заполнения
+    показывается в строке состояния. Заполнение отменяется новым вызовом
+    start(), вызовом cancel() (например, при переходе в другой раздел, см.
+    BaseSection.on_hide) или уничтожением виджета.
+    """
+
+    def __init__(self, widget, chunk_size=POPULATE_CHUNK_ROWS, text=POPULATE_TEXT):
+        """
+        Инициализирует заполнение
+
+        Args:
+            widget: Виджет таблицы, через который планируются порции
+            chunk_size: Количество записей в одной порции
+            text: Текст строки состояния во время заполнения
+        """
+        self.widget = widget
+        self.chunk_size = chunk_size
+        self.text = text
+        self.build_row = None
+        self._after_id = None
+        self._items = None
+        self._rows = None
+        self._keys = None
+        self._done = 0
+        self._on_chunk = None
+        self._on_done = None
+
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    @property
+    def running(self):
+        """Выполняется ли заполнение"""
+        return self._items is not None
+
+    def start(self, items, build_row, on_done, on_chunk=None):
+        """
+        Запускает заполнение (ранее запущенное отменяется)
+
+        Если записей не больше одной порции, строки строятся сразу.
+
+        Args:
+            items: Список записей
+            build_row: Функция записи, возвращающая (ключ, значения строки)
+            on_done: Функция (строки, ключи), получающая все строки по окончании
+            on_chunk: Функция (строки, ключи), получающая строки каждой порции
+                (например, для показа первых строк до окончания заполнения)
+        """
+        self.cancel()
+        self.build_row = build_row
+        if len(items) <= self.chunk_size:
+            rows, keys = self._build(items)
+            on_done(rows, keys)
+            return
+
+        self._items = items
+        self._rows = []
+        self._keys = []
+        self._done = 0
+        self._on_chunk = on_chunk
+        self._on_done = on_done
+        self._schedule()
+
+    def cancel(self):
+        """Отменяет заполнение"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        if self._items is not None:
+            self._items = None
+            clear_status()
+
+    def _build(self, items):
+        rows = []
+        keys = []
+        for item in items:
+            key, values = self.build_row(item)
+            keys.append(key)
+            rows.append(values)
+        return rows, keys
+
+    def _schedule(self):
+        """Планирует следующую порцию после обработки ожидающих событий"""
+        self._after_id = self.widget.after(0, self._schedule_idle)
+
+    def _schedule_idle(self):
+        self._after_id = self.widget.after_idle(self._step)
+
+    def _step(self):
+        """Строит одну порцию строк"""
+        self._after_id = None
+        items = self._items
+        if items is None:
+            return
+
+        chunk = items[self._done:self._done + self.chunk_size]
+        rows, keys = self._build(chunk)
+        self._rows.extend(rows)
+        self._keys.extend(keys)
+        self._done += len(chunk)
+        if self._on_chunk is not None:
+            self._on_chunk(rows, keys)
+
+        if self._done < len(items):
+            show_status(f"{self.text}: {self._done} из {len(items)}")
+            self._schedule()
+            return
+
+        rows, keys, on_done = self._rows, self._keys, self._on_done
+        self._items = self._rows = self._keys = None
+        self._on_chunk = self._on_done = None
+        clear_status()
+        on_done(rows, keys)
+
+    def _on_destroy(self, event):
+        """Отменяет заполнение при уничтожении таблицы"""
+        if event.widget is self.widget:
+            self.cancel()
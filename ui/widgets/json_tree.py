@@ -0,0 +1,132 @@
+"""Дерево JSON с ленивым раскрытием узлов"""
+import json
+from itertools import islice
+import tkinter as tk
+from tkinter import ttk
+from ui.constants import *
+
+# Количество дочерних элементов, добавляемых в узел за одно раскрытие
+JSON_TREE_PAGE = 500
+
+# Наибольшая длина значения, отображаемого в строке дерева
+JSON_VALUE_WIDTH = 200
+
+
+def describe_value(value):
+    """
+    Возвращает краткое представление значения для колонки дерева
+
+    Args:
+        value: Значение JSON
+
+    Returns:
+        Строка: {N} для объектов, [N] для массивов, JSON-текст для остальных
+    """
+    if isinstance(value, dict):
+        return f"{{{len(value)}}}"
+    if isinstance(value, list):
+        return f"[{len(value)}]"
+    text = json.dumps(value, ensure_ascii=False)
+    if len(text) > JSON_VALUE_WIDTH:
+        text = text[:JSON_VALUE_WIDTH] + "…"
+    return text
+
+
+class JsonTreeView(tk.Frame):
+    """
+    Просмотр JSON в виде дерева ttk.Treeview
+
+    Строки создаются только для раскрытых узлов: у свернутого объекта или
+    массива есть лишь строка-заглушка, а его элементы добавляются при первом
+    раскрытии (по JSON_TREE_PAGE за раз, остальные - через строку «ещё N»).
+    """
+
+    def __init__(self, parent, data=None, bg=DARK_SECONDARY):
+        """
+        Инициализирует дерево
+
+        Args:
+            parent: Родительский виджет
+            data: Отображаемые данные (обычно словарь конфигурации)
+            bg: Цвет фона рамки
+        """
+        super().__init__(parent, bg=bg)
+        # iid узла -> значение, дочерние элементы которого еще не добавлены
+        self._pending = {}
+        # iid строки «ещё N» -> (iid узла, значение, индекс следующего элемента)
+        self._more = {}
+
+        self.tree = ttk.Treeview(self, columns=("value",), show="tree headings")
+        self.tree.heading("#0", text="Ключ")
+        self.tree.heading("value", text="Значение")
+        self.tree.column("#0", width=300, stretch=False)
+        self.tree.column("value", width=500)
+
+        y_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        x_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<Double-1>", self._on_double_click)
+
+        if data is not None:
+            self.set_data(data)
+
+    def set_data(self, data):
+        """Заменяет отображаемые данные; создаются только строки верхнего уровня"""
+        children = self.tree.get_children("")
+        if children:
+            self.tree.delete(*children)
+        self._pending = {}
+        self._more = {}
+        self._add_children("", data, 0)
+
+    def _add_node(self, parent, key, value):
+        """Добавляет строку значения; у непустого контейнера - строку-заглушку"""
+        iid = self.tree.insert(parent, "end", text=str(key), values=(describe_value(value),))
+        if isinstance(value, (dict, list)) and value:
+            self._pending[iid] = value
+            # Заглушка показывает значок раскрытия, пока элементы не добавлены
+            self.tree.insert(iid, "end")
+        return iid
+
+    def _add_children(self, parent, value, start):
+        """Добавляет очередную порцию элементов контейнера value, начиная с индекса start"""
+        if isinstance(value, dict):
+            entries = value.items()
+        elif isinstance(value, list):
+            entries = enumerate(value)
+        else:
+            return
+
+        end = start + JSON_TREE_PAGE
+        for index, (key, item) in enumerate(islice(entries, start, None), start):
+            if index >= end:
+                more = self.tree.insert(parent, "end", text=f"… ещё {len(value) - end}",
+                                        values=("двойной щелчок - показать",))
+                self._more[more] = (parent, value, end)
+                break
+            self._add_node(parent, key, item)
+
+    def _on_open(self, event):
+        """Добавляет элементы узла при первом раскрытии"""
+        iid = self.tree.focus()
+        value = self._pending.pop(iid, None)
+        if value is None:
+            return
+        self.tree.delete(*self.tree.get_children(iid))
+        self._add_children(iid, value, 0)
+
+    def _on_double_click(self, event):
+        """Показывает следующую порцию элементов по двойному щелчку на строке «ещё N»"""
+        iid = self.tree.identify_row(event.y)
+        entry = self._more.pop(iid, None)
+        if entry is None:
+            return
+        parent, value, start = entry
+        self.tree.delete(iid)
+        self._add_children(parent, value, start)
+        return "break"
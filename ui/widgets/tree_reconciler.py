@@ -0,0 +1,144 @@
+"""Обновление ttk.Treeview по ключам записей без полной перерисовки"""
+from bisect import bisect_left
+
+
+def list_keys(items):
+    """
+    Возвращает ключи для записей списка (например, предметов набора)
+
+    Ключом служит идентификатор объекта записи, поэтому после удаления или
+    вставки элемента ключи остальных записей не меняются. Повторы одного и того
+    же объекта различаются порядковым номером.
+
+    Args:
+        items: Список записей
+    """
+    seen = {}
+    keys = []
+    for item in items:
+        key = id(item)
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        keys.append(key if count == 0 else (key, count))
+    return keys
+
+
+def stable_items(current, desired):
+    """
+    Возвращает строки, которые можно оставить на месте при перестановке
+
+    Это наибольшая подпоследовательность current, уже идущая в порядке desired,
+    поэтому перемещать приходится только остальные строки.
+
+    Args:
+        current: Текущий порядок iid (те же iid, что и в desired)
+        desired: Требуемый порядок iid
+    """
+    order = {iid: position for position, iid in enumerate(desired)}
+    sequence = [order[iid] for iid in current]
+
+    # Наибольшая возрастающая подпоследовательность за O(n log n)
+    tails = []
+    tail_indexes = []
+    previous = [-1] * len(sequence)
+    for index, value in enumerate(sequence):
+        position = bisect_left(tails, value)
+        if position == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[position] = value
+            tail_indexes[position] = index
+        previous[index] = tail_indexes[position - 1] if position else -1
+
+    stable = set()
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index != -1:
+        stable.add(current[index])
+        index = previous[index]
+    return stable
+
+
+class TreeReconciler:
+    """
+    Приводит строки Treeview к новому списку записей минимальным числом операций
+
+    Хранит соответствие ключей записей и iid строк и применяет только вставки,
+    удаления, перемещения и изменения значений. Treeview должен заполняться
+    только через reconcile().
+    """
+
+    def __init__(self, tree):
+        """
+        Инициализирует обновление таблицы
+
+        Args:
+            tree: Экземпляр ttk.Treeview
+        """
+        self.tree = tree
+        self.iids = {}
+        self.values = {}
+
+    def reconcile(self, rows, keys):
+        """
+        Обновляет таблицу
+
+        Args:
+            rows: Значения строк в порядке отображения
+            keys: Уникальные ключи строк в том же порядке
+
+        Returns:
+            Количество изменённых строк Treeview (вставки, удаления, перемещения, правки)
+        """
+        tree = self.tree
+        rows = [tuple(values) for values in rows]
+        wanted = set(keys)
+        changes = 0
+
+        # Удаляем строки записей, которых больше нет
+        removed = [key for key in self.iids if key not in wanted]
+        if removed:
+            tree.delete(*[self.iids[key] for key in removed])
+            for key in removed:
+                del self.iids[key]
+                del self.values[key]
+            changes += len(removed)
+
+        # Вставляем новые строки и обновляем изменившиеся значения
+        for position, (key, values) in enumerate(zip(keys, rows)):
+            iid = self.iids.get(key)
+            if iid is None:
+                self.iids[key] = tree.insert("", position, values=values)
+                self.values[key] = values
+                changes += 1
+            elif self.values[key] != values:
+                tree.item(iid, values=values)
+                self.values[key] = values
+                changes += 1
+
+        # Переставляем строки, оказавшиеся не на своих местах
+        desired = [self.iids[key] for key in keys]
+        current = list(tree.get_children(""))
+        if current != desired:
+            stable = stable_items(current, desired)
+            for position, iid in enumerate(desired):
+                if iid in stable:
+                    continue
+                # Ставим строку сразу после предыдущей по порядку записи
+                current.remove(iid)
+                target = current.index(desired[position - 1]) + 1 if position else 0
+                tree.move(iid, "", target)
+                current.insert(target, iid)
+                changes += 1
+        return changes
+
+    def iid(self, key):
+        """Возвращает iid строки записи или None"""
+        return self.iids.get(key)
+
+    def clear(self):
+        """Удаляет все строки"""
+        if self.iids:
+            self.tree.delete(*self.iids.values())
+        self.iids = {}
+        self.values = {}
@@ -0,0 +1,223 @@
+"""Виртуальная сетка карточек: виджеты создаются только для видимых записей"""
+import math
+import tkinter as tk
+from ui.constants import *
+
+# Количество строк карточек, создаваемых сверх видимых (запас при прокрутке)
+OVERSCAN_CARD_ROWS = 1
+
+# Количество пикселей, прокручиваемых одним шагом колеса мыши
+WHEEL_PIXELS = 60
+
+# Высота строки карточек, пока ее нельзя измерить (пиксели)
+DEFAULT_CARD_HEIGHT = 150
+
+
+class VirtualCardGrid(tk.Frame):
+    """
+    Прокручиваемая сетка карточек редактирования с переиспользованием виджетов
+
+    Карточки (фреймы с полями записи) создаются только для видимых строк
+    сетки; при прокрутке карточки, ушедшие из видимой области, перемещаются
+    на новые места и заполняются данными других записей. Высота строки
+    равна наибольшей измеренной высоте карточки.
+    """
+
+    def __init__(self, parent, create_card, load_card, columns=2, column_major=False,
+                 on_recycle=None, bg=DARK_SECONDARY):
+        """
+        Инициализирует сетку
+
+        Args:
+            parent: Родительский виджет
+            create_card: Функция (container), создающая виджет карточки в container
+            load_card: Функция (card, key), заполняющая карточку данными записи
+            columns: Количество колонок сетки
+            column_major: Если True, записи заполняют сетку по колонкам (первая
+                половина - в левой колонке), иначе - по строкам
+            on_recycle: Функция без аргументов, вызываемая перед заполнением
+                карточек другими записями (например, запись отложенного ввода)
+            bg: Цвет фона
+        """
+        super().__init__(parent, bg=bg)
+        self.create_card = create_card
+        self.load_card = load_card
+        self.columns = max(1, columns)
+        self.column_major = column_major
+        self.on_recycle = on_recycle
+        self.keys = []
+        self.row_height = DEFAULT_CARD_HEIGHT
+        self._measured = False
+        self._measure_pending = None
+        # Карточки: [виджет, id окна на канвасе, номер записи или None]
+        self._cards = []
+        self._wheel_tag = f"VirtualCardGrid{id(self)}"
+
+        self.scrollbar = tk.Scrollbar(self)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(self, bg=bg, bd=0, highlightthickness=0,
+                                yscrollcommand=self._on_yscroll)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.scrollbar.config(command=self.canvas.yview)
+
+        self.canvas.bind("<Configure>", lambda e: self._layout())
+        # Колесо мыши обрабатывается и над канвасом, и над виджетами карточек
+        # (им добавляется тег _wheel_tag, см. _add_wheel_tag)
+        self._add_wheel_tag(self.canvas)
+        self.bind_class(self._wheel_tag, "<MouseWheel>", self._on_mousewheel)
+        self.bind_class(self._wheel_tag, "<Button-4>", lambda e: self.scroll(-WHEEL_PIXELS))
+        self.bind_class(self._wheel_tag, "<Button-5>", lambda e: self.scroll(WHEEL_PIXELS))
+
+    def set_keys(self, keys):
+        """
+        Заменяет список записей
+
+        Args:
+            keys: Ключи записей в порядке отображения
+        """
+        self.keys = list(keys)
+        # Все карточки будут заполнены заново
+        for card in self._cards:
+            card[2] = None
+        self._layout()
+
+    def refresh(self):
+        """Заново заполняет видимые карточки данными их записей"""
+        self.set_keys(self.keys)
+
+    # Прокрутка
+
+    def scroll(self, pixels):
+        """Прокручивает сетку на указанное количество пикселей"""
+        total = self._total_height()
+        if total > 0:
+            top = self.canvas.canvasy(0) + pixels
+            self.canvas.yview_moveto(max(0.0, top) / total)
+        return "break"
+
+    def _on_mousewheel(self, event):
+        if abs(event.delta) >= 120:
+            steps = -event.delta // 120
+        else:
+            steps = -event.delta
+        return self.scroll(steps * WHEEL_PIXELS)
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._render()
+
+    # Размещение карточек
+
+    def _total_rows(self):
+        return math.ceil(len(self.keys) / self.columns)
+
+    def _total_height(self):
+        return self._total_rows() * self.row_height
+
+    def _index(self, row, column):
+        """Возвращает номер записи в ячейке сетки"""
+        if self.column_major:
+            return column * self._total_rows() + row
+        return row * self.columns + column
+
+    def _cell(self, index):
+        """Возвращает (строка, колонка) ячейки записи"""
+        if self.column_major:
+            column, row = divmod(index, self._total_rows())
+            return row, column
+        return divmod(index, self.columns)
+
+    def _card_width(self):
+        return max(1, self.canvas.winfo_width() // self.columns)
+
+    def _layout(self):
+        """Обновляет область прокрутки и ширину карточек, затем заполняет видимые строки"""
+        width = self._card_width()
+        for widget, window, index in self._cards:
+            self.canvas.itemconfigure(window, width=width)
+        self.canvas.configure(scrollregion=(0, 0, width * self.columns, self._total_height()))
+        self._render()
+
+    def _render(self):
+        """Назначает карточки видимым записям, переиспользуя уже созданные"""
+        if not self.keys:
+            for card in self._cards:
+                self.canvas.itemconfigure(card[1], state="hidden")
+                card[2] = None
+            return
+
+        top = max(0, int(self.canvas.canvasy(0)))
+        height = max(1, self.canvas.winfo_height())
+        total_rows = self._total_rows()
+        first_row = min(top // self.row_height, total_rows - 1)
+        last_row = min(total_rows - 1, (top + height) // self.row_height + OVERSCAN_CARD_ROWS)
+        needed = [
+            index
+            for row in range(first_row, last_row + 1)
+            for index in (self._index(row, column) for column in range(self.columns))
+            if index < len(self.keys)
+        ]
+
+        # Карточки, уже показывающие нужные записи, остаются на месте
+        wanted = set(needed)
+        shown = {card[2]: card for card in self._cards if card[2] in wanted}
+        free = [card for card in self._cards if card[2] not in shown or shown[card[2]] is not card]
+        missing = [index for index in needed if index not in shown]
+
+        if missing and free and self.on_recycle is not None:
+            # Карточки получат другие записи - сначала сохраняем отложенный ввод
+            self.on_recycle()
+
+        width = self._card_width()
+        for index in missing:
+            if free:
+                card = free.pop()
+            else:
+                card = self._new_card(width)
+            card[2] = index
+            self.load_card(card[0], self.keys[index])
+            self._place(card, index)
+
+        if missing and self._measure_pending is None:
+            # Размеры новых карточек известны после обработки геометрии
+            self._measure_pending = self.after_idle(self._measure)
+
+        # Лишние карточки скрываются до следующей прокрутки
+        for card in free:
+            card[2] = None
+            self.canvas.itemconfigure(card[1], state="hidden")
+
+    def _new_card(self, width):
+        widget = self.create_card(self.canvas)
+        window = self.canvas.create_window(0, 0, window=widget, anchor="nw", width=width)
+        self._add_wheel_tag(widget)
+        card = [widget, window, None]
+        self._cards.append(card)
+        return card
+
+    def _place(self, card, index):
+        row, column = self._cell(index)
+        self.canvas.coords(card[1], column * self._card_width(), row * self.row_height)
+        self.canvas.itemconfigure(card[1], state="normal")
+
+    def _measure(self):
+        """Увеличивает высоту строки, если заполненные карточки в нее не помещаются"""
+        self._measure_pending = None
+        if not self.winfo_exists():
+            # Раздел закрыт до обработки отложенного вызова
+            return
+        height = max((card[0].winfo_reqheight() for card in self._cards if card[2] is not None), default=0)
+        if height > 1 and (height > self.row_height or not self._measured):
+            self._measured = True
+            self.row_height = height
+            # Перемещаем карточки по новой высоте строки
+            for card in self._cards:
+                if card[2] is not None:
+                    self._place(card, card[2])
+            self._layout()
+
+    def _add_wheel_tag(self, widget):
+        """Передает прокрутку колесом мыши с любого виджета карточки на сетку"""
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
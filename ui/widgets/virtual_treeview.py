@@ -0,0 +1,297 @@
+"""Виртуальная таблица: ttk.Treeview, в котором созданы только видимые строки"""
+import math
+import tkinter as tk
+from tkinter import ttk
+from ui.constants import *
+
+# Количество строк, создаваемых сверх видимых (частично видимая строка и запас при изменении размера)
+OVERSCAN_ROWS = 2
+
+# Высота строки по умолчанию, пока ее нельзя измерить (пиксели)
+DEFAULT_ROW_HEIGHT = 20
+
+# Количество строк, прокручиваемых одним шагом колеса мыши
+WHEEL_ROWS = 3
+
+
+class VirtualTreeview(tk.Frame):
+    """
+    Таблица с данными в списке Python и переиспользуемыми строками Treeview
+
+    Строки Treeview создаются только для видимой области (плюс OVERSCAN_ROWS) и при
+    прокрутке заполняются значениями других записей. Выделение хранится по ключам
+    записей, поэтому selection(), item() и index() работают с ключами так же,
+    как обычный Treeview работает с iid.
+    """
+
+    def __init__(self, parent, columns, height=10, selectmode="browse", horizontal_scroll=True, bg=DARK_SECONDARY):
+        """
+        Инициализирует таблицу
+
+        Args:
+            parent: Родительский виджет
+            columns: Идентификаторы колонок
+            height: Высота таблицы в строках
+            selectmode: Режим выделения ("browse" или "extended")
+            horizontal_scroll: Добавлять ли горизонтальную прокрутку
+            bg: Цвет фона рамки
+        """
+        super().__init__(parent, bg=bg)
+        self.selectmode = selectmode
+        self.rows = []
+        self.keys = []
+        self.positions = {}
+        self.first = 0
+        self.visible_rows = height
+        self.row_height = DEFAULT_ROW_HEIGHT
+        self.header_height = DEFAULT_ROW_HEIGHT
+        self._measured = False
+        self._selected = set()
+        self._slots = []
+        self._slot_content = []
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height, selectmode=selectmode)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+
+        if horizontal_scroll:
+            x_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+            self.tree.configure(xscrollcommand=x_scrollbar.set)
+            x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(WHEEL_ROWS))
+        self.tree.bind("<Up>", lambda e: self._move_focus(-1))
+        self.tree.bind("<Down>", lambda e: self._move_focus(1))
+        self.tree.bind("<Prior>", lambda e: self._move_focus(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self._move_focus(self.visible_rows))
+        self.tree.bind("<Home>", lambda e: self._move_focus(-len(self.rows)))
+        self.tree.bind("<End>", lambda e: self._move_focus(len(self.rows)))
+
+    # Настройка колонок и событий делегируется Treeview
+
+    def heading(self, column, **kwargs):
+        return self.tree.heading(column, **kwargs)
+
+    def column(self, column, **kwargs):
+        return self.tree.column(column, **kwargs)
+
+    def bind(self, sequence=None, func=None, add=None):
+        """Привязывает обработчик событий к строкам таблицы"""
+        return self.tree.bind(sequence, func, add)
+
+    def focus_set(self):
+        self.tree.focus_set()
+
+    # Данные
+
+    def set_rows(self, rows, keys=None):
+        """
+        Заменяет данные таблицы
+
+        Args:
+            rows: Последовательность значений строк (кортежи по колонкам)
+            keys: Ключи строк (по умолчанию - номер строки); выделение
+                записей с сохранившимися ключами не сбрасывается
+        """
+        self.rows = [tuple(values) for values in rows]
+        self.keys = list(keys) if keys is not None else list(range(len(self.rows)))
+        self.positions = {key: position for position, key in enumerate(self.keys)}
+        self._selected = {key for key in self._selected if key in self.positions}
+        self.first = max(0, min(self.first, len(self.rows) - self.visible_rows))
+        self._render()
+
+    def append_rows(self, rows, keys=None):
+        """
+        Добавляет строки в конец таблицы
+
+        Args:
+            rows: Последовательность значений строк
+            keys: Ключи строк (по умолчанию - номер строки)
+        """
+        start = len(self.rows)
+        self.rows.extend(tuple(values) for values in rows)
+        new_keys = list(keys) if keys is not None else list(range(start, len(self.rows)))
+        for position, key in enumerate(new_keys, start):
+            self.positions[key] = position
+        self.keys.extend(new_keys)
+        self._render()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def item(self, key, option=None):
+        """Возвращает данные записи в формате Treeview.item ({"values": ...})"""
+        values = list(self.rows[self.positions[key]])
+        if option is None:
+            return {"values": values}
+        if option == "values":
+            return values
+        raise tk.TclError(f"Неподдерживаемый параметр строки: {option}")
+
+    def index(self, key):
+        """Возвращает номер записи в таблице"""
+        return self.positions[key]
+
+    def get_children(self):
+        """Возвращает ключи всех записей"""
+        return tuple(self.keys)
+
+    # Выделение
+
+    def selection(self):
+        """Возвращает ключи выделенных записей в порядке их следования"""
+        return tuple(sorted(self._selected, key=self.positions.__getitem__))
+
+    def selection_set(self, *keys):
+        """Выделяет записи с указанными ключами"""
+        if len(keys) == 1 and isinstance(keys[0], (list, tuple)):
+            keys = keys[0]
+        self._selected = {key for key in keys if key in self.positions}
+        self._sync_selection()
+        self.tree.event_generate("<<TreeviewSelect>>")
+
+    def see(self, key):
+        """Прокручивает таблицу так, чтобы запись была видна"""
+        position = self.positions.get(key)
+        if position is None:
+            return
+        if position < self.first:
+            self.first = position
+        elif position >= self.first + self.visible_rows:
+            self.first = position - self.visible_rows + 1
+        self._render()
+
+    # Прокрутка
+
+    def yview(self, *args):
+        """Обработчик команд полосы прокрутки (moveto/scroll)"""
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self.first = int(round(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self.visible_rows - 1)
+            self.first += amount
+        self._render()
+
+    def scroll(self, rows):
+        """Прокручивает таблицу на указанное количество строк"""
+        self.first += rows
+        self._render()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        if abs(event.delta) >= 120:
+            steps = -event.delta // 120
+        else:
+            steps = -event.delta
+        return self.scroll(steps * WHEEL_ROWS)
+
+    def _move_focus(self, delta):
+        """Перемещает выделение клавиатурой с прокруткой за пределы видимых строк"""
+        if not self.rows:
+            return "break"
+        focus = self.tree.focus()
+        if focus in self._slots:
+            current = self.first + self._slots.index(focus)
+        else:
+            current = self.first - 1 if delta > 0 else self.first
+        target = max(0, min(len(self.rows) - 1, current + delta))
+        self.see(self.keys[target])
+        self.selection_set(self.keys[target])
+        self.tree.focus(self._slots[target - self.first])
+        return "break"
+
+    def _fractions(self):
+        total = len(self.rows)
+        if not total:
+            return (0.0, 1.0)
+        return (self.first / total, min(1.0, (self.first + self.visible_rows) / total))
+
+    # Отрисовка
+
+    def _on_configure(self, event):
+        """Пересчитывает количество видимых строк при изменении размера"""
+        self._update_visible_rows(event.height)
+
+    def _measure(self):
+        """Измеряет высоту заголовка и строки по первой отображенной строке"""
+        if not self._slots or not self.tree.winfo_exists():
+            return
+        bbox = self.tree.bbox(self._slots[0])
+        if bbox:
+            self._measured = True
+            self.header_height = bbox[1]
+            self.row_height = max(1, bbox[3])
+            self._update_visible_rows(self.tree.winfo_height())
+
+    def _update_visible_rows(self, height):
+        if self._slots and not self._measured:
+            self._measure()
+            return
+        visible = max(1, math.ceil(max(0, height - self.header_height) / self.row_height))
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            self._render()
+
+    def _render(self):
+        """Заполняет строки Treeview данными видимой области"""
+        total = len(self.rows)
+        self.first = max(0, min(self.first, total - self.visible_rows))
+        needed = min(self.visible_rows + OVERSCAN_ROWS, total - self.first)
+
+        # Создаем или удаляем строки, чтобы их было ровно столько, сколько нужно
+        while len(self._slots) < needed:
+            self._slots.append(self.tree.insert("", "end"))
+            self._slot_content.append(None)
+            if not self._measured and len(self._slots) == 1:
+                self.tree.after_idle(self._measure)
+        while len(self._slots) > needed:
+            self.tree.delete(self._slots.pop())
+            self._slot_content.pop()
+
+        for offset, slot in enumerate(self._slots):
+            values = self.rows[self.first + offset]
+            # Значения строки Treeview обновляются только если изменились
+            current = self._slot_content[offset]
+            if current is not values and current != values:
+                self.tree.item(slot, values=values)
+                self._slot_content[offset] = values
+
+        self._sync_selection()
+        self.scrollbar.set(*self._fractions())
+
+    def _selected_slots(self):
+        """Возвращает строки Treeview, в которых отображаются выделенные записи"""
+        return {
+            slot for offset, slot in enumerate(self._slots)
+            if self.keys[self.first + offset] in self._selected
+        }
+
+    def _sync_selection(self):
+        """Выделяет строки Treeview, в которых отображаются выделенные записи"""
+        selected_slots = self._selected_slots()
+        if selected_slots != set(self.tree.selection()):
+            self.tree.selection_set(list(selected_slots))
+
+    def _on_tree_select(self, event):
+        """Переносит выделение строк Treeview на ключи записей"""
+        if set(self.tree.selection()) == self._selected_slots():
+            # Выделение уже соответствует записям (например, после прокрутки)
+            return
+        visible = {}
+        for offset, slot in enumerate(self._slots):
+            visible[slot] = self.keys[self.first + offset]
+        chosen = {visible[slot] for slot in self.tree.selection() if slot in visible}
+        if self.selectmode == "browse":
+            self._selected = chosen
+        else:
+            # Выделение записей за пределами видимой области сохраняется
+            self._selected = {key for key in self._selected if key not in visible.values()} | chosen
@@ -0,0 +1,490 @@
+"""Модуль общего каталога данных ARK (ArkData.json), загружаемого один раз на процесс"""
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from utils.search_index import RankedIndex, SubstringIndex
+
+# Путь к файлу с данными ARK
+ARK_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ArkData.json")
+
+# Версия формата скомпилированного кеша (увеличивается при изменении структуры)
+CACHE_FORMAT = 3
+
+# Заголовок файла кеша: сигнатура, версия формата и длина оглавления
+CACHE_MAGIC = b"ARKDATA\0"
+CACHE_PREFIX = struct.Struct("<8sII")
+
+# Категории записей каталога
+CATEGORIES = ("creatures", "items", "engrams", "beacons", "colors", "icons")
+
+# Пустое представление для отсутствующих категорий
+EMPTY_CATEGORY = MappingProxyType({})
+
+# Поля записей всех категорий в порядке хранения в кеше
+RECORD_FIELDS = (
+    "type_name", "name", "mod_name", "class_name", "entity_id",
+    "blueprint", "color_id", "hex_code", "path",
+)
+
+# Поля с часто повторяющимися значениями, которые хранятся в одном экземпляре
+INTERNED_FIELDS = ("type_name", "mod_name")
+
+
+class CatalogRecord:
+    """
+    Компактная запись каталога (существо, предмет, чертеж, маяк, цвет, иконка)
+
+    Хранит значения в слотах вместо словаря и поддерживает чтение как словарь
+    (get, [], in, keys, items), поэтому может использоваться вместо записей из JSON.
+    Отсутствующие в исходных данных поля остаются незаполненными слотами.
+    """
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, *values):
+        for field, value in zip(RECORD_FIELDS, values):
+            if value is not None:
+                if field in INTERNED_FIELDS and type(value) is str:
+                    value = sys.intern(value)
+                object.__setattr__(self, field, value)
+
+    @classmethod
+    def from_dict(cls, record):
+        """Создает запись из словаря в формате ArkData.json"""
+        return cls(*record_row(record))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Записи каталога доступны только для чтения")
+
+    def __delattr__(self, name):
+        raise AttributeError("Записи каталога доступны только для чтения")
+
+    def get(self, key, default=None):
+        if key not in RECORD_FIELDS:
+            return default
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        if key in RECORD_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in RECORD_FIELDS and hasattr(self, key)
+
+    def keys(self):
+        return [field for field in RECORD_FIELDS if hasattr(self, field)]
+
+    def values(self):
+        return [getattr(self, field) for field in self.keys()]
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, CatalogRecord):
+            other = dict(other.items())
+        return dict(self.items()) == other
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (CatalogRecord, record_row(self))
+
+    def __repr__(self):
+        return f"CatalogRecord({dict(self.items())!r})"
+
+
+def record_row(record):
+    """Возвращает значения полей записи в порядке RECORD_FIELDS (None для отсутствующих)"""
+    return tuple(record.get(field) for field in RECORD_FIELDS)
+
+
+class CategoryView(Mapping):
+    """Словарь категорий только для чтения, декодирующий категорию при первом обращении"""
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+
+    def __getitem__(self, category):
+        if category not in CATEGORIES:
+            raise KeyError(category)
+        return self._catalog.get(category)
+
+    def __iter__(self):
+        return iter(CATEGORIES)
+
+    def __len__(self):
+        return len(CATEGORIES)
+
+    def __contains__(self, category):
+        return category in CATEGORIES
+
+
+class ArkCatalog:
+    """Каталог данных ARK с перезагрузкой только при изменении файла"""
+
+    def __init__(self, path=ARK_DATA_PATH):
+        """
+        Инициализирует каталог
+
+        Args:
+            path: Путь к файлу ArkData.json
+        """
+        self.path = path
+        self.cache_path = os.path.splitext(path)[0] + ".cache"
+        self.version = None
+        self.last_updated = None
+        self._lock = threading.RLock()
+        self._signature = None
+        self._loaded = False
+        self._categories = {}
+        self._indexes = {}
+        self._ranked_indexes = {}
+        self._blocks = {}
+        self._raw = {}
+        self._mmap = None
+        self._view = CategoryView(self)
+
+    def _file_signature(self):
+        """Возвращает отпечаток файла (время изменения и размер) или None"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self):
+        """
+        Перезагружает каталог, если файл изменился с момента последней загрузки
+
+        Returns:
+            True, если данные были перезагружены
+        """
+        signature = self._file_signature()
+        if self._loaded and signature == self._signature:
+            return False
+
+        with self._lock:
+            # Другой поток мог уже перезагрузить данные
+            if self._loaded and signature == self._signature:
+                return False
+            self._load(signature)
+            return True
+
+    def _load(self, signature):
+        """Подключает кеш (или данные из файла); категории декодируются при первом обращении"""
+        self._close()
+        header = None
+        if signature is not None:
+            try:
+                header = self._prepare_cache(signature)
+            except Exception as e:
+                print(f"Ошибка при загрузке данных из ArkData.json: {e}")
+                self._raw = {}
+        else:
+            print(f"Файл данных ARK {self.path} не найден")
+
+        header = header or {}
+        self.version = header.get("version")
+        self.last_updated = header.get("last_updated")
+        self._signature = signature
+        self._loaded = True
+
+    def _prepare_cache(self, signature):
+        """
+        Открывает актуальный кеш, при необходимости пересобирая его из ArkData.json
+
+        Кеш считается актуальным, если совпадает отпечаток файла (время изменения
+        и размер) или, при его расхождении, хеш содержимого JSON.
+
+        Returns:
+            Оглавление кеша (версия, хеш, расположение блоков категорий)
+        """
+        header = self._open_cache()
+        if header is not None and header["signature"] == signature:
+            return header
+
+        with open(self.path, 'rb') as file:
+            raw = file.read()
+        content_hash = hashlib.sha256(raw).hexdigest()
+
+        if header is not None and header["hash"] == content_hash:
+            # Файл был перезаписан без изменений - переносим готовые блоки
+            blocks = {name: bytes(self._block_bytes(name)) for name in header["blocks"]}
+            self._close()
+        else:
+            self._close()
+            data = json.loads(raw.decode('utf-8'))
+            header = {
+                "version": data.get("version"),
+                "last_updated": data.get("last_updated"),
+            }
+            # Записи хранятся кортежами значений в порядке RECORD_FIELDS
+            self._raw = {
+                name: {key: record_row(record) for key, record in (data.get(name) or {}).items()}
+                for name in CATEGORIES
+            }
+            blocks = {
+                name: pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+                for name, rows in self._raw.items()
+            }
+
+        header = {
+            "version": header.get("version"),
+            "last_updated": header.get("last_updated"),
+            "hash": content_hash,
+            "signature": signature,
+        }
+        if self._write_cache(header, blocks):
+            opened = self._open_cache()
+            if opened is not None:
+                self._raw = {}
+                return opened
+
+        # Кеш недоступен - работаем с данными в памяти
+        if not self._raw:
+            self._raw = {name: pickle.loads(block) for name, block in blocks.items()}
+        return header
+
+    def _open_cache(self):
+        """Отображает файл кеша в память и читает оглавление; None, если кеш недоступен"""
+        try:
+            with open(self.cache_path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Кеш {self.cache_path} недоступен и будет пересоздан: {e}")
+            return None
+
+        try:
+            magic, cache_format, header_length = CACHE_PREFIX.unpack_from(mapped, 0)
+            if magic != CACHE_MAGIC or cache_format != CACHE_FORMAT:
+                mapped.close()
+                return None
+            header = pickle.loads(mapped[CACHE_PREFIX.size:CACHE_PREFIX.size + header_length])
+        except Exception as e:
+            print(f"Кеш {self.cache_path} поврежден и будет пересоздан: {e}")
+            mapped.close()
+            return None
+
+        self._mmap = mapped
+        self._blocks = header["blocks"]
+        return header
+
+    def _write_cache(self, header, blocks):
+        """
+        Атомарно записывает кеш: оглавление и отдельный блок на каждую категорию
+
+        Returns:
+            True, если кеш записан
+        """
+        # Смещения блоков отсчитываются от начала файла, поэтому оглавление
+        # сериализуется до тех пор, пока его длина не перестанет меняться
+        header_length = 0
+        while True:
+            offset = CACHE_PREFIX.size + header_length
+            layout = {}
+            for name, block in blocks.items():
+                layout[name] = (offset, len(block))
+                offset += len(block)
+            header_bytes = pickle.dumps(dict(header, blocks=layout), protocol=pickle.HIGHEST_PROTOCOL)
+            if len(header_bytes) == header_length:
+                break
+            header_length = len(header_bytes)
+
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(CACHE_PREFIX.pack(CACHE_MAGIC, CACHE_FORMAT, header_length))
+                file.write(header_bytes)
+                for block in blocks.values():
+                    file.write(block)
+            os.replace(temp_path, self.cache_path)
+            return True
+        except OSError as e:
+            # Кеш - только ускорение, работаем и без него
+            print(f"Не удалось записать кеш {self.cache_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+    def _block_bytes(self, category):
+        """Возвращает байты блока категории из отображенного в память кеша"""
+        offset, length = self._blocks[category]
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def _close(self):
+        """Освобождает отображение кеша, декодированные категории и индексы поиска"""
+        self._categories = {}
+        self._indexes = {}
+        self._ranked_indexes = {}
+        self._blocks = {}
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # На блоки еще есть ссылки - отображение закроется сборщиком мусора
+                pass
+            self._mmap = None
+
+    def _decode(self, category):
+        """Декодирует категорию из кеша или из данных в памяти в записи CatalogRecord"""
+        if category in self._raw:
+            rows = self._raw[category]
+        elif category in self._blocks:
+            block = self._block_bytes(category)
+            try:
+                rows = pickle.loads(block)
+            finally:
+                block.release()
+        else:
+            rows = {}
+        return MappingProxyType({key: CatalogRecord(*row) for key, row in rows.items()})
+
+    def get(self, category):
+        """
+        Возвращает записи категории в виде словаря только для чтения
+
+        Категория декодируется при первом обращении, поэтому память расходуется
+        только на реально используемые категории.
+
+        Args:
+            category: Имя категории (items, creatures, engrams, beacons, colors, icons)
+        """
+        self.refresh()
+        if category not in CATEGORIES:
+            return EMPTY_CATEGORY
+
+        records = self._categories.get(category)
+        if records is None:
+            with self._lock:
+                records = self._categories.get(category)
+                if records is None:
+                    records = self._decode(category)
+                    self._categories[category] = records
+        return records
+
+    def index(self, category):
+        """
+        Возвращает поисковый индекс категории (строится один раз после загрузки)
+
+        Args:
+            category: Имя категории
+        """
+        records = self.get(category)
+        index = self._indexes.get(category)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(category)
+                if index is None:
+                    index = SubstringIndex(records)
+                    self._indexes[category] = index
+        return index
+
+    def ranked_index(self, category):
+        """
+        Возвращает индекс ранжированного поиска по категории (строится один раз после загрузки)
+
+        Args:
+            category: Имя категории
+        """
+        substring_index = self.index(category)
+        index = self._ranked_indexes.get(category)
+        if index is None:
+            with self._lock:
+                index = self._ranked_indexes.get(category)
+                if index is None:
+                    index = RankedIndex(self.get(category), substring_index)
+                    self._ranked_indexes[category] = index
+        return index
+
+    def preload(self, categories=CATEGORIES):
+        """
+        Загружает каталог, декодирует указанные категории и строит их индексы
+
+        Предназначен для вызова из фонового потока, чтобы первое обращение
+        из интерфейса не выполняло разбор файла.
+
+        Args:
+            categories: Имена категорий для декодирования
+        """
+        for category in categories:
+            self.ranked_index(category)
+
+    def data(self):
+        """Возвращает все категории в том же виде, что и содержимое ArkData.json"""
+        self.refresh()
+        return self._view
+
+
+# Единственный экземпляр каталога на процесс
+_catalog = None
+_catalog_lock = threading.Lock()
+
+def get_catalog():
+    """Возвращает общий экземпляр каталога ARK"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ArkCatalog()
+    return _catalog
+
+def get_ark_data():
+    """Возвращает данные ArkData в виде словаря категорий только для чтения"""
+    return get_catalog().data()
+
+def get_search_index(category, records=None):
+    """
+    Возвращает поисковый индекс для окна выбора
+
+    Args:
+        category: Имя категории каталога
+        records: Записи, переданные окну; если это записи общего каталога
+            (или они не переданы), используется готовый индекс каталога
+
+    Returns:
+        Экземпляр SubstringIndex
+    """
+    catalog = get_catalog()
+    if records is None or records is catalog.get(category):
+        return catalog.index(category)
+    return SubstringIndex(records)
+
+def get_ranked_index(category, records=None):
+    """
+    Возвращает индекс ранжированного поиска для окна выбора
+
+    Args:
+        category: Имя категории каталога
+        records: Записи, переданные окну; если это записи общего каталога
+            (или они не переданы), используется готовый индекс каталога
+
+    Returns:
+        Экземпляр RankedIndex
+    """
+    catalog = get_catalog()
+    if records is None or records is catalog.get(category):
+        return catalog.ranked_index(category)
+    return RankedIndex(records)
@@ -0,0 +1,102 @@
+"""Атомарная запись файлов с ротацией сжатых резервных копий"""
+import gzip
+import os
+import shutil
+import threading
+
+
+def backup_path(path, number):
+    """Возвращает путь резервной копии с указанным номером (1 - самая свежая)"""
+    return f"{path}.{number}.gz"
+
+
+def _temp_path(path):
+    """Возвращает имя временного файла рядом с path (уникальное для процесса и потока)"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _fsync_directory(directory):
+    """Сбрасывает на диск запись каталога (переименование файла); в Windows не требуется"""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def rotate_backups(path, count):
+    """
+    Сохраняет текущий файл как сжатую резервную копию path.1.gz
+
+    Предыдущие копии сдвигаются (path.1.gz -> path.2.gz и т.д.), копия
+    с номером count удаляется.
+
+    Args:
+        path: Путь к файлу
+        count: Количество хранимых копий (0 - не создавать)
+    """
+    if count <= 0 or not os.path.exists(path):
+        return
+
+    oldest = backup_path(path, count)
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for number in range(count - 1, 0, -1):
+        source = backup_path(path, number)
+        if os.path.exists(source):
+            os.replace(source, backup_path(path, number + 1))
+
+    # Сжимаем во временный файл, чтобы прерванная запись не оставила битую копию
+    temp_path = _temp_path(backup_path(path, 1))
+    try:
+        with open(path, 'rb') as source, gzip.open(temp_path, 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.replace(temp_path, backup_path(path, 1))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_atomic(path, data, backups=0):
+    """
+    Записывает файл целиком или не изменяет его вовсе
+
+    Данные записываются во временный файл в том же каталоге, сбрасываются
+    на диск (fsync) и заменяют файл одной операцией os.replace. При сбое
+    или нехватке места прежний файл остается нетронутым.
+
+    Args:
+        path: Путь к файлу
+        data: Содержимое (str записывается в UTF-8) или итератор фрагментов
+            str/bytes - тогда содержимое не собирается в памяти целиком
+        backups: Количество сжатых резервных копий прежнего содержимого
+    """
+    if isinstance(data, (str, bytes)):
+        data = (data,)
+
+    temp_path = _temp_path(path)
+    try:
+        with open(temp_path, 'xb') as file:
+            for chunk in data:
+                file.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            # Сохраняем права доступа заменяемого файла
+            shutil.copymode(path, temp_path)
+        rotate_backups(path, backups)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(os.path.dirname(os.path.abspath(path)))
@@ -0,0 +1,134 @@
+"""Чтение импортируемой конфигурации по разделам с проверкой структуры"""
+import json
+import re
+
+# Разделы, каждая запись которых должна быть объектом JSON
+ENTRY_OBJECT_SECTIONS = ("Kits", "ShopItems", "SellItems", "Messages", "Notifications")
+
+# Разделы, каждое значение которых должно быть числом
+NUMBER_SECTIONS = ("Group_Discounts",)
+
+# Пробельные символы JSON (как в json.decoder)
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_decoder = json.JSONDecoder()
+
+
+class ConfigImportError(ValueError):
+    """Файл не является корректной конфигурацией магазина"""
+
+
+def validate_section(name, data):
+    """
+    Проверяет структуру раздела конфигурации
+
+    Args:
+        name: Имя раздела
+        data: Данные раздела
+
+    Raises:
+        ConfigImportError: Если структура раздела не подходит
+    """
+    if not isinstance(data, dict):
+        raise ConfigImportError(f"Раздел {name} должен быть объектом JSON")
+    if name in ENTRY_OBJECT_SECTIONS:
+        for key, entry in data.items():
+            if not isinstance(entry, dict):
+                raise ConfigImportError(f"Запись {key} раздела {name} должна быть объектом JSON")
+    elif name in NUMBER_SECTIONS:
+        for key, entry in data.items():
+            if isinstance(entry, bool) or not isinstance(entry, (int, float)):
+                raise ConfigImportError(f"Значение {key} раздела {name} должно быть числом")
+
+
+def _skip(text, position):
+    return _WHITESPACE.match(text, position).end()
+
+
+def _expect(text, position, chars, message):
+    """Пропускает пробелы и проверяет, что следующий символ - один из chars"""
+    position = _skip(text, position)
+    char = text[position:position + 1]
+    if not char or char not in chars:
+        raise json.JSONDecodeError(message, text, position)
+    return char, position + 1
+
+
+def iter_sections(text):
+    """
+    Разбирает текст конфигурации по одному разделу верхнего уровня
+
+    Args:
+        text: Текст JSON
+
+    Yields:
+        Кортежи (имя раздела, данные раздела, позиция конца раздела в тексте)
+
+    Raises:
+        json.JSONDecodeError: Ошибка синтаксиса JSON
+        ConfigImportError: Верхний уровень не является объектом
+    """
+    position = _skip(text, 0)
+    if text[position:position + 1] != "{":
+        raise ConfigImportError("Конфигурация должна быть объектом JSON")
+    position = _skip(text, position + 1)
+
+    if text[position:position + 1] == "}":
+        position += 1
+    else:
+        while True:
+            position = _skip(text, position)
+            name, position = _decoder.raw_decode(text, position)
+            if not isinstance(name, str):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, position)
+            _, position = _expect(text, position, ":", "Expecting ':' delimiter")
+            data, position = _decoder.raw_decode(text, _skip(text, position))
+            yield name, data, position
+
+            char, position = _expect(text, position, ",}", "Expecting ',' delimiter")
+            if char == "}":
+                break
+
+    if _skip(text, position) != len(text):
+        raise json.JSONDecodeError("Extra data", text, _skip(text, position))
+
+
+def read_config_file(file_path, on_progress=None, on_invalid=None):
+    """
+    Читает и проверяет файл конфигурации
+
+    Разделы разбираются и проверяются по одному. Без on_invalid результат
+    возвращается, только если корректен весь файл (импорт); с on_invalid
+    разделы с ошибкой структуры загружаются как есть (запуск приложения).
+
+    Args:
+        file_path: Путь к файлу JSON
+        on_progress: Функция (имя раздела, разобрано символов, всего символов)
+        on_invalid: Функция (имя раздела, ConfigImportError) для разделов
+            с ошибкой структуры
+
+    Returns:
+        Словарь конфигурации
+
+    Raises:
+        OSError: Ошибка чтения файла
+        json.JSONDecodeError: Ошибка синтаксиса JSON
+        ConfigImportError: Ошибка структуры конфигурации (ошибка структуры
+            раздела - только без on_invalid)
+    """
+    with open(file_path, 'r', encoding='utf-8-sig') as file:
+        text = file.read()
+
+    config_data = {}
+    for name, data, position in iter_sections(text):
+        try:
+            validate_section(name, data)
+        except ConfigImportError as e:
+            if on_invalid is None:
+                raise
+            on_invalid(name, e)
+        # Повторяющийся раздел заменяет предыдущий, как в json.load
+        config_data[name] = data
+        if on_progress is not None:
+            on_progress(name, position, len(text))
+    return config_data
@@ -0,0 +1,234 @@
+"""Журнал изменений конфигурации в памяти для отмены и повтора"""
+import copy
+import sys
+import time
+from contextlib import contextmanager
+
+# Ограничение памяти журнала по умолчанию (байты, оценка по sys.getsizeof)
+JOURNAL_MEMORY_LIMIT = 16 * 1024 * 1024
+
+# Изменения одного ключа, следующие друг за другом чаще этого интервала (с),
+# объединяются в одну операцию (ввод с клавиатуры через trace_add)
+COALESCE_SECONDS = 1.0
+
+
+class _Missing:
+    """Отметка отсутствующего значения; копирование возвращает тот же объект"""
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return "MISSING"
+
+
+# Отметка отсутствующего значения (ключ или раздел не существовал / удален)
+MISSING = _Missing()
+
+
+def estimate_size(value):
+    """Оценивает объем памяти значения вместе с вложенными списками и словарями"""
+    if value is MISSING:
+        return 0
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+class Patch:
+    """Изменение одного пути конфигурации: () - вся конфигурация, (раздел,) или (раздел, ключ)"""
+
+    __slots__ = ("path", "old", "new")
+
+    def __init__(self, path, old, new):
+        self.path = path
+        self.old = old
+        self.new = new
+
+
+class JournalEntry:
+    """Операция журнала: одна или несколько правок, отменяемых вместе"""
+
+    __slots__ = ("patches", "size", "time")
+
+    def __init__(self, patches):
+        self.patches = patches
+        self.time = time.monotonic()
+        self.size = sum(estimate_size(patch.old) + estimate_size(patch.new) for patch in patches)
+
+
+class ConfigJournal:
+    """
+    Журнал операций над ConfigStore
+
+    Хранилище сообщает журналу о каждой правке (путь, старое и новое значение);
+    журнал хранит копии только измененных значений, а не снимки всей
+    конфигурации. Последовательные правки одного ключа объединяются, а самые
+    старые операции удаляются, когда журнал превышает ограничение памяти.
+    """
+
+    def __init__(self, store, memory_limit=JOURNAL_MEMORY_LIMIT, coalesce_seconds=COALESCE_SECONDS):
+        """
+        Инициализирует журнал и подключает его к хранилищу
+
+        Args:
+            store: Экземпляр ConfigStore
+            memory_limit: Ограничение памяти журнала (байты)
+            coalesce_seconds: Интервал объединения правок одного ключа (с)
+        """
+        self.store = store
+        self.memory_limit = memory_limit
+        self.coalesce_seconds = coalesce_seconds
+        self.undo_stack = []
+        self.redo_stack = []
+        self.size = 0
+        self._group = None
+        self._group_depth = 0
+        self._suspended = False
+        self._can_coalesce = False
+        store.journal = self
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def record(self, path, old, new):
+        """
+        Записывает правку (вызывается хранилищем до и после изменения значения)
+
+        Args:
+            path: Путь изменения
+            old: Старое значение (MISSING - не существовало)
+            new: Новое значение (MISSING - удалено)
+        """
+        if self._suspended:
+            return
+        patch = Patch(path, copy.deepcopy(old), copy.deepcopy(new))
+        self.redo_stack.clear()
+
+        if self._group is not None:
+            self._group.append(patch)
+            return
+
+        if self._coalesce(patch):
+            return
+        self._push(JournalEntry([patch]))
+        self._can_coalesce = True
+
+    def _coalesce(self, patch):
+        """Объединяет правку ключа с предыдущей правкой того же ключа"""
+        if not self._can_coalesce or not self.undo_stack or len(patch.path) != 2:
+            return False
+        last = self.undo_stack[-1]
+        if len(last.patches) != 1 or last.patches[0].path != patch.path:
+            return False
+        now = time.monotonic()
+        if now - last.time > self.coalesce_seconds:
+            return False
+
+        self.undo_stack.pop()
+        self.size -= last.size
+        merged = Patch(patch.path, last.patches[0].old, patch.new)
+        if merged.old is not MISSING and merged.old == merged.new:
+            # Значение вернулось к исходному - операция больше не нужна
+            return True
+        entry = JournalEntry([merged])
+        entry.time = now
+        self._push(entry)
+        return True
+
+    def _push(self, entry):
+        self.undo_stack.append(entry)
+        self.size += entry.size
+        # Удаляем самые старые операции, сохраняя хотя бы последнюю
+        while self.size > self.memory_limit and len(self.undo_stack) > 1:
+            self.size -= self.undo_stack.pop(0).size
+
+    def checkpoint(self):
+        """Завершает объединение правок: следующая правка станет отдельной операцией"""
+        self._can_coalesce = False
+
+    @contextmanager
+    def group(self):
+        """Объединяет все правки внутри блока with в одну операцию"""
+        if self._group_depth == 0:
+            self._group = []
+        self._group_depth += 1
+        try:
+            yield
+        finally:
+            self._group_depth -= 1
+            if self._group_depth == 0:
+                patches, self._group = self._group, None
+                if patches:
+                    self._push(JournalEntry(patches))
+                self._can_coalesce = False
+
+    @contextmanager
+    def suspended(self):
+        """Выполняет блок with без записи правок в журнал"""
+        previous = self._suspended
+        self._suspended = True
+        try:
+            yield
+        finally:
+            self._suspended = previous
+
+    def undo(self):
+        """
+        Отменяет последнюю операцию
+
+        Returns:
+            Пути измененных значений или None, если отменять нечего
+        """
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        self.size -= entry.size
+        for patch in reversed(entry.patches):
+            self._apply(patch.path, patch.old)
+        self.redo_stack.append(entry)
+        self._can_coalesce = False
+        return [patch.path for patch in entry.patches]
+
+    def redo(self):
+        """
+        Повторяет последнюю отмененную операцию
+
+        Returns:
+            Пути измененных значений или None, если повторять нечего
+        """
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        for patch in entry.patches:
+            self._apply(patch.path, patch.new)
+        self._push(entry)
+        self._can_coalesce = False
+        return [patch.path for patch in entry.patches]
+
+    def _apply(self, path, value):
+        """Записывает значение по пути через хранилище (подписчики получают оповещения)"""
+        store = self.store
+        # Журнал хранит свою копию, чтобы последующие правки конфигурации ее не меняли
+        value = copy.deepcopy(value)
+        with self.suspended():
+            if not path:
+                store.replace_all(value if value is not MISSING else {})
+            elif len(path) == 1:
+                if value is MISSING:
+                    if path[0] in store:
+                        del store[path[0]]
+                else:
+                    store[path[0]] = value
+            elif value is MISSING:
+                store.delete_value(path[0], path[1])
+            else:
+                store.set_value(path[0], path[1], value)
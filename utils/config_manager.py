@@ -1,29 +1,65 @@
 import json
 import os
 from utils.memory_storage import memory_config
+from utils.atomic_file import write_atomic
+from utils.config_serializer import config_texts, iter_json
+from utils.config_import import read_config_file
+
+# Путь к основному файлу конфигурации
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
+
+# Количество сжатых резервных копий config.json (config.json.1.gz - самая свежая)
+CONFIG_BACKUPS = 5
+
+def apply_loaded_config(config_data):
+    """Помещает конфигурацию, совпадающую с config.json, в оперативную память"""
+    memory_config.replace_all(config_data)
+    memory_config.mark_clean()
 
 def load_config():
     """Загружает конфигурацию из файла"""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
     try:
-        with open(config_path, 'r', encoding='utf-8') as file:
-            config_data = json.load(file)
-            
-            # Загружаем данные в оперативную память
-            for section, data in config_data.items():
-                memory_config[section] = data
-            
-            return config_data
+        # Разделы проверяются при разборе (см. utils.config_import)
+        config_data = read_config_file(CONFIG_PATH)
     except Exception as e:
         print(f"Ошибка при загрузке конфигурации: {e}")
         return {}
+    
+    apply_loaded_config(config_data)
+    return config_data
+
+def serialize_config():
+    """
+    Преобразует конфигурацию из памяти в фрагменты текста JSON
+    
+    Фрагменты - закэшированные тексты разделов (пересчитываются только
+    измененные разделы), поэтому общий текст в памяти не собирается.
+    
+    Returns:
+        Кортеж (список фрагментов, версии разделов на момент преобразования) -
+        версии передаются в memory_config.mark_saved() после успешной записи
+    """
+    revisions = memory_config.snapshot_revisions()
+    return list(config_texts.iter_document()), revisions
+
+def write_config_text(chunks, backups=CONFIG_BACKUPS):
+    """
+    Атомарно записывает текст конфигурации в config.json
+    
+    Не обращается к memory_config, поэтому может выполняться в рабочем потоке.
+    
+    Args:
+        chunks: Текст JSON или итератор его фрагментов
+        backups: Количество сжатых резервных копий прежнего файла
+    """
+    write_atomic(CONFIG_PATH, chunks, backups=backups)
 
 def save_config():
     """Сохраняет конфигурацию из памяти в файл"""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
     try:
-        with open(config_path, 'w', encoding='utf-8') as file:
-            json.dump(memory_config, file, indent=4, ensure_ascii=False)
+        chunks, revisions = serialize_config()
+        write_config_text(chunks)
+        memory_config.mark_saved(revisions)
         return True
     except Exception as e:
         print(f"Ошибка при сохранении конфигурации: {e}")
@@ -40,9 +76,8 @@ def update_memory_config(section, data, delete=False):
 def import_config_from_file(file_path):
     """Импортирует конфигурацию из указанного файла"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            config_data = json.load(file)
-        return config_data
+        # Разделы проверяются по мере разбора; при ошибке исключение передается вызывающему
+        return read_config_file(file_path)
     except Exception as e:
         print(f"Ошибка при импорте конфигурации: {e}")
         raise
@@ -50,8 +85,7 @@ def import_config_from_file(file_path):
 def export_config_to_file(config_data, file_path):
     """Экспортирует конфигурацию в указанный файл"""
     try:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(config_data, file, indent=4, ensure_ascii=False)
+        write_atomic(file_path, iter_json(config_data))
         return True
     except Exception as e:
         print(f"Ошибка при экспорте конфигурации: {e}")
@@ -0,0 +1,100 @@
+"""Преобразование конфигурации в текст JSON с кэшированием по разделам"""
+import json
+
+from utils.memory_storage import memory_config
+
+# Отступ JSON в config.json, экспорте и предпросмотре
+JSON_INDENT = 4
+
+# Кодировщик в формате config.json (iterencode выдает текст небольшими фрагментами)
+_encoder = json.JSONEncoder(indent=JSON_INDENT, ensure_ascii=False)
+
+
+def dump_json(data):
+    """Возвращает текст JSON в формате config.json"""
+    return json.dumps(data, indent=JSON_INDENT, ensure_ascii=False)
+
+
+def iter_json(data):
+    """Возвращает итератор фрагментов текста dump_json(data) без сборки всего текста"""
+    return _encoder.iterencode(data)
+
+
+class SectionTextCache:
+    """
+    Кэш текста JSON разделов конфигурации
+
+    Текст раздела пересчитывается только после изменения раздела (номер
+    версии ConfigStore), а полный документ выдается по разделам из готовых
+    фрагментов и совпадает побайтно с dump_json(store). Поэтому запись в файл
+    или буфер обмена не требует строки размером со всю конфигурацию: помимо
+    кэша в памяти находится не больше текста одного раздела.
+
+    Кэш полагается на номера версий, поэтому конфигурация меняется только
+    через хранилище (set_value, delete_value, replace_all) новыми объектами:
+    изменение вложенного значения на месте кэш не заметит.
+    """
+
+    def __init__(self, store):
+        """
+        Инициализирует кэш
+
+        Args:
+            store: Хранилище конфигурации (ConfigStore)
+        """
+        self.store = store
+        # Раздел -> (версия, текст раздела с отступом для вложения в документ)
+        self._texts = {}
+
+    def _nested_text(self, section):
+        revision = self.store.revision(section)
+        entry = self._texts.get(section)
+        if entry is None or entry[0] != revision:
+            # Переводы строк внутри строк JSON экранируются, поэтому отступ
+            # добавляется к каждой строке текста раздела
+            nested = dump_json(self.store[section]).replace("\n", "\n" + " " * JSON_INDENT)
+            entry = (revision, nested)
+            self._texts[section] = entry
+        return entry[1]
+
+    def section_text(self, section):
+        """Возвращает текст JSON раздела (как dump_json(store[section]))"""
+        return self._nested_text(section).replace("\n" + " " * JSON_INDENT, "\n")
+
+    def iter_document(self):
+        """
+        Выдает текст JSON всей конфигурации (как dump_json(store)) фрагментами
+
+        Фрагменты - закэшированные тексты разделов и разделители между ними.
+        Генератор следует исчерпать в потоке tkinter (например, list()), так
+        как он обращается к хранилищу.
+        """
+        store = self.store
+        if not store:
+            self._texts.clear()
+            yield "{}"
+            return
+        if not all(isinstance(section, str) for section in store):
+            # Нестроковые ключи json преобразует особым образом
+            yield from iter_json(store)
+            return
+
+        # Удаляем из кэша разделы, которых больше нет
+        for section in [section for section in self._texts if section not in store]:
+            del self._texts[section]
+
+        indent = " " * JSON_INDENT
+        separator = "{\n"
+        for section in store:
+            yield f"{separator}{indent}{json.dumps(section, ensure_ascii=False)}: "
+            yield self._nested_text(section)
+            separator = ",\n"
+        yield "\n}"
+
+    def document(self):
+        """Возвращает текст JSON всей конфигурации одной строкой"""
+        return "".join(self.iter_document())
+
+
+# Кэш текста разделов глобальной конфигурации
+config_texts = SectionTextCache(memory_config)
@@ -1,14 +1,25 @@
+import copy
 import json
 import os
 from tkinter import filedialog
 from utils.memory_storage import memory_config
+from utils.atomic_file import write_atomic, backup_path
+from utils.config_serializer import config_texts, dump_json
+from utils.config_manager import CONFIG_PATH, CONFIG_BACKUPS, apply_loaded_config
+from utils.config_import import read_config_file
 
 # Директория для хранения конфигураций
 CONFIG_DIR = "configs"
 SECTIONS_DIR = "sections"
 
-# Путь к основному файлу шаблона
-TEMPLATE_CONFIG = "config.json"
+# Путь к основному файлу шаблона (сам config.json рядом с пакетом, а не в текущем каталоге)
+TEMPLATE_CONFIG = CONFIG_PATH
+
+# Ошибки, найденные при загрузке config.json (показываются пользователю после запуска)
+config_problems = []
+
+# Разобранный шаблон и отметка файла, из которого он прочитан ((mtime, размер) или None)
+_template_cache = {"stamp": None, "data": {}}
 
 def ensure_dirs():
     """Проверяет и создаёт необходимые директории, если они не существуют"""
@@ -16,36 +27,145 @@ def ensure_dirs():
         if not os.path.exists(directory):
             os.makedirs(directory)
 
+def _file_stamp(stat):
+    """Возвращает отметку файла для кэша шаблона"""
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _remember_template(stat, data):
+    """
+    Помещает в кэш шаблона конфигурацию, уже прочитанную из TEMPLATE_CONFIG
+    
+    Args:
+        stat: Результат os.stat файла, полученный до его чтения
+        data: Разобранный файл (копируется: конфигурация в памяти изменяется)
+    """
+    _template_cache["stamp"] = _file_stamp(stat)
+    _template_cache["data"] = copy.deepcopy(data)
+
 def load_template():
-    """Загружает шаблон конфигурации из файла"""
-    if (os.path.exists(TEMPLATE_CONFIG)):
-        try:
-            with open(TEMPLATE_CONFIG, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except json.JSONDecodeError:
-            print(f"Ошибка при чтении файла шаблона {TEMPLATE_CONFIG}")
-            return {}
-    else:
+    """
+    Загружает шаблон конфигурации из файла
+    
+    Файл разбирается заново, только если изменились его время изменения
+    или размер. Возвращаемый словарь общий для всех вызовов - его нельзя
+    изменять (значения следует копировать через copy.deepcopy).
+    """
+    try:
+        stat = os.stat(TEMPLATE_CONFIG)
+    except OSError:
         print(f"Файл шаблона {TEMPLATE_CONFIG} не найден")
         return {}
+    
+    stamp = _file_stamp(stat)
+    if _template_cache["stamp"] != stamp:
+        try:
+            # utf-8-sig, как при загрузке config.json (файл может начинаться с BOM)
+            with open(TEMPLATE_CONFIG, 'r', encoding='utf-8-sig') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            print(f"Ошибка при чтении файла шаблона {TEMPLATE_CONFIG}")
+            data = {}
+        _template_cache["stamp"] = stamp
+        _template_cache["data"] = data
+    return _template_cache["data"]
+
+def merge_missing(data, defaults):
+    """
+    Дополняет значение недостающими ключами значений по умолчанию (рекурсивно)
+    
+    Args:
+        data: Текущее значение
+        defaults: Значение по умолчанию
+    
+    Returns:
+        data, если добавлять нечего; иначе новый словарь с добавленными копиями
+        значений по умолчанию (data не изменяется)
+    """
+    if not isinstance(data, dict) or not isinstance(defaults, dict):
+        return data
+    
+    merged = data
+    for key, default in defaults.items():
+        if key in data:
+            value = merge_missing(data[key], default)
+            if value is data[key]:
+                continue
+        else:
+            value = copy.deepcopy(default)
+        if merged is data:
+            merged = dict(data)
+        merged[key] = value
+    return merged
+
+def apply_template_defaults():
+    """
+    Дополняет конфигурацию в памяти недостающими разделами и ключами шаблона
+    
+    Выполняется один раз при запуске, поэтому поиск разделов и
+    предпросмотр JSON затем работают только с памятью.
+    """
+    template = load_template()
+    for section_name, defaults in template.items():
+        if section_name not in memory_config:
+            memory_config[section_name] = copy.deepcopy(defaults)
+            continue
+        
+        section = memory_config[section_name]
+        if not isinstance(section, dict) or not isinstance(defaults, dict):
+            continue
+        # Значения записываются по ключам, чтобы хранилище отметило измененные ключи
+        for key, default in defaults.items():
+            value = merge_missing(section[key], default) if key in section else copy.deepcopy(default)
+            if key not in section or value is not section[key]:
+                memory_config.set_value(section_name, key, value)
 
 def initialize_config():
-    """Инициализирует конфигурацию из шаблона"""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
+    """
+    Загружает config.json в память один раз при запуске приложения
+    
+    Разделы с ошибкой структуры загружаются как есть, а ошибки добавляются
+    в config_problems. Если файла нет или он не разбирается как JSON,
+    создается конфигурация по умолчанию (поврежденный файл сохраняется
+    в резервную копию, что также отмечается в config_problems).
+    
+    Returns:
+        Загруженная конфигурация
+    """
+    config_problems.clear()
     
     # Проверяем наличие файла конфигурации
-    if not os.path.exists(config_path):
-        create_default_config(config_path)
-    else:
-        # Если файл существует, загружаем его в memory_config
+    if os.path.exists(CONFIG_PATH):
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config_data = json.load(file)
-                for section, data in config_data.items():
-                    memory_config[section] = data
+            # Отметка снимается до чтения: если файл изменится позже, шаблон перечитается
+            stat = os.stat(CONFIG_PATH)
+            # Строгая проверка разделов - только при импорте: при запуске
+            # файл пользователя не заменяется из-за ошибки в одной записи
+            config_data = read_config_file(
+                CONFIG_PATH,
+                on_invalid=lambda name, error: config_problems.append(str(error))
+            )
+            apply_loaded_config(config_data)
+            if TEMPLATE_CONFIG == CONFIG_PATH:
+                # Шаблон - этот же файл: второй раз он не читается
+                _remember_template(stat, config_data)
         except Exception as e:
             print(f"Ошибка при загрузке config.json: {e}")
-            create_default_config(config_path)
+            config_problems.append(
+                f"Не удалось прочитать config.json ({e}). Создана конфигурация по умолчанию, "
+                f"прежний файл сохранен в {os.path.basename(backup_path(CONFIG_PATH, 1))}"
+            )
+            config_data = None
+    else:
+        config_data = None
+    
+    if config_data is None:
+        config_data = create_default_config(CONFIG_PATH)
+        if TEMPLATE_CONFIG == CONFIG_PATH:
+            _remember_template(os.stat(CONFIG_PATH), config_data)
+    
+    # Недостающие значения шаблона добавляются один раз, а не при каждом обращении
+    apply_template_defaults()
+    return config_data
 
 def create_default_config(config_path):
     """Создаёт файл конфигурации с настройками по умолчанию"""
@@ -129,15 +249,14 @@ def create_default_config(config_path):
         "Notifications": {}
     }
     
-    # Записываем конфигурацию в файл
-    with open(config_path, 'w', encoding='utf-8') as file:
-        json.dump(default_config, file, indent=4, ensure_ascii=False)
+    # Записываем конфигурацию в файл (прежний файл, если он был, уходит в резервную копию)
+    write_atomic(config_path, dump_json(default_config), backups=CONFIG_BACKUPS)
         
-    # Также заполняем memory_config
-    for section, data in default_config.items():
-        memory_config[section] = data
+    # Также заполняем memory_config (совпадает с только что записанным файлом)
+    apply_loaded_config(default_config)
         
     print(f"Created default configuration file at {config_path}")
+    return default_config
 
 def get_section_path(section_name):
     """Возвращает путь к файлу секции"""
@@ -151,15 +270,15 @@ def load_config(section_name):
     if section_name in memory_config:
         return memory_config[section_name]
     
-    # Если раздела нет в памяти, пытаемся загрузить из шаблона
+    # Если раздела нет в памяти (например, удален после запуска), берем его из шаблона
     template = load_template()
     if section_name in template:
-        memory_config[section_name] = template[section_name].copy()
+        memory_config[section_name] = copy.deepcopy(template[section_name])
         return memory_config[section_name]
     
-    # Если и в шаблоне нет, возвращаем пустой словарь
+    # Если и в шаблоне нет, создаем пустой раздел
     memory_config[section_name] = {}
-    return {}
+    return memory_config[section_name]
 
 def update_memory_config(section_name, config_data):
     """Обновляет конфигурацию в оперативной памяти"""
@@ -169,12 +288,7 @@ def update_memory_config(section_name, config_data):
 
 def get_full_config():
     """Возвращает полную конфигурацию из памяти"""
-    # Загружаем все секции из шаблона, которые могут быть не в памяти
-    template = load_template()
-    for section_name, section_data in template.items():
-        if section_name not in memory_config:
-            memory_config[section_name] = section_data.copy()
-            
+    # Разделы шаблона добавлены при запуске (apply_template_defaults), файл не читается
     return memory_config
 
 def save_config_to_file():
@@ -193,8 +307,8 @@ def save_config_to_file():
         # Получаем полную конфигурацию
         full_config = get_full_config()
         
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(full_config, file, indent=4, ensure_ascii=False)
+        # Текст записывается по разделам из кэша (full_config - это memory_config)
+        write_atomic(file_path, config_texts.iter_document())
         print(f"Конфигурация экспортирована в: {file_path}")
         return True
     except Exception as e:
@@ -225,7 +339,3 @@ def load_config_from_file():
     except Exception as e:
         print(f"Ошибка при импорте конфигурации: {e}")
         return False
-
-# Инициализация системы при импорте модуля
-ensure_dirs()
-initialize_config()
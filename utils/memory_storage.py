@@ -1,7 +1,213 @@
 """Модуль для хранения конфигурации в оперативной памяти"""
+from contextlib import nullcontext
+from utils.config_journal import MISSING
 
-# Глобальный словарь для хранения конфигурации
-memory_config = {}
+
+class ConfigStore(dict):
+    """
+    Конфигурация в памяти с отслеживанием изменений
+
+    Остается обычным словарем разделов (поддерживает get, [], in, json.dump),
+    но запоминает измененные разделы и ключи и сообщает об изменениях
+    подписчикам. Подписчик вызывается как callback(section, key):
+    section=None - заменена вся конфигурация, key=None - заменен весь раздел.
+
+    Изменения внутри раздела (memory_config["Kits"][kit_id] = ...) словарь
+    увидеть не может, поэтому их следует выполнять через set_value()/delete_value()
+    или сообщать о них через mark_dirty() (такие правки не попадают в журнал отмены).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dirty = {}
+        self._revisions = {}
+        self._subscribers = []
+        # Журнал отмены (ConfigJournal), подключается главным окном
+        self.journal = None
+
+    def _record(self, path, old, new):
+        """Передает правку журналу отмены (до изменения значения)"""
+        if self.journal is not None:
+            self.journal.record(path, old, new)
+
+    def transaction(self):
+        """Объединяет правки внутри блока with в одну операцию журнала отмены"""
+        if self.journal is None:
+            return nullcontext()
+        return self.journal.group()
+
+    # Подписка на изменения
+
+    def subscribe(self, callback):
+        """
+        Подписывает обработчик на изменения
+
+        Args:
+            callback: Функция (section, key)
+
+        Returns:
+            Переданный обработчик (для последующей отписки)
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Отписывает обработчик от изменений"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _publish(self, section, key):
+        for callback in list(self._subscribers):
+            try:
+                callback(section, key)
+            except Exception as e:
+                print(f"Ошибка в обработчике изменения конфигурации: {e}")
+
+    # Отслеживание изменений
+
+    def mark_dirty(self, section, key=None):
+        """
+        Отмечает раздел (или ключ раздела) измененным и оповещает подписчиков
+
+        Args:
+            section: Имя раздела
+            key: Ключ внутри раздела (None - изменен весь раздел)
+        """
+        self._revisions[section] = self._revisions.get(section, 0) + 1
+        if key is None:
+            self._dirty[section] = None
+        else:
+            keys = self._dirty.setdefault(section, set())
+            if keys is not None:
+                keys.add(key)
+        self._publish(section, key)
+
+    def is_dirty(self, section=None):
+        """Проверяет, есть ли несохраненные изменения (во всей конфигурации или в разделе)"""
+        if section is None:
+            return bool(self._dirty)
+        return section in self._dirty
+
+    def dirty_sections(self):
+        """Возвращает имена измененных разделов"""
+        return set(self._dirty)
+
+    def dirty_keys(self, section):
+        """
+        Возвращает измененные ключи раздела
+
+        Returns:
+            Множество ключей; None, если изменен весь раздел; пустое множество,
+            если раздел не изменялся
+        """
+        keys = self._dirty.get(section, set())
+        return None if keys is None else set(keys)
+
+    def mark_clean(self, section=None):
+        """Сбрасывает отметки изменений (например, после сохранения)"""
+        if section is None:
+            self._dirty.clear()
+        else:
+            self._dirty.pop(section, None)
+
+    def revision(self, section):
+        """Возвращает номер версии раздела; увеличивается при каждом изменении"""
+        return self._revisions.get(section, 0)
+
+    def snapshot_revisions(self):
+        """Возвращает копию номеров версий всех разделов (для последующего mark_saved)"""
+        return dict(self._revisions)
+
+    def mark_saved(self, revisions):
+        """
+        Сбрасывает отметки изменений разделов, сохраненных в снимке revisions
+
+        Разделы, измененные после снимка (например, во время фоновой записи),
+        остаются отмеченными.
+
+        Args:
+            revisions: Результат snapshot_revisions() на момент сохранения
+        """
+        for section in list(self._dirty):
+            if self._revisions.get(section, 0) == revisions.get(section, 0):
+                del self._dirty[section]
+
+    # Изменение значений внутри раздела
+
+    def set_value(self, section, key, value):
+        """Устанавливает значение ключа раздела (раздел создается при необходимости)"""
+        if section not in self:
+            # Новый раздел отмечается измененным целиком
+            self[section] = {key: value}
+            return
+        data = dict.__getitem__(self, section)
+        self._record((section, key), data.get(key, MISSING), value)
+        data[key] = value
+        self.mark_dirty(section, key)
+
+    def delete_value(self, section, key):
+        """Удаляет ключ раздела, если он есть"""
+        data = self.get(section)
+        if isinstance(data, dict) and key in data:
+            self._record((section, key), data[key], MISSING)
+            del data[key]
+            self.mark_dirty(section, key)
+
+    def replace_all(self, config_data):
+        """Заменяет всю конфигурацию (загрузка, импорт) с одним оповещением"""
+        self._record((), dict(self), config_data)
+        dict.clear(self)
+        dict.update(self, config_data)
+        for section in self:
+            self._revisions[section] = self._revisions.get(section, 0) + 1
+            self._dirty[section] = None
+        self._publish(None, None)
+
+    # Операции словаря, изменяющие разделы
+
+    def __setitem__(self, section, data):
+        self._record((section,), self.get(section, MISSING), data)
+        super().__setitem__(section, data)
+        self.mark_dirty(section)
+
+    def __delitem__(self, section):
+        self._record((section,), self[section], MISSING)
+        super().__delitem__(section)
+        self.mark_dirty(section)
+
+    def setdefault(self, section, default=None):
+        if section not in self:
+            self[section] = default
+        return dict.__getitem__(self, section)
+
+    def pop(self, section, *default):
+        if section not in self:
+            return super().pop(section, *default)
+        data = self[section]
+        del self[section]
+        return data
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        section = next(reversed(self))
+        return section, self.pop(section)
+
+    def update(self, *args, **kwargs):
+        for section, data in dict(*args, **kwargs).items():
+            self[section] = data
+
+    def clear(self):
+        self._record((), dict(self), {})
+        for section in self:
+            self._revisions[section] = self._revisions.get(section, 0) + 1
+            self._dirty[section] = None
+        super().clear()
+        self._publish(None, None)
+
+
+# Глобальное хранилище конфигурации
+memory_config = ConfigStore()
 
 def get_section(section_name):
     """Возвращает данные раздела из памяти"""
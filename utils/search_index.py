@@ -0,0 +1,347 @@
+"""Модуль поисковых индексов для окон выбора предметов и существ"""
+import heapq
+import re
+
+# Длина n-грамм индекса; более короткие запросы ищутся по n-граммам своей длины
+NGRAM_SIZE = 3
+
+# Поля записей, по которым ведется ранжированный поиск, и их веса
+SEARCH_FIELDS = (
+    ("name", 1.0),
+    ("class_name", 0.8),
+    ("entity_id", 0.8),
+    ("blueprint", 0.6),
+    ("mod_name", 0.5),
+)
+
+# Вес ключа записи (например, Genesis:_Part_1_X_Sabertooth)
+KEY_WEIGHT = 0.9
+
+# Веса типов совпадения слова запроса со словом записи
+MATCH_EXACT = 1.0
+MATCH_PREFIX = 0.75
+MATCH_FUZZY = 0.5
+MATCH_INFIX = 0.4
+
+# Минимальная длина слова, для которого допускается опечатка (одна правка)
+MIN_FUZZY_LENGTH = 4
+
+# Бонусы: запрос - подстрока ключа; имя записи начинается с запроса
+SUBSTRING_BONUS = 0.5
+NAME_PREFIX_BONUS = 0.5
+
+# Количество результатов ранжированного поиска по умолчанию
+DEFAULT_LIMIT = 200
+
+WORD_PATTERN = re.compile(r"[A-Za-z0-9]+")
+CAMEL_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def iter_bits(bits):
+    """Возвращает позиции установленных битов числа в порядке возрастания"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class SubstringIndex:
+    """
+    Инвертированный индекс n-грамм по ключам записей
+
+    Ключи хранятся отсортированными, а множества позиций - битовыми масками,
+    поэтому запрос сводится к пересечению масок, а результат уже отсортирован.
+    """
+
+    def __init__(self, records):
+        """
+        Строит индекс
+
+        Args:
+            records: Словарь записей (ключ - имя записи)
+        """
+        self.keys = sorted(records)
+        self.lowered = [key.lower() for key in self.keys]
+        self.all_bits = (1 << len(self.keys)) - 1
+        self.ngrams = {}
+
+        for position, text in enumerate(self.lowered):
+            bit = 1 << position
+            grams = set()
+            for size in range(1, NGRAM_SIZE + 1):
+                for start in range(len(text) - size + 1):
+                    grams.add(text[start:start + size])
+            for gram in grams:
+                self.ngrams[gram] = self.ngrams.get(gram, 0) | bit
+
+    def __len__(self):
+        return len(self.keys)
+
+    def match_bits(self, query, within=None):
+        """
+        Возвращает битовую маску позиций ключей, содержащих запрос
+
+        Args:
+            query: Строка поиска (регистр не учитывается)
+            within: Маска позиций, которыми ограничивается поиск (например,
+                результат для подстроки запроса)
+        """
+        query = query.lower()
+        bits = self.all_bits if within is None else within
+        if not query:
+            return bits
+        if len(query) <= NGRAM_SIZE:
+            # Для коротких запросов n-грамма совпадает с самим запросом
+            return self.ngrams.get(query, 0) & bits
+
+        for start in range(len(query) - NGRAM_SIZE + 1):
+            bits &= self.ngrams.get(query[start:start + NGRAM_SIZE], 0)
+            if not bits:
+                return 0
+
+        # Наличие всех n-грамм не гарантирует подстроку - проверяем кандидатов
+        lowered = self.lowered
+        result = 0
+        for position in iter_bits(bits):
+            if query in lowered[position]:
+                result |= 1 << position
+        return result
+
+    def search(self, query):
+        """
+        Возвращает отсортированный список ключей, содержащих запрос
+
+        Args:
+            query: Строка поиска (пустая строка возвращает все ключи)
+        """
+        if not query:
+            return list(self.keys)
+        keys = self.keys
+        return [keys[position] for position in iter_bits(self.match_bits(query))]
+
+
+def tokenize(text):
+    """
+    Разбивает текст на слова в нижнем регистре
+
+    Помимо целых слов добавляет части CamelCase (PrimalItemSkin -> primal, item, skin).
+    """
+    tokens = set()
+    for word in WORD_PATTERN.findall(text):
+        tokens.add(word.lower())
+        parts = CAMEL_PATTERN.findall(word)
+        if len(parts) > 1:
+            tokens.update(part.lower() for part in parts)
+    return tokens
+
+
+def query_tokens(query):
+    """Возвращает слова запроса в нижнем регистре без повторов, в исходном порядке"""
+    return list(dict.fromkeys(word.lower() for word in WORD_PATTERN.findall(query)))
+
+
+def deletions(word):
+    """Возвращает варианты слова с одним удаленным символом"""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def within_one_edit(first, second):
+    """Проверяет, что слова отличаются не более чем на одну правку (включая перестановку соседних букв)"""
+    if first == second:
+        return True
+    length_first, length_second = len(first), len(second)
+    if abs(length_first - length_second) > 1:
+        return False
+
+    if length_first == length_second:
+        diffs = [i for i in range(length_first) if first[i] != second[i]]
+        if len(diffs) == 1:
+            return True
+        return (
+            len(diffs) == 2
+            and diffs[1] == diffs[0] + 1
+            and first[diffs[0]] == second[diffs[1]]
+            and first[diffs[1]] == second[diffs[0]]
+        )
+
+    shorter, longer = (first, second) if length_first < length_second else (second, first)
+    for i in range(len(shorter)):
+        if shorter[i] != longer[i]:
+            return shorter[i:] == longer[i + 1:]
+    return True
+
+
+class RankedIndex:
+    """
+    Ранжированный поиск по имени, ключу, class_name, entity_id, пути Blueprint и моду
+
+    Каждое слово запроса должно совпасть со словом записи точно, по началу слова,
+    внутри слова или с одной опечаткой. Результаты упорядочены по релевантности.
+    """
+
+    def __init__(self, records, substring_index=None):
+        """
+        Строит индекс
+
+        Args:
+            records: Словарь записей (ключ - имя записи)
+            substring_index: Готовый SubstringIndex по тем же записям
+        """
+        self.substring_index = substring_index or SubstringIndex(records)
+        self.keys = self.substring_index.keys
+        self.names = []
+        self.postings = {}
+
+        for position, key in enumerate(self.keys):
+            record = records[key]
+            fields = [(key, KEY_WEIGHT)]
+            fields.extend((record.get(field), weight) for field, weight in SEARCH_FIELDS)
+            for text, weight in fields:
+                if not text or not isinstance(text, str):
+                    continue
+                for token in tokenize(text):
+                    posting = self.postings.setdefault(token, {})
+                    if posting.get(position, 0) < weight:
+                        posting[position] = weight
+            name = record.get("name")
+            self.names.append((name if isinstance(name, str) else key).lower())
+
+        self.vocabulary = sorted(self.postings)
+        # Словарь удалений (SymSpell) для поиска слов на расстоянии одной правки
+        self.deletion_map = {}
+        for token in self.vocabulary:
+            if len(token) >= MIN_FUZZY_LENGTH - 1:
+                for variant in deletions(token):
+                    self.deletion_map.setdefault(variant, []).append(token)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def word_scores(self, word, previous_words=None):
+        """
+        Оценивает записи по одному слову запроса
+
+        Args:
+            word: Слово запроса в нижнем регистре
+            previous_words: Слова предыдущего запроса (см. SearchResult.words)
+
+        Returns:
+            Кортеж (слова словаря, содержащие word; словарь позиция -> оценка)
+        """
+        previous_words = previous_words or {}
+        if word in previous_words:
+            return previous_words[word]
+
+        # Слова словаря, содержащие word, содержат и любую его подстроку, поэтому
+        # если в прошлом запросе была подстрока слова, просматриваем только ее совпадения
+        pool = self.vocabulary
+        for previous_word, (containing, _) in previous_words.items():
+            if previous_word in word and len(containing) < len(pool):
+                pool = containing
+        containing = [token for token in pool if word in token]
+
+        matches = {}
+        for token in containing:
+            if token == word:
+                matches[token] = MATCH_EXACT
+            elif token.startswith(word):
+                matches[token] = MATCH_PREFIX
+            elif len(word) >= NGRAM_SIZE:
+                matches[token] = MATCH_INFIX
+
+        if len(word) >= MIN_FUZZY_LENGTH:
+            candidates = set(self.deletion_map.get(word, ()))
+            for variant in deletions(word):
+                if variant in self.postings:
+                    candidates.add(variant)
+                candidates.update(self.deletion_map.get(variant, ()))
+            for token in candidates:
+                if token not in matches and within_one_edit(word, token):
+                    matches[token] = MATCH_FUZZY
+
+        best = {}
+        for token, match_weight in matches.items():
+            for position, field_weight in self.postings[token].items():
+                score = match_weight * field_weight
+                if score > best.get(position, 0):
+                    best[position] = score
+        return containing, best
+
+    def query(self, query, previous=None, limit=DEFAULT_LIMIT):
+        """
+        Выполняет ранжированный поиск
+
+        Если передан результат предыдущего запроса, оценки его слов используются
+        повторно, а новые слова ищутся только среди совпадений своих подстрок,
+        поэтому при наборе запроса по буквам каждый шаг сужает предыдущий.
+
+        Args:
+            query: Строка поиска (пустая строка возвращает все ключи по алфавиту)
+            previous: SearchResult предыдущего запроса к этому индексу
+            limit: Максимальное количество результатов (None - без ограничения)
+
+        Returns:
+            Экземпляр SearchResult
+        """
+        if previous is not None and previous.source is not self:
+            previous = None
+        text = query.strip().lower()
+        if not text:
+            return SearchResult(self, text, list(self.keys), {}, self.substring_index.all_bits)
+
+        previous_words = previous.words if previous is not None else None
+        words = {}
+        scores = None
+        for word in query_tokens(text):
+            containing, best = self.word_scores(word, previous_words)
+            words[word] = (containing, best)
+            if scores is None:
+                scores = dict(best)
+            else:
+                scores = {position: score + best[position] for position, score in scores.items() if position in best}
+        scores = scores or {}
+
+        # Совпадения по подстроке ключа всегда попадают в результат
+        within = previous.substring_bits if previous is not None and previous.text in text else None
+        substring_bits = self.substring_index.match_bits(text, within)
+        for position in iter_bits(substring_bits):
+            scores[position] = scores.get(position, 0) + SUBSTRING_BONUS
+
+        names = self.names
+        for position in scores:
+            if names[position].startswith(text):
+                scores[position] += NAME_PREFIX_BONUS
+
+        keys = self.keys
+        ranking = ((-score, keys[position], position) for position, score in scores.items())
+        if limit is None:
+            ranked = sorted(ranking)
+        else:
+            ranked = heapq.nsmallest(limit, ranking)
+        return SearchResult(self, text, [keys[position] for _, _, position in ranked], words, substring_bits)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """
+        Возвращает ключи записей, наиболее подходящих под запрос
+
+        Args:
+            query: Строка поиска (пустая строка возвращает все ключи по алфавиту)
+            limit: Максимальное количество результатов (None - без ограничения)
+
+        Returns:
+            Список ключей, отсортированный по убыванию релевантности, затем по имени
+        """
+        return self.query(query, limit=limit).keys
+
+
+class SearchResult:
+    """Результат ранжированного поиска и данные для сужения следующего запроса"""
+
+    __slots__ = ("source", "text", "keys", "words", "substring_bits")
+
+    def __init__(self, source, text, keys, words, substring_bits):
+        self.source = source
+        self.text = text
+        self.keys = keys
+        self.words = words
+        self.substring_bits = substring_bits
@@ -0,0 +1,36 @@
+"""Замер этапов запуска приложения"""
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Измеряет длительность этапов запуска и печатает итоговый отчет"""
+
+    def __init__(self, started=None):
+        """
+        Инициализирует замер
+
+        Args:
+            started: Момент начала запуска (time.perf_counter()); по умолчанию - сейчас
+        """
+        self.started = time.perf_counter() if started is None else started
+        self.phases = []
+
+    def mark(self, name, since):
+        """Добавляет этап, начавшийся в момент since и завершившийся сейчас"""
+        self.phases.append((name, time.perf_counter() - since))
+
+    @contextmanager
+    def phase(self, name):
+        """Измеряет длительность блока with как этап запуска"""
+        since = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mark(name, since)
+
+    def report(self):
+        """Возвращает текст отчета: длительность этапов и общее время запуска (мс)"""
+        parts = [f"{name} {round(duration * 1000)} мс" for name, duration in self.phases]
+        total = round((time.perf_counter() - self.started) * 1000)
+        return f"Запуск: {', '.join(parts)}; всего {total} мс"